@@ -347,6 +347,15 @@ import time             # CosmicIServer.run()               time.sleep()
 import sys              # main()                            sys.stdout, .stderr, etc.
 import threading        # main()                            threading.active_count(), etc.
 
+    # Every node holds a main-server connection (and its receiver and
+    # sender threads) open for the whole run, so give threads a smaller
+    # stack than the platform default.  threading.stack_size() is global
+    # to the process, so we set it here, once, before any of our threads
+    # exist; 512 KiB leaves plenty of headroom for the Tk GUI thread.
+
+if __name__ == "__main__":
+    threading.stack_size(512*1024)
+
 
         #================================================
 	#   Imports of custom modules.
@@ -602,6 +611,7 @@ class CosmicIServer():
             # server connection would be.
 
         mainserver.cosmicIServer = inst     # Install us in mainserver module
+        mainserver._bind_command_dispatch() # and point its Command_MsgHndlr at our commandHandler.
         inst.consoleConn.addMsgHandler(mainserver.Command_MsgHndlr())
 
             # Before we start actually allowing nodes of the sensor network
@@ -1093,6 +1103,11 @@ def main():     # Main routine of module.
         
         time.sleep(2)    # Pause so user has a chance to follow what's happening...
 
+            # Finish writing out the individual nodes' log files, and
+            # stop the thread that writes them.
+
+        model.stopNodeLogging()
+
             # Check for zombie threads; warn user if any.
 
         if threading.active_count() > 1:
@@ -33,6 +33,8 @@
                             #   Used in:                     Names used:
                             #   ------------------------    --------------------
 import time                 #   BridgeMsgHandler.handle()   time()
+import socket               #   BrdgSrvReqHandler.setup()   IPPROTO_TCP, TCP_NODELAY
+import threading            #   BridgeServer.__init__()     Lock
 
     # Custom modules.
 
@@ -40,6 +42,7 @@ import time                 #   BridgeMsgHandler.handle()   time()
                             #   ------------------------    --------------------
 import logmaster            #   (module level)              getLogger(), appName
 import communicator         #   (module level)              BaseMessageHandler, ...
+import worklist             #   BridgeServer.send()         WorkerExiting
 import tikiterm             #   BridgeMsgHandler.handle()   Cyan, Green
 import timestamp            #   BridgeMsgHandler.handle()   CoarseTimeStamp()
 import sitedefs             #   BridgeServer.__init__()     MY_IP
@@ -257,6 +260,19 @@ class BridgeConnHandler(communicator.BaseConnectionHandler):
     # quite a bit of refactoring; I'm not yet sure it is warranted.
 
 class BrdgSrvReqHandler(communicator.LineCommReqHandler):
+
+        # Command lines we send back to the Wi-Fi board over a bridge
+        # are short, and the board only checks for them every so often
+        # (every 100 ms, on AUXIO), so don't let Nagle's algorithm hold
+        # one back waiting for the ACK of the previous one as well.
+        
+    def setup(inst):
+        try:
+            inst.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.warn("BrdgSrvReqHandler.setup(): Couldn't set TCP_NODELAY on bridge socket: %s", e)
+        communicator.LineCommReqHandler.setup(inst)
+
         # What to do on the way out of the request-handling loop
         # (e.g. after the socket stops working).
     def finish(inst):
@@ -295,6 +311,10 @@ class BridgeServer(communicator.LineCommunicator):
     #   .name - ASCII name of this particular bridge server.
     #   .nodeID - What node ID number is this BridgeServer listening to.
     #   .port - What port number is this BridgeServer listening on.
+    #   ._outbuf - Lines given to .send() that haven't gone out yet.
+    #   ._flushConn - The connection whose sender thread has been handed
+    #       a ._flush() of ._outbuf, or None if there isn't one pending.
+    #   ._outlock - Guards ._outbuf and ._flushConn.
     #
     # This extra attribute is tacked onto us after creation by the model
     # node object that created us:
@@ -326,6 +346,10 @@ class BridgeServer(communicator.LineCommunicator):
         self.name = name
         self.nodeID = nodeID
 
+        self._outbuf = []
+        self._flushConn = None
+        self._outlock = threading.Lock()
+
             # Calculate port number for listening for bridge connections
             # from this node.  Use the base port number for this type of
             # bridge, plus the node ID number as an offset.
@@ -372,19 +396,71 @@ class BridgeServer(communicator.LineCommunicator):
         #       managed by this bridge server.  Does nothing if
         #       no clients have connected yet.
         #
+        #       This works like mainserver's _LineBatcher:  the first
+        #       line sent while we're idle goes out as soon as the
+        #       connection's sender thread gets to it, and lines that
+        #       pile up before then (e.g., a burst of commands to the
+        #       Wi-Fi script) are joined and written out together, up
+        #       to maxBatch at a time, so they share one socket write.
+        #
         #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+    maxBatch = 64   # Most lines we'll join into one write.
         
     def send(self, string:str):
 
-            # We should probably check here to make sure that the client
-            # is connected, and give a warning if not.
+        if logger.isEnabledFor(logmaster.logging.DEBUG):
+            logger.debug("Bridge server %s is sending message [%s] to all active clients...",
+                         self.name, string.strip())
 
-        logger.debug("Bridge server %s is sending message [%s] to all active clients..." % (self.name, string.strip()))
+        if string[-1:] not in ('\r', '\n'):   # Each line needs its own terminator once joined.
+            string += '\n'
 
-            # Create a message object that the underlying Communicator can understand.
+        with self._outlock:
+            self._outbuf.append(string)
+            conn = self._flushConn
+            if conn is not None and conn.is_alive():
+                return                          # A flush is on its way already; it'll take this line.
 
-        msg = communicator.Message(string)
+                # Hand the flush to our newest client's sender thread.  (If there
+                # are no clients, there's nobody to send to, as before.)
 
-            # Tell the Communicator to send it to all its clients (there should be only 1 though).
+            with self._wlock:
+                conn = self.conns[0] if self.conns else None
+            if conn is None:
+                del self._outbuf[:]
+                self._flushConn = None
+                return
+            self._flushConn = conn
 
-        self.sendAll(msg)
+        try:
+            conn.do(self._flush)
+        except worklist.WorkerExiting:          # Connection is going away; drop what we had.
+            with self._outlock:
+                del self._outbuf[:]
+                self._flushConn = None
+
+        # Runs in the sender thread of the connection in ._flushConn.
+
+    def _flush(self):
+        with self._outlock:
+            pending = self._outbuf[:self.maxBatch]
+            del self._outbuf[:self.maxBatch]
+            conn = self._flushConn if self._outbuf else None
+            if conn is None:
+                self._flushConn = None
+
+            # Create a message object that the underlying Communicator can understand,
+            # and tell the Communicator to send it to all its clients (there should be
+            # only 1 though).
+
+        if pending:
+            self.sendAll(communicator.Message(''.join(pending)))
+
+        if conn is not None:                    # More lines came in meanwhile?
+            try:
+                conn.do(self._flush)                # Then do another round after this.
+            except worklist.WorkerExiting:
+                with self._outlock:
+                    del self._outbuf[:]
+                    self._flushConn = None
@@ -16,7 +16,8 @@
 import logmaster        # (module level)            getLogger(), WarningException
 import worklist         # (module level)            Worker
 import communicator     # Command.__init__()        Message()
-import threading        # CommandHandler.process()  current_thread()
+import threading        # CommandHandler.process()  current_thread(), Lock, Timer
+import collections      # CommandHandler.__init__() deque
 import timestamp	# ?			    ?
 
     #===================================================================
@@ -173,11 +174,30 @@ class Command:
         #               via its UART-BRIDGE connection to the server.
         #               NOTE: We are descoping binary messages for now.
         #
+        #       All commands are deliberately executed by this one
+        #       thread, in the order received.  A node's commands only
+        #       make sense in sequence (e.g., POWERED_ON must be handled
+        #       before anything else the node says), and the handlers
+        #       update the shared sensor-net model and this thread's
+        #       logging context without finer-grained locking, so they
+        #       must not be run concurrently from a thread pool.  Callers
+        #       never wait on this thread: .submit() only appends to a
+        #       deque, and our worklist is unbounded.
+        #
         #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
 class CommandHandler(worklist.Worker):
     defaultRole = 'cmdHndlr'    # Role string of Worker thread.
 
+        # Knobs for batching of messages handed to .submit().  At most
+        # maxBatch messages are processed per trip through the worker's
+        # queue.  If maxDelayMs is nonzero, a batch started while we're
+        # idle is held open that many milliseconds to let more lines
+        # arrive; if zero, it is flushed immediately.
+
+    maxBatch    = 64
+    maxDelayMs  = 0
+
         #----------------------------------------------------------------------
         #   .__init__()                              [special instance method]
         #
@@ -193,10 +213,62 @@ class CommandHandler(worklist.Worker):
         inst.cis = cis = cosmicIServer = cosmiciserver
 
         if role==None: role = inst.defaultRole
+
+        inst._batch         = collections.deque()   # Messages submitted but not yet processed.
+        inst._batchLock     = threading.Lock()      # Guards ._batch and ._batchPending.
+        inst._batchPending  = False                 # Is a drain task already on its way?
         
         worklist.Worker.__init__(inst, *args, role=role, **kwargs)
 
 
+        #----------------------------------------------------------------------
+        #   .submit()                                [public instance method]
+        #
+        #       Like .process(), but meant for high-rate callers such
+        #       as the main server's receiver threads.  Lines that
+        #       arrive while an earlier batch is still waiting to be
+        #       drained are just appended to it, so that the worker
+        #       thread is woken up once per batch, not once per line.
+        #
+        #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+    def submit(this, msg:communicator.Message):
+        with this._batchLock:
+            this._batch.append(msg)
+            if this._batchPending:      # A drain is already queued; it'll pick this up.
+                return
+            this._batchPending = True
+        if this.maxDelayMs:
+            timer = threading.Timer(this.maxDelayMs/1000.0, this, args=(this._drainBatch,))
+            timer.daemon = True
+            timer.start()
+        else:
+            this(this._drainBatch)
+
+        #----------------------------------------------------------------------
+        #   ._drainBatch()                          [private instance method]
+        #
+        #       Runs in the worker thread.  Takes (up to maxBatch of) the
+        #       submitted messages in one go and processes them in order.
+        #
+        #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+    def _drainBatch(this):
+        with this._batchLock:
+            n = min(len(this._batch), this.maxBatch)
+            batch = [this._batch.popleft() for i in range(n)]
+            leftovers = bool(this._batch)
+            if not leftovers:
+                this._batchPending = False
+        if leftovers:                       # Go around again after this batch.
+            this(this._drainBatch)
+        for msg in batch:
+            try:
+                this.process(msg)
+            except Exception:
+                logger.exception("CommandHandler._drainBatch(): Processing message [%s] raised an exception; continuing with the rest of the batch." % str(msg))
+
+
         #----------------------------------------------------------------------
         #   .process()                               [public instance method]
         #
@@ -521,6 +593,18 @@ class CommandHandler(worklist.Worker):
         logger.normal("Heartbeat #%d received from node %d at %s." % (arg_hbnum, arg_nodenum, str(cmd.msg.time)))
     # End CommandHandler.handleHeartbeat()
 
+        # The names that model.py (wifi.BridgeMode) uses for the bridge modes
+        # that bridges.uwi reports by the given names.  Any mode not listed
+        # here is one we don't support.
+
+    _MODEL_BMODE = {
+        'NORMAL':       'DEFAULT',      # bridges.uwi's 'normal' is not nominal for us.
+        'UART-ONLY':    'UART',         # For this mode, model.py uses a shorter name.
+        'NONE':         'NONE',         # These mode names are unchanged.
+        'TREFOIL':      'TREFOIL',
+        'FLYOVER':      'FLYOVER',
+        }
+
     def handleBridgeMode(self, cmd):
 
         if len(cmd.cmdArgs) != 1:
@@ -540,18 +624,11 @@ class CommandHandler(worklist.Worker):
 
             # Inform the model of the Wi-Fi module that its bridge mode has changed.
             # First, we have to translate the bridge mode strings from bridges.uwi
-            # into the codes that model.py deals with.
-
-        if arg_bmstr == 'NORMAL':       # The mode that bridges.uwi calls 'normal',
-            model_bm = 'DEFAULT'        # model.py calls 'default'.  It's not nominal for us.
-        elif arg_bmstr == 'UART-ONLY':  # For this mode,
-            model_bm = 'UART'           # model.py uses a shorter name.
-        elif arg_bmstr in ('NONE', 'TREFOIL', 'FLYOVER'):
-            model_bm = arg_bmstr        # These mode names are unchanged.
-        else:
-            model_bm = 'UNSUPPORTED'    # Some other bridge mode; we don't support it.
+            # into the codes that model.py deals with (one lookup; see above).
+
+        model_bm = self._MODEL_BMODE.get(arg_bmstr, 'UNSUPPORTED')
         
-        cis.sensorNet.nodes[arg_nodenum].wifi_module.bridgeMode_is(arg_bmstr)
+        cis.sensorNet.nodes[arg_nodenum].wifi_module.bridgeMode_is(model_bm)
 
     #<- End def handleBridgeMode()
         
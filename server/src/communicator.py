@@ -302,6 +302,8 @@ __all__ = ['Message',               'BaseMessageHandler', 	# Public classes.
 global DIR_IN, DIR_OUT      # Message directions (string constants).
 DIR_IN  = 'in'                  # Means: This message is coming IN to the server, from a client.
 DIR_OUT = 'out'                 # Means: This message is going OUT to one or more clients, from the server.
+    # Always pass these constants themselves (never equal strings built
+    # some other way), so that handlers may test a direction with "is".
 
 
     #|====================
@@ -369,9 +371,13 @@ class Message:               # Represents a single incoming (or outgoing) messag
     #       .conn   - What connection this message arrived on (if an incoming message).
     #                   Or, what connection is it being sent to (if an outgoing message).
     #       .data   - The raw data contained in this message, as an array of bytes.
-    #       .time   - What time message was received/created (float secs past epoch).
+    #       .time   - What time message was received/created (a CoarseTimeStamp).
     #       .sent   - For outgoing messages, a flag announcing this message has been sent.
     #       .announced - Has this message been announced to the message handlers yet?
+    #                   (A plain bool, only read & set while holding .lock.  A new
+    #                   Message is made for every line received on every connection,
+    #                   and nobody ever waits for this one, so it isn't worth the
+    #                   five Condition objects that a Flag would cost.)
     #-----------------------------------------------------------------------------------
 
         # Construct a message, given its raw data.
@@ -392,7 +398,7 @@ class Message:               # Represents a single incoming (or outgoing) messag
             self.time = timestamp.CoarseTimeStamp(curtime);
             self.sent = flag.Flag()
             self.dir = dir
-            self.announced = flag.Flag()
+            self.announced = False
             if (conn != None): conn._announce(self)
                 #- Announce the existence of this new message to the message handlers for this connection.
 
@@ -457,6 +463,8 @@ class BaseMessageHandler:           # Base class for message handling classes.
 
     defHandlerName = "unnamed"      # The default message-handler name string.
 
+    __slots__ = ('conn', 'name')    # Subclasses that add no attributes of their own may use __slots__ = ().
+
     def __init__(inst, conn:Connection = None, name:str=None):
         inst.conn = conn    # Remember what connection we were created to handle messages on.
 
@@ -543,6 +551,8 @@ class  Connection(Worker):      # Represents an active TCP connection (session)
     #|       .msgHandlers    - The sequence of message handlers registered on
     #|                           this connection.
     #|       .closed         - Flag for announcing when this connection is closed.
+    #|       .node           - The sensor node this connection serves, if known
+    #|                           (None until then).
     #|-----------------------------------------------------------------------------
 
         #|-------------------------------------------------------------------------------------
@@ -595,6 +605,7 @@ class  Connection(Worker):      # Represents an active TCP connection (session)
             self.thread         = thread            # Thread responsible for receiving data on this connection.
             self.msgHandlers    = []                # Set the list of message handlers to the empty list.
             self.closed         = flag.Flag()       # Create the flag for announcing when we're closed.
+            self.node           = None              # Sensor node served by this connection, if known.
 
                 # If this connection has a request handler associated with it,
                 # and that request handler has an associated iostrm, infer that
@@ -607,7 +618,7 @@ class  Connection(Worker):      # Represents an active TCP connection (session)
                 # Initialize our underlying Worker entity with the appropriate
                 # ThreadActor role & component, and our desired thread target method.
 
-            Worker.__init__(self, start=True, role=role, component=component,                          
+            Worker.__init__(self, start=True, role=role, component=component,
                             target = self.work_catcherrs)
                 # \_ Do normal worker initialization for this connection.
                 #       Goes ahead & starts the writer thread.
@@ -818,8 +829,18 @@ class  Connection(Worker):      # Represents an active TCP connection (session)
 
         with msg.lock:
             
-            already = msg.announced.rise()      # Atomically, was it already announced? & mark it announced.
-            if already: return                  # If it was already announced, nothing left to do.
+            if msg.announced: return            # If it was already announced, nothing left to do.
+            msg.announced = True                # Otherwise, mark it announced (atomically, under msg.lock).
+
+                # Every line received on every connection (including all the
+                # bridged UART data) passes through here, so unless someone is
+                # listening at DEBUG level, skip decoding & stripping the line
+                # for the log, and just hand it to the handlers.
+
+            if not logger.isEnabledFor(logmaster.logging.DEBUG):
+                for h in self.msgHandlers[::-1]:    # For each handler in the list (oldest to newest),
+                    h.handle(msg)                       # Tell it to handle the message.
+                return
             
             way = 'incoming' if msg.dir == DIR_IN else 'outgoing'
             if isinstance(msg.data, str):
@@ -1148,6 +1169,7 @@ class Communicator(socketserver.ThreadingTCPServer):    # TCP server with asynch
         #   designated to connect to.  Subclasses may wish to override this.
         
     defaultAddr = None       # Class variable: Default listen address (IP, port) of class instances.
+
         # The above class variables can be overridden in subclasses.
 
         #|------------------------------------------------------------------------------------------
@@ -1673,6 +1695,14 @@ class  StreamLineConnection(LineConnection):
 
 class LineCommReqHandler(socketserver.StreamRequestHandler, CommRequestHandler):
 
+        # Size of the buffer between the socket and the text stream.
+        # The buffered reader only ever asks the socket for whatever has
+        # already arrived, so a large buffer doesn't delay short lines;
+        # it just lets a burst of lines be taken in with one recv() and
+        # then split up by the C-level readline().
+
+    iobufsize = 65536
+
         #-------------------------------------------------------------------------
         #   setup()                                     [public instance method]
         #
@@ -1722,7 +1752,7 @@ class LineCommReqHandler(socketserver.StreamRequestHandler, CommRequestHandler):
 
 #        logger.debug("LineCommReqHandler.setup(): Creating R/W pair of buffered io streams...")
 
-        self.iofile = io.BufferedRWPair(self.rfile, self.wfile)     # This puts
+        self.iofile = io.BufferedRWPair(self.rfile, self.wfile, self.iobufsize)     # This puts
             # together .rfile and .wfile into a single bidirectional binary stream.
 
 #        logger.debug("LineCommReqHandler.setup(): Creating line-buffered text I/O wrapper...")
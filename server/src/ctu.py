@@ -187,29 +187,23 @@ class CTU_Host(model.SensorHost):
     #__/ End def CTU_Host._handlePPSCNTR().
 
 
-    def _handleHostMsg(this, msgWords):
-
-        logger.debug("CTU_Host._handleHostMsg(): Handling host message [%s]..." % str(msgWords))
-
-        msgType = msgWords[0]
+    def _handleMsg(this, msg:communicator.Message):
 
-        if msgType == 'PPSCNTR':
-            this._handlePPSCNTR(msgWords)
-        else:   # Dispatch to parent class.
-            model.SensorHost._handleHostMsg(this, msgWords)
+            # This runs for every line the CTU sends us, so check just once
+            # whether debug output is wanted, and skip building it if not.
 
-    def _handleMsg(this, msg:communicator.Message):
+        debug = logger.isEnabledFor(logmaster.logging.DEBUG)
 
-        logger.debug("CTU_Host._handleMsg: Handling message [%s]..." % msg.data.strip())
+        if debug:
+            logger.debug("CTU_Host._handleMsg: Handling message [%s]...", msg.data.strip())
 
-        msgWords = this._parseMsg(msg)  # Parse the message into fields.
+        (msgType, msgWords) = this._parseMsg(msg)  # Parse the message into fields.
+            #- The first field is interpreted as the message type designator.
 
-        if msgWords == None:
+        if msgWords is None:
             logger.info("CTU_Host._handleMsg: Empty message; ignoring...")
             return
         
-        msgType = msgWords[0]           # Interpret first field as message type designator.
-        
             # Formally, the first two characters of an NMEA message type are the
             # "talker ID" (e.g. "GP" for GPS), and the remaining characters are
             # the message type.  However, our way of categorizing messages is
@@ -227,31 +221,39 @@ class CTU_Host(model.SensorHost):
 
         typeLen = len(msgType)
 
-        logger.debug("CTU_Host._handleMsg: The length of the message type name is %d." % typeLen)
+        if debug: logger.debug("CTU_Host._handleMsg: The length of the message type name is %d.", typeLen)
 
         isFromGPS = False       # Default assumption until we know otherwise.
         
         if typeLen >= 2:
 
-            logger.debug("CTU_Host._handleMsg:  If this is an NMEA message, its talker ID is [%s]." % msgType[0:2])
+            if debug: logger.debug("CTU_Host._handleMsg:  If this is an NMEA message, its talker ID is [%s].", msgType[0:2])
 
             if msgType[0:2] == "GP":
-                logger.debug("CTU_Host._handleMsg:  This is a standard GPS message.")
+                if debug: logger.debug("CTU_Host._handleMsg:  This is a standard GPS message.")
                 isFromGPS = True
                 
             elif typeLen >=4 and msgType[0:4] == "PDME":
-                logger.debug("CTU_Host._handleMsg:  This is a DeLorme custom message.")
+                if debug: logger.debug("CTU_Host._handleMsg:  This is a DeLorme custom message.")
                 isFromGPS = True
 
         if isFromGPS:
-            logger.debug("CTU_Host._handleMsg:  Dispatching to GPS module proxy...")
+            if debug: logger.debug("CTU_Host._handleMsg:  Dispatching to GPS module proxy...")
             this.node.gps_module.sentMessage(msgWords)
 
         else:
-            logger.debug("CTU_Host._handleMsg:  I don't think this message is from the GPS; I'm treating it as a normal host message...")
-            this._handleHostMsg(msgWords)
+            if debug: logger.debug("CTU_Host._handleMsg:  I don't think this message is from the GPS; I'm treating it as a normal host message...")
+            this._handleHostMsg(msgType, msgWords)
 
     #<- End def CTU_Host._handleMsg().
+
+        # Host message dispatch table:  Everything SensorHost handles, plus
+        # our own message types.  Used by SensorHost._handleHostMsg().
+
+    _DISPATCH = dict(model.SensorHost._DISPATCH)
+    _DISPATCH.update({
+        'PPSCNTR':          _handlePPSCNTR,
+        })
             
 #<- End class CTU_Host.
 
@@ -333,42 +333,32 @@ class ShowerDetectorHost(DetectorHost):
     #__/
 
 
-        # Override parent class's definition of this method to add some specific
-        # message types that this subclass knows how to handle.
-
-    def _handleHostMsg(this, msgWords):
-
-        logger.debug("ShowerDetectorHost._handleHostMsg(): Handling host message [%s]..." % str(msgWords))
-
-        msgType = msgWords[0]
-
-            # Look for ShowerDetectorHost (FEDM) specific messages
-            # and dispatch them to the appropriate handler methods.
-
-        if      msgType == 'DAC_LEVELS':            # Reports current voltage-level settings of the on-board threshold D2A converters.
-                                                    # Currently, these are negative decimal numbers (with 3 digits after the decimal 
-            this._handle_DAC_LEVELS(msgWords)       # point) representing the DAC output voltage in volts relative to a +2.5V reference.
-            
-        elif    msgType == 'NC_PULSES':             # Reports number of non-coincidence pulses skipped on each input channel.
-                                                    # (These are pulses that are not within the coincidence time-window of any
-            this._handle_NC_PULSES(msgWords)        # pulses arriving on any of the other channels.)
+        # Host message dispatch table:  Everything SensorHost handles, plus the
+        # specific message types that this subclass knows how to handle.  Used
+        # by SensorHost._handleHostMsg().
+
+    _DISPATCH = dict(model.SensorHost._DISPATCH)
+    _DISPATCH.update({
+        'DAC_LEVELS':   _handle_DAC_LEVELS,     # Reports current voltage-level settings of the on-board threshold D2A converters.
+                                                # Currently, these are negative decimal numbers (with 3 digits after the decimal 
+                                                # point) representing the DAC output voltage in volts relative to a +2.5V reference.
             
-        elif    msgType == 'FIFO_FULL':             # Reports that some pulses may be lost due to a full hardware FIFO on a channel.
-                                                    # This may happen if an intense burst of many pulses arrives on that channel,
-            this._handle_FIFO_FULL(msgWords)        # and pulses arrive more quickly than the ISR can drain the queue.
+        'NC_PULSES':    _handle_NC_PULSES,      # Reports number of non-coincidence pulses skipped on each input channel.
+                                                # (These are pulses that are not within the coincidence time-window of any
+                                                # pulses arriving on any of the other channels.)
             
-        elif    msgType == 'CON_PULSE':             # Reports detailed timestamp & pulse-shape data for a co-incident pulse.
-                                                    # (That is, a pulse arriving within a certain time window of other pulses.)
-            this._handle_CON_PULSE(msgWords)        # NOTE: We need to do something special here to process the last argument...
+        'FIFO_FULL':    _handle_FIFO_FULL,      # Reports that some pulses may be lost due to a full hardware FIFO on a channel.
+                                                # This may happen if an intense burst of many pulses arrives on that channel,
+                                                # and pulses arrive more quickly than the ISR can drain the queue.
             
-        elif    msgType == 'LOST_PULSES':           # Reports that pulses from a channel were discarded due to a full software buffer.
-                                                    # (This usually happens because one of the other input channels is disconnected;
-            this._handle_LOST_PULSES(msgWords)      # with no pulses on that channel, we can't categorize pulses on other channels.)
+        'CON_PULSE':    _handle_CON_PULSE,      # Reports detailed timestamp & pulse-shape data for a co-incident pulse.
+                                                # (That is, a pulse arriving within a certain time window of other pulses.)
+                                                # NOTE: We need to do something special here to process the last argument...
             
-        else:   # Dispatch to parent class.
-            model.SensorHost._handleHostMsg(this, msgWords)
-
-    #__/ End def ShowerDetectorHost._handleHostMsg().
+        'LOST_PULSES':  _handle_LOST_PULSES,    # Reports that pulses from a channel were discarded due to a full software buffer.
+                                                # (This usually happens because one of the other input channels is disconnected;
+                                                # with no pulses on that channel, we can't categorize pulses on other channels.)
+        })
 
 # *** TODO: Still need to implement all the other classes of the new
 #       object model!  Including all the below classes...  ***
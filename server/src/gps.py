@@ -96,8 +96,10 @@ import  earth_coords                # EarthCoords class.
     #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
 __all__ = ['GPS_Manager',   # A worker thread to initialize/maintain state of GPS module.
-           'GPS_Module'     # A object model/proxy for a certain component of a CTU_Node -
-           ]                #   Namely, the DeLorme GPS module (evaluation kit)
+           'GPS_Module',    # A object model/proxy for a certain component of a CTU_Node -
+                            #   Namely, the DeLorme GPS module (evaluation kit)
+           'PDMETimeoutError'   # Raised when a $PDME command is never confirmed.
+           ]
 
     #|==============================================================================
     #|
@@ -115,6 +117,27 @@ __all__ = ['GPS_Manager',   # A worker thread to initialize/maintain state of GP
 logger = logmaster.getLogger(logmaster.sysName + '.mdl.ctu.gps')
 
 
+    #|==============================================================================
+    #|
+    #|      Exception classes.                                      [code section]
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+        #|-------------------------------------------------------------------------
+        #|   PDMETimeoutError                       [public exception class]
+        #|
+        #|       Raised by GPS_Module._wait_PDME_conf() when the GPS module
+        #|       doesn't return a $PDME reply to a command within the
+        #|       allowed time window (e.g., because the reply was dropped
+        #|       somewhere along the way to the server).
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class PDMETimeoutError(logmaster.ErrorException):
+    defLogger = logger
+# End class PDMETimeoutError.
+
+
     #|================================================================================================
     #|
     #|      CLASS:  gps.GPS_Manager                         [module public class]
@@ -1054,27 +1077,34 @@ class GPS_Manager(worklist.Worker):
 
         self.turningOnPOSHOLD.rise()    # This helps prevent redundant attempts.
 
-            # Ask the module to hold its position at the (hard-coded)
-            # GPS antenna location, and just calculate timing data.
-            # NOTE:  Would it make more sense to set the location to
-            # a value obtained from an actual GPS 3-D fix, assuming
-            # that is available?  Or from the average of position fix
-            # readings obtained over an extended period?  Which method
-            # will produce more accurate timing results?  Need to think
-            # about this issue in more depth sometime.
+        try:
 
-        self.node.gps_module.holdPos(sitedefs.GPS_ANT_LOC)
+                # Ask the module to hold its position at the (hard-coded)
+                # GPS antenna location, and just calculate timing data.
+                # NOTE:  Would it make more sense to set the location to
+                # a value obtained from an actual GPS 3-D fix, assuming
+                # that is available?  Or from the average of position fix
+                # readings obtained over an extended period?  Which method
+                # will produce more accurate timing results?  Need to think
+                # about this issue in more depth sometime.
 
-            # Subscribe to be notified of every subsequent PDMEPOSHOLD message
-            # received from the GPS module, so that we can monitor them and react
-            # appropriately to them, for example by turning POSHOLD mode back on
-            # if it gets turned off somehow (e.g. because of a GPS module reset).
+            try:
+                self.node.gps_module.holdPos(sitedefs.GPS_ANT_LOC)
+            except PDMETimeoutError:
+                logger.warn("GPS_Manager._turnOnPOSHOLD(): POSHOLD mode wasn't confirmed; "
+                            "will try again if the next PDMEPOSHOLD report shows it off.")
 
-        if not hasattr(self,'subscribedToPOSHOLD'):        # Avoid redundant subscriptions
-            self.node.gps_module.publisher.subscribe(self._checkPOSHOLD, 'PDMEPOSHOLD')
-            self.subscribedToPOSHOLD = True
+                # Subscribe to be notified of every subsequent PDMEPOSHOLD message
+                # received from the GPS module, so that we can monitor them and react
+                # appropriately to them, for example by turning POSHOLD mode back on
+                # if it gets turned off somehow (e.g. because of a GPS module reset).
 
-        self.turningOnPOSHOLD.fall()    # Announce we're done with that.
+            if not hasattr(self,'subscribedToPOSHOLD'):        # Avoid redundant subscriptions
+                self.node.gps_module.publisher.subscribe(self._checkPOSHOLD, 'PDMEPOSHOLD')
+                self.subscribedToPOSHOLD = True
+
+        finally:
+            self.turningOnPOSHOLD.fall()    # Announce we're done with that (even if it failed).
 
     #__/ End def GPS_Manager._turnOnPOSHOLD().
 
@@ -1085,33 +1115,40 @@ class GPS_Manager(worklist.Worker):
 
         self.turningOnTRAIM.rise()   # Raise the flag announcing we are turning on the TRAIM algorithm.
 
-            # Enable the TRAIM algorithm, with an accuracy threshold parameter
-            # that is suitable given that the view thru our window seems to
-            # always make the module think it's sitting out on the lawn.
-
-        self.node.gps_module.enableTRAIM(self.TRAIM_threshold)    # 62 ns accuracy target
-            #                               |
-            #  NOTE:  It's unclear what value of this threshold is most suitable.
-            #           This value, 62 ns, is the uncertainty of the PPS signal
-            #           according to the GPS2058-10 module's datasheet.  Sometimes
-            #           we have also used 100 ns, or 50 ns.  25 ns is suggested at
-            #           one point in the datasheet.  If the value is too small, it
-            #           can result in too many satellites being eliminated from the
-            #           solution.  If it is too large, it may fail to eliminate ones
-            #           that are inaccurate (possibly due to signal reflections).
+        try:
+
+                # Enable the TRAIM algorithm, with an accuracy threshold parameter
+                # that is suitable given that the view thru our window seems to
+                # always make the module think it's sitting out on the lawn.
+
+            try:
+                self.node.gps_module.enableTRAIM(self.TRAIM_threshold)    # 62 ns accuracy target
+                    #                               |
+                    #  NOTE:  It's unclear what value of this threshold is most suitable.
+                    #           This value, 62 ns, is the uncertainty of the PPS signal
+                    #           according to the GPS2058-10 module's datasheet.  Sometimes
+                    #           we have also used 100 ns, or 50 ns.  25 ns is suggested at
+                    #           one point in the datasheet.  If the value is too small, it
+                    #           can result in too many satellites being eliminated from the
+                    #           solution.  If it is too large, it may fail to eliminate ones
+                    #           that are inaccurate (possibly due to signal reflections).
+            except PDMETimeoutError:
+                logger.warn("GPS_Manager._turnOnTRAIM(): TRAIM mode wasn't confirmed; "
+                            "will try again if the next PDMETRAIM report shows it invalid.")
         
-            # Subscribe to be notified of every subsequent PDMETRAIM message
-            # received from the GPS module, so that we can react appropriately,
-            # for example by displaying warnings if the status isn't good, and
-            # perhaps automatically try turning TRAIM mode back on if it gets
-            # turned off somehow.
+                # Subscribe to be notified of every subsequent PDMETRAIM message
+                # received from the GPS module, so that we can react appropriately,
+                # for example by displaying warnings if the status isn't good, and
+                # perhaps automatically try turning TRAIM mode back on if it gets
+                # turned off somehow.
 
-        if not hasattr(self,'subscribedToTRAIM'):        # Avoid redundant subscriptions
-            self.node.gps_module.publisher.subscribe(self._checkTRAIM, 'PDMETRAIM')
-            self.subscribedToTRAIM = True
+            if not hasattr(self,'subscribedToTRAIM'):        # Avoid redundant subscriptions
+                self.node.gps_module.publisher.subscribe(self._checkTRAIM, 'PDMETRAIM')
+                self.subscribedToTRAIM = True
+
+        finally:
+            self.turningOnTRAIM.fall()  # Lower the flag to announce we're done turning on the TRAIM algorithm.
 
-        self.turningOnTRAIM.fall()  # Lower the flag to announce we're done turning on the TRAIM algorithm.
-        
     #<- End GPS_Manager._turnOnTRAIM
         
         # All of the the below GPS Manager tasks have not yet been defined.
@@ -1261,6 +1298,20 @@ class GPS_Module:
     TRAIM_VALID_NO          =   0       # Timing solution (or just TRAIM message data?) is considered valid.
     TRAIM_VALID_YES         =   1       # Timing solution (or just TRAIM message data?) is not considered valid.
 
+            # Names of all instance data members.  Declaring these as slots
+            # means GPS_Module instances don't need a per-instance __dict__,
+            # and attribute accesses go straight to fixed slot offsets.
+
+    __slots__ = ('_lock', 'node', 'baud_rate',
+                 'resetting', 'NMEA_on', 'TRAIM_on', 'POSHOLD_on',
+                 'nSats', 'last_nSats', 'gotSats',
+                 'TRAIM_allgood', 'TRAIM_somebad', 'TRAIM_unknown',
+                 'TRAIM_valid', 'TRAIM_invalid', 'TRAIM_nBad', 'TRAIM_uncert',
+                 'ephemeris_good', 'almanac_good',
+                 'pdme_inbox', 'gpgga_inbox', 'gprmc_inbox', 'traim_inbox',
+                 'poshold_inbox', 'header_inbox', 'gptxt_inbox',
+                 'publisher')
+
             # Private constants for the various PDME command codes (DeLorme-specific $PDME NMEA messages).
 
     _PDME_COLD_START     = 0     # Cold-start the GPS module.
@@ -1287,6 +1338,14 @@ class GPS_Module:
     _PDME_TRAIM_CTRL     = 22    # Enable/Disable TRAIM algorithm
     _PDME_BINARY_MODE    = 23    # Switch to binary protocol mode
 
+            # How long (in seconds) to wait for the $PDME return confirming a command.
+
+    _PDME_CONF_TIMEOUT   = 2.0
+
+            # How long (in seconds) to wait for the module to finish a hot/warm/cold reset.
+
+    _RESET_TIMEOUT       = 10.0
+
         #|---------------------------------------------------------------------------------------
         #|
         #|      Nested class definitions.                       [class definition section]
@@ -1424,7 +1483,10 @@ class GPS_Module:
         
     #<- End class GPS_Module._GPRMC_Record.
             
-    class   _TRAIM_Record:      pass
+    class   _TRAIM_Record:                  # For storing data from a PDMETRAIM status message.
+        __slots__ = ('Solution', 'Valid', 'Time_Error', 'Removed_SVIDs',    # Raw fields, as strings.
+                     'bad_sat_ids',                                         # Bad satellite IDs, as bytes.
+                     'solutNum', 'validNum', 'nBadSats', 'timeError')       # Parsed numeric fields.
     class   _POSHOLD_Record:    pass
 
         # Instance initializer.
@@ -1534,45 +1596,21 @@ class GPS_Module:
 
         msgType = msgWords[0]       # First word is the message type.
 
-        if    msgType == 'GPRMC':           # Ex: $GPRMC,212143.013,V,3025.676,N,08417.112,W,0.0,0.0,161211,4.1,W*70
-            
-            this._handleGPRMC(msgWords)
-
-        elif    msgType == 'GPGGA':         # Ex: $GPGGA,212559.000,3025.67523,N,08417.09543,W,0,00,99.0,083.67,M,-29.7,M,,*6C
-            
-            this._handleGPGGA(msgWords)
-
-        elif    msgType == 'PDME':
-            
-            this._handlePDME(msgWords)
-
-        elif    msgType == 'PDMETRAIM':
-            
-            this._handlePDMETRAIM(msgWords)
-
-        elif    msgType == 'PDMEPOSHOLD':
-            
-            this._handlePDMEPOSHOLD(msgWords)
-
-                # NOTE: The next two can't be parsed by the usual method because there is
-                # no comma delimiting the end of the message type name.  This problem needs
-                # to be repaired before .sendMessage() is called, or these elif's won't work.
+            # Look up the handler method for this message type in our class-level
+            # dispatch table (see _DISPATCH at the end of the class definition).
+            # NOTE: The PDMEHEADER1 & PDMEHEADER2 messages can't be parsed by the
+            # usual method because there is no comma delimiting the end of the
+            # message type name.  This problem needs to be repaired before
+            # .sentMessage() is called, or the lookup won't find them.
 
-        elif    msgType == 'PDMEHEADER1':
+        handler = this._DISPATCH.get(msgType)
 
-            this._handlePDMEHEADER1(msgWords)   # $PDMEHEADER1: DeLORME GPS2058_HW_1.0.1
-
-        elif    msgType == 'PDMEHEADER2':       # $PDMEHEADER2: DeLORME GPS2058_FW_2.0.1
-            
-            this._handlePDMEHEADER2(msgWords)   
-
-        elif    msgType == 'GPTXT':             # $GPTXT,COSMICi Custom_Config_0.0.3
-            
-            this._handleGPTXT(msgWords)
-
-        else:
+        if handler is None:
             logger.warn(("GPS_Module.sentMessage(): The GPS module sent a message of a type " +
                          "[%s] which I don't know how to handle.  Ignoring...") % msgType)
+            return
+
+        handler(this, msgWords)
 
     #<- End def GPS_Module.sentMessage().
 
@@ -1757,7 +1795,6 @@ class GPS_Module:
         traim_rec.Valid           = msgWords[2]       # 0=NOT_VALID, 1=VALID
         traim_rec.Time_Error      = msgWords[3]       # Time Error in secs, s.sssssssss (9 digits)
         traim_rec.Removed_SVIDs   = msgWords[4]       # Number of removed SVIDs (bad satellites)
-        traim_rec.bad_sat_ids     = msgWords[5:]      # Array of bad satellite IDs, 0 for n/a.
 
             # Go ahead and parse a few numeric fields.  Should we do some
             # exception handling here, just in case there are some garbage
@@ -1768,6 +1805,12 @@ class GPS_Module:
         traim_rec.nBadSats = int(traim_rec.Removed_SVIDs)     # use.
         traim_rec.timeError = float(traim_rec.Time_Error)     # Time error in seconds.
 
+            # The remaining 12 fields are the IDs of the bad satellites (0 for n/a).
+            # Satellite IDs are small integers, so we pack them into a compact bytes
+            # object (one byte per ID) rather than keeping a list of 12 strings.
+
+        traim_rec.bad_sat_ids = bytes(int(svid) for svid in msgWords[5:])
+
             # Update a few state variables in the model proxy.
 
         with this._lock:
@@ -1924,38 +1967,35 @@ class GPS_Module:
 
     #<- End def GPS_Module._send_PDME_cmd().
 
-        # Wait for a PDME reply confirming a given PDME command.
-        # NOTE: It would probably make sense for this method to
-        # raise an exception if the desired confirmation isn't
-        # received within a certain time window.
-        #   ALSO: The hot/warm/cold reset PDME commands will NEVER
-        # generate a PDME reply, because the module will reset before
-        # it gets around to replying.  We handle this with a special
-        # case where instead we wait for the module to finish resetting
-        # itself.
+        # Wait for a PDME reply confirming a given PDME command.  <old_rec>
+        # is whatever the PDME inbox held just before the command was sent
+        # (see _do_PDME_cmd(), below).  If the confirmation isn't received
+        # within _PDME_CONF_TIMEOUT seconds, we raise a PDMETimeoutError, so
+        # that a dropped reply can't hold up the caller (and everyone else
+        # waiting on the model) forever.
+        #   NOTE: This should not be called for the hot/warm/cold reset
+        # PDME commands, which will NEVER generate a PDME reply, because
+        # the module resets before it gets around to replying.  Those
+        # are handled separately in _do_PDME_cmd(), below.
 
-    def _wait_PDME_conf(this, cmdcode):
+    def _wait_PDME_conf(this, cmdcode, old_rec):
 
         with    this._lock:
 
-                # First, a special case here for reset command-codes - instead of waiting for
-                # a PDME return message, wait for the .resetting flag to fall, which should
-                # happen at the end of processing the $GPTXT message.
-
-            if cmdcode >= this._PDME_COLD_START and cmdcode <= this._PDME_HOT_START:
-                logger.info("GPS_Module._wait_PDME_conf():  Waiting for the GPS module to finish resetting...")
-                this.resetting.waitFall()       # Wait for the model's "resetting" flag to fall.
-                    # This flag will be lowered after the model receives the GPTXT line.
-                logger.info("GPS_Module._wait_PDME_conf():  PDME command %d confirmed by a completed reset." % cmdcode)
-                return      # Rest of method is for handling the normal case.
-            #__/ End if cmdcode is a hot/warm/cold start.
-            
-                # For other cases, we explicitly wait for a $PDME return message.
-                # Really, we should do the below with a reasonable timeout, and report an
-                # error if the confirmation isn't received within a few seconds.
+                # We explicitly wait (with a timeout) for a $PDME return
+                # message.  Note that waiting on the inbox fully releases
+                # this._lock (even if our caller is also holding it), so that the
+                # message-receiving thread can deliver the reply to us meanwhile.
+                # If the inbox still holds the same record after the wait, then
+                # we know that we timed out.
 
             logger.info("GPS_Module._wait_PDME_conf():  Waiting to get a PDME command return...")
-            pdme_rec = this.pdme_inbox.wait()     # Wait for the PDME inbox's "updated" flag to be touched.
+            pdme_rec = this.pdme_inbox.wait(this._PDME_CONF_TIMEOUT)    # Wait for the PDME inbox's "updated" flag to be touched.
+
+            if pdme_rec is old_rec:
+                raise PDMETimeoutError(("GPS_Module._wait_PDME_conf(): Timed out after %.1f secs. " +
+                                        "waiting for PDME command %d to be confirmed.")
+                                       % (this._PDME_CONF_TIMEOUT, cmdcode))
 
             last_cmd    = int(pdme_rec.cmdCode)
             cmd_ok      = pdme_rec.ok
@@ -1975,8 +2015,6 @@ class GPS_Module:
 
                 # raise exception?
 
-            # should there be a case here for if we timed out?
-
             else:
 
                 logger.info("GPS_Module._wait_PDME_conf():  PDME command %d confirmed." % cmdcode)
@@ -1989,10 +2027,36 @@ class GPS_Module:
         
 
     def _do_PDME_cmd(this, code, *args):       # Send a command & wait for confirmation.
-        this._send_PDME_cmd(code, *args)
-            # If the code is 0-2 (restart), we need to do something different
-            # here b/c we won't receive a PDME reply.
-        this._wait_PDME_conf(code)
+
+            # We hold this._lock from before the command is sent until we are
+            # actually waiting for its reply.  The inbox shares our lock, so
+            # the message-receiving thread can't deliver a reply in between;
+            # and we note the inbox's contents *before* sending, so that a
+            # fast reply can't be mistaken for the old record (which would
+            # make the command look like it had timed out).
+
+        with this._lock:
+
+            old_rec = this.pdme_inbox()
+
+            this._send_PDME_cmd(code, *args)
+
+                # If the code is 0-2 (restart), we won't receive a PDME reply.
+                # Instead, just wait for the .resetting flag to fall, which should
+                # happen at the end of processing the $GPTXT message.
+
+            if this._PDME_COLD_START <= code <= this._PDME_HOT_START:
+                logger.info("GPS_Module._do_PDME_cmd():  Waiting for the GPS module to finish resetting...")
+                if this.resetting.waitFall(this._RESET_TIMEOUT):
+                    logger.info("GPS_Module._do_PDME_cmd():  PDME command %d confirmed by a completed reset." % code)
+                else:
+                    logger.warn(("GPS_Module._do_PDME_cmd():  The GPS module still hadn't finished " +
+                                 "resetting %.1f secs. after PDME command %d.") % (this._RESET_TIMEOUT, code))
+                return
+
+            this._wait_PDME_conf(code, old_rec)
+
+    #<- End def GPS_Module._do_PDME_cmd().
         
     def hotStart(this):             # note: $PDME,2
         this.resetting.rise()
@@ -2126,6 +2190,20 @@ class GPS_Module:
     def turnOnNMEA(this):               pass    # note: $PDME,10,1  $PDME,10,2
     def turnOffNMEA(this):              pass    # note: $PDME,10,0
     def turnOffTRAIM(this):             pass    # note: $PDME,22,0
+
+        # Dispatch table mapping each message type we know how to handle
+        # to its (unbound) handler method.  Used by .sentMessage().
+
+    _DISPATCH = {
+        'GPRMC':        _handleGPRMC,           # Ex: $GPRMC,212143.013,V,3025.676,N,08417.112,W,0.0,0.0,161211,4.1,W*70
+        'GPGGA':        _handleGPGGA,           # Ex: $GPGGA,212559.000,3025.67523,N,08417.09543,W,0,00,99.0,083.67,M,-29.7,M,,*6C
+        'PDME':         _handlePDME,
+        'PDMETRAIM':    _handlePDMETRAIM,
+        'PDMEPOSHOLD':  _handlePDMEPOSHOLD,
+        'PDMEHEADER1':  _handlePDMEHEADER1,     # $PDMEHEADER1: DeLORME GPS2058_HW_1.0.1
+        'PDMEHEADER2':  _handlePDMEHEADER2,     # $PDMEHEADER2: DeLORME GPS2058_FW_2.0.1
+        'GPTXT':        _handleGPTXT,           # $GPTXT,COSMICi Custom_Config_0.0.3
+        }
     
 #<- End class GPS_Module
 
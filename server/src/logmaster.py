@@ -73,6 +73,7 @@ import io           # For TextIOBase, which we subclass in NullOut.
 import logging      # General python logging facility.
     # - Don't import names from within it, b/c we redefine some of them.
 import threading    # Used for our threading.local LoggingContext
+import contextlib   # For the contextmanager decorator, used by component().
 import traceback    # Used for ...
 
         # Imports of lower-level custom modules.
@@ -126,6 +127,7 @@ __all__ = ['NORMAL_LEVEL',                          # Public global variables.
            'critical', 'lvlname_to_loglevel',
            'byname', 'getLogger', 'testLogging',
            'updateStderr', 'setThreadRole', 'setComponent',
+           'component',
            ]
 
 
@@ -856,6 +858,24 @@ def setComponent(component:str):
     thread.component = component
     theLoggingContext.component = component
 
+    # Context manager for temporarily setting the current thread's
+    # component, e.g.:
+    #
+    #       with logmaster.component("node #3"):
+    #           ...
+    #
+    # The previous component is restored on the way out, even if
+    # the body raises an exception.
+
+@contextlib.contextmanager
+def component(name:str):
+    oldComponent = theLoggingContext.component
+    setComponent(name)
+    try:
+        yield
+    finally:
+        setComponent(oldComponent)
+
         #==============================================================
         #   AbnormalFilter                      [module public class]
         #
@@ -35,13 +35,20 @@
 #
 #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
-import time             # MainSrvReqHandler.finish() uses time.sleep()
+import heapq            # _DelayedCloser uses heappush(), heappop()
+import itertools        # _DelayedCloser uses count()
+import logging          # Acknowledge_MsgHndlr.handle() uses DEBUG, INFO
+import queue            # MainConnHandler.handle() uses queue.Queue
+import sys              # Command_MsgHndlr.handle() uses intern()
+import threading        # _DelayedCloser, _LineBatcher use Condition, Lock
+import time             # _DelayedCloser uses monotonic()
 
 import logmaster        # module-level uses getLogger()
 import communicator     # module-level uses MessageHandler
 import ports            # class MainServer uses COSMO_PORT
 import sitedefs         # class MainServer uses MY_IP
 import tikiterm         # used several places
+import worklist         # _drain_termq() catches WorkerExiting
 
     # List of all exported (public) names.
 
@@ -58,6 +65,260 @@ logger = logmaster.getLogger(logmaster.appName + '.mnSrv')
 global cosmicIserver, cosmicIServer, cis
 cis = cosmicIserver = cosmicIServer = None  # Initialized by COSMICi_server module.
 
+    # Logging component strings ('node0', 'node1', ...) by node number,
+    # so that each one is built (and interned) only once.
+
+_NODE_COMPONENT_CACHE = {}
+
+global _dispatch
+_dispatch = None    # Bound to cosmicIServer.commandHandler.submit by _bind_command_dispatch().
+
+    # COSMICi_server calls this right after installing cosmicIServer
+    # (above), and should call it again if the commandHandler is ever
+    # replaced.  It saves Command_MsgHndlr from looking up the global
+    # server object and its handler on every message.
+
+def _bind_command_dispatch():
+    global _dispatch
+    _dispatch = cosmicIServer.commandHandler.submit
+
+    # Terminal text styles.  Only these few are ever used, so we
+    # create them once here instead of once per message.
+
+_STYLE_IN       = tikiterm.TikiTermTextStyle(tikiterm.Cyan)     # Incoming lines (from the node).
+_STYLE_OUT      = tikiterm.TikiTermTextStyle(tikiterm.Green)    # Outgoing lines (from the server).
+_CLOSING_STYLE  = tikiterm.TikiTermTextStyle(tikiterm.Yellow, tikiterm.Red)     # "Connection stopped" notice.
+
+    # Maximum number of lines waiting to be shown in a connection's
+    # terminal window.  If the GUI falls further behind than this,
+    # the oldest undisplayed lines are dropped.
+
+_TERMQ_SIZE = 1024
+
+    #===================================================================
+    #   _LazyTerm                                       [private class]
+    #
+    #       Stands in for a connection's TikiTerm window, creating the
+    #       real window only when there is first something to show in
+    #       it.  That way a connection that closes without sending
+    #       anything (a port scan, a misdirected client) costs us no
+    #       GUI work at all.  Title changes made before the window
+    #       exists are remembered and used when it's created.
+    #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class _LazyTerm:
+
+    def __init__(inst, title:str, in_hook):
+        inst.title      = title
+        inst.in_hook    = in_hook
+        inst.term       = None              # The real TikiTerm, once created.
+        inst.closed     = False             # Closed before it was ever created?
+        inst.lock       = threading.Lock()  # Guards the above.
+
+        # Return the real terminal, creating it if necessary.
+        # Returns None if we were closed before it was needed.
+
+    def get(inst):
+        with inst.lock:
+            if inst.term is None and not inst.closed:
+                logger.debug("_LazyTerm.get(): Popping up a new terminal window named [%s]...", inst.title)
+                inst.term = tikiterm.TikiTerm(title=inst.title, in_hook=inst.in_hook)
+            return inst.term
+
+    def put(inst, text:str, style:tikiterm.TikiTermTextStyle = None):
+        term = inst.get()
+        if term is not None:
+            term.put(text, style)
+
+    def set_title(inst, title:str):
+        with inst.lock:
+            term = inst.term
+            if term is None:
+                inst.title = title
+                return
+        term.set_title(title)
+
+        # If the window was never created, make sure it never will
+        # be, and return False.  Otherwise, return True (and leave it
+        # for the caller to close the window when it's ready to).
+
+    def close_if_unused(inst):
+        with inst.lock:
+            if inst.term is None:
+                inst.closed = True
+                return False
+            return True
+
+    def closewin(inst):
+        with inst.lock:
+            term = inst.term
+            inst.closed = True
+        if term is not None:
+            term.closewin()
+
+#__/ End class _LazyTerm.
+
+    #===================================================================
+    #   Terminal output queue functions.                [private]
+    #
+    #       Lines to be displayed in a connection's terminal are
+    #       queued on conn._termq and written out by a separate
+    #       drainer thread, so that a slow GUI never holds up the
+    #       connection's receiver thread.  A None item tells the
+    #       drainer to exit.
+    #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+def _put_termq(termq:queue.Queue, item):
+    while True:
+        try:
+            termq.put_nowait(item)
+            return
+        except queue.Full:              # GUI is way behind; make room by
+            try:                        # discarding the oldest pending line.
+                termq.get_nowait()
+            except queue.Empty:
+                pass
+
+_TERMQ_BATCH = 64   # Most queued lines the drainer hands to the terminal at once.
+
+def _drain_termq(conn):
+    termq = conn._termq
+    done = False
+    while not done:
+
+            # Wait for a line, then grab whatever else is already waiting.
+
+        batch = [termq.get()]
+        while len(batch) < _TERMQ_BATCH:
+            try:
+                batch.append(termq.get_nowait())
+            except queue.Empty:
+                break
+
+            # Join runs of lines that share a style, so that each run
+            # is a single put (and a single widget update) in the GUI.
+
+        runs = []
+        for item in batch:
+            if item is None:
+                done = True
+                break
+            (text, style) = item
+            if runs and runs[-1][1] is style:
+                runs[-1][0].append(text)
+            else:
+                runs.append(([text], style))
+
+        if runs:
+            term = conn.term.get()      # This pops up the window, the first time through.
+            if term is not None:
+                    # Wait for the terminal's output driver to take this batch
+                    # before fetching the next, so the queue bound means something.
+                try:
+                    term.outputDriver.getResult(
+                        lambda: [term.put(''.join(texts), style) for (texts, style) in runs])
+                except worklist.WorkerExiting:
+                        # The terminal's output driver is gone (e.g., its window
+                        # was closed), so there's nowhere left to show anything.
+                        # Quit, leaving whatever is still queued undisplayed.
+                    logger.debug("_drain_termq(): Terminal output driver has exited; dropping the rest of the queue.")
+                    return
+
+    #===================================================================
+    #   _DelayedCloser                                  [private class]
+    #
+    #       A single background thread that runs callbacks (such as
+    #       closing a dead connection's terminal window) at given
+    #       times in the future.  Pending calls are kept in a heap
+    #       ordered by deadline, so any number of connections can be
+    #       lingering at once without each needing its own timer
+    #       thread.  The thread is started when first needed.
+    #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class _DelayedCloser:
+
+    def __init__(inst):
+        inst.heap   = []                    # Entries: [deadline, seqno, callback].
+        inst.seq    = itertools.count()     # Tie-breaker so callbacks are never compared.
+        inst.cv     = threading.Condition()
+        inst.thread = None
+
+        # Arrange for callback() to be called <delay> seconds from now.
+
+    def schedule(inst, delay:float, callback):
+        entry = [time.monotonic() + delay, next(inst.seq), callback]
+        with inst.cv:
+            heapq.heappush(inst.heap, entry)
+            if inst.thread is None:
+                inst.thread = logmaster.ThreadActor(role = "mnSrv.closer", component = "server",
+                                                    target = inst._run)
+                inst.thread.daemon = True       # Don't let pending closes keep the process alive.
+                inst.thread.start()
+            elif inst.heap[0] is entry:         # New earliest deadline; wake the thread to notice.
+                inst.cv.notify()
+
+    def _run(inst):
+        while True:
+            with inst.cv:
+                while True:
+                    now = time.monotonic()
+                    if inst.heap and inst.heap[0][0] <= now:
+                        break
+                    inst.cv.wait(inst.heap[0][0] - now if inst.heap else None)
+                callback = heapq.heappop(inst.heap)[2]
+            try:
+                callback()
+            except Exception:
+                logger.exception("_DelayedCloser._run(): Scheduled callback raised an exception; continuing.")
+
+#__/ End class _DelayedCloser.
+
+_closer = _DelayedCloser()      # Shared by all main-server connections.
+
+    #===================================================================
+    #   _LineBatcher                                    [private class]
+    #
+    #       Wraps a Connection's sendOut() method for use as a
+    #       terminal's input hook.  The first line sent while we're
+    #       idle goes out as soon as the connection's sender thread
+    #       gets to it; lines that pile up before then are joined
+    #       and written out together (up to maxBatch at a time), so
+    #       that they share a single flush to the socket.
+    #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class _LineBatcher:
+
+    maxBatch = 64   # Most lines we'll join into one write.
+
+    def __init__(inst, conn:communicator.Connection):
+        inst.conn       = conn
+        inst.buf        = []                # Lines waiting to be sent.
+        inst.lock       = threading.Lock()  # Guards .buf and .in_flight.
+        inst.in_flight  = False             # Has a flush been handed to the sender thread?
+
+    def __call__(inst, line:str):
+        if line[-1:] not in ('\r', '\n'):  # Each line needs its own terminator once joined.
+            line += '\n'
+        with inst.lock:
+            inst.buf.append(line)
+            if inst.in_flight:                  # A flush is on its way already; it'll take this line.
+                return
+            inst.in_flight = True
+        inst.conn(inst._flush)                  # Do the flush in the connection's sender thread.
+
+    def _flush(inst):
+        with inst.lock:
+            pending = inst.buf[:inst.maxBatch]
+            del inst.buf[:inst.maxBatch]
+            more = bool(inst.buf)
+            if not more:
+                inst.in_flight = False
+        inst.conn.sendOut(''.join(pending))     # We're in the sender thread, so this sends right away.
+        if more:
+            inst.conn(inst._flush)
+
+#__/ End class _LineBatcher.
+
     #===================================================================
     #   Message handlers for use by MainConnHandler.
     #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
@@ -65,14 +326,19 @@ cis = cosmicIserver = cosmicIServer = None  # Initialized by COSMICi_server modu
 class Acknowledge_MsgHndlr(communicator.BaseMessageHandler):    # Message handler that just acknowledges message receipt.
     
     defHandlerName = "main.ack"
+    __slots__ = ()
     
-    def handle(inst, msg):                                      # To handle a message,
-        if msg.dir == communicator.DIR_IN:                                       # If it's an incoming message,
-            logger.debug("Acknowledge_MsgHndlr.handle(): Acknowledging received message [%s]..." % msg.data.strip())
+    def handle(inst, msg, _DIR_IN=communicator.DIR_IN):                                      # To handle a message,
+        if msg.dir is _DIR_IN:                                       # If it's an incoming message,
+            debugging = logger.isEnabledFor(logging.DEBUG)      # Only strip strings for the log if it's listening.
+            if debugging:
+                logger.debug("Acknowledge_MsgHndlr.handle(): Acknowledging received message [%s]...", msg.data.strip())
             replystr = "ACK " + msg.data.upper()
-            logger.debug("Acknowledge_MsgHndlr.handle(): Sending acknowledgement string [%s]..." % replystr.strip())
+            if debugging:
+                logger.debug("Acknowledge_MsgHndlr.handle(): Sending acknowledgement string [%s]...", replystr.strip())
             msg.replyWith(replystr)                    # Append 'ACK ', upcase it, and reply.
-            logger.info("Finished sending reply string [%s]."%replystr.strip())
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Finished sending reply string [%s].", replystr.strip())
 # End class Acknowledge_MsgHndlr.
 
 # Color scheme:
@@ -84,69 +350,72 @@ class Acknowledge_MsgHndlr(communicator.BaseMessageHandler):    # Message handle
 class TermDisp_MsgHndlr(communicator.BaseMessageHandler):       # Message handler that displays messages on a terminal.
     
     defHandlerName = "main.disp"
+    __slots__ = ()
     
-    def handle(inst, msg):
+    def handle(inst, msg, _DIR_IN=communicator.DIR_IN):
 
-            # Determine text display color based on message direction.
+            # Determine text display style (color) based on message direction.
         
-        if msg.dir == communicator.DIR_IN:
-            color = tikiterm.Cyan
-        else:
-            color = tikiterm.Green
-
-            # Assign this color as the foreground color of the text.
-        
-        style = tikiterm.TikiTermTextStyle(color)
+        style = _STYLE_IN if msg.dir is _DIR_IN else _STYLE_OUT
 
             # Put the message data to the connection's terminal window.
 
-#        logger.debug("TermDisp_MsgHndlr.handle(): Displaying %s message [%s] with color %s..." %
-#                     ('incoming' if msg.dir == communicator.DIR_IN else 'outgoing',
-#                      msg.data.strip(), color))
+#        logger.debug("TermDisp_MsgHndlr.handle(): Displaying %s message [%s] with color %s...",
+#                     'incoming' if msg.dir == communicator.DIR_IN else 'outgoing',
+#                      msg.data.strip(), style.fgColor)
         
-        msg.conn.term.put(msg.data, style)
+        _put_termq(msg.conn._termq, (msg.data, style))
 # End class TermDisp_MsgHndlr.
 
 class Command_MsgHndlr(communicator.BaseMessageHandler):        # Message handler that sends commands to central processor.
     
     defHandlerName = "main.cmd"
+    __slots__ = ()
     
-    def handle(inst, msg):                                      # To handle a message,
+    def handle(inst, msg, _DIR_IN=communicator.DIR_IN):                                      # To handle a message,
 
-        global cosmicIServer
+        if msg.dir is _DIR_IN:                          # If it's an incoming message,
 
-        if msg.dir == communicator.DIR_IN:                          # If it's an incoming message,
+                # Blank lines (which often show up as a connection closes)
+                # can't be commands; the commandHandler would only parse
+                # them to find that out, so don't bother handing them over.
+                # Anything else goes through, even if it's not a command
+                # we know, so that the commandHandler can complain about it.
 
-            if hasattr(msg.conn, 'node'):
-                oldnode = msg.conn.node                                     # Remember what node was talking to the connection, if any.
-            else:
-                oldnode = None
+            data = msg.data
+            if not data or data.isspace():
+                return
 
-#            logger.debug("Command_MsgHndlr.handle(): Processing message [%s] as a command..."
-#                         % msg.data.strip())
+            conn = msg.conn
+            oldnode = conn.node                                     # Remember what node was talking to the connection, if any.
 
-                # Here, we attempt to interpret the message as a server command.
-                # For some reason, this try/except clause isn't catching the exception.
-                # Ah, it's because the exception is getting raised in a different thread,
-                # the commandHandler thread.
+#            logger.debug("Command_MsgHndlr.handle(): Processing message [%s] as a command...",
+#                         msg.data.strip())
 
-            try:
-                    # The following accesses the commandHandler by going through
-                    # the global CosmicIServer object, defined in module COSMICi_server,
-                    # which should be the module invoked to start the program.
-                cosmicIServer.commandHandler.process(msg)
-            except Exception as e:
-                logger.warning("Command_MsgHndlr.handle(): An attempt to process the message [%s] as a command raised an exception; ignoring..." % str(msg))
+                # Here, we hand the message off to be interpreted as a server command.
+                # Any exception from that is raised in the commandHandler thread, not
+                # here, so CommandHandler._drainBatch() is where it gets caught & logged.
+                # _dispatch is the submit() method of the commandHandler of the global
+                # CosmicIServer object, defined in module COSMICi_server, which should be
+                # the module invoked to start the program.
+
+            _dispatch(msg)
 
                 # Update the 'component' field in the receiver thread's
                 # logging context.  (And also the sender thread's.)
                 
-            if hasattr(msg.conn, 'node') and msg.conn.node != oldnode:      # If our idea of what node is talking to this connection has changed,
-                if msg.conn.node != None:
-                    logger.debug("Command_MsgHndlr.handle(): Aha, I now know this connection is for node %d!"
-                                 % msg.conn.node.nodenum)
-                    component = 'node'+str(msg.conn.node.nodenum)
-                    msg.conn.term.set_title("Main connection from Node #%d" % msg.conn.node.nodenum)    # Is this even doing anything now?
+            node = conn.node
+            if node != oldnode:                                     # If our idea of what node is talking to this connection has changed,
+                if node != None:
+                    nodenum = node.nodenum
+                    logger.debug("Command_MsgHndlr.handle(): Aha, I now know this connection is for node %d!",
+                                 nodenum)
+                    component = _NODE_COMPONENT_CACHE.get(nodenum)
+                    if component is None:
+                        component = _NODE_COMPONENT_CACHE.setdefault(nodenum, sys.intern('node'+str(nodenum)))
+                    if conn._last_title_nodenum != nodenum:     # Skip the GUI hop if the title wouldn't change.
+                        conn.term.set_title("Main connection from Node #%d" % nodenum)    # Is this even doing anything now?
+                        conn._last_title_nodenum = nodenum
                 else:
                     component = 'unknown'
 
@@ -154,8 +423,12 @@ class Command_MsgHndlr(communicator.BaseMessageHandler):        # Message handle
                     # context field for BOTH the current (receiver)
                     # thread, as well as the associated sender thread
                     # (the same object as the connection itself).
+                    # That means a trip to the sender thread, so only
+                    # do it if the component has really changed.
 
-                msg.conn.update_component(component)
+                if component != conn._component_str:
+                    conn.update_component(component)
+                    conn._component_str = component
 
 #^^^^^^^^^^^^^^^^^^^^^^^^^^^^^            
 # End class Command_MsgHndlr
@@ -165,6 +438,12 @@ class Command_MsgHndlr(communicator.BaseMessageHandler):        # Message handle
     # End of message handler definitions for use by MainConnHandler.
     #====================================================================
 
+    # The message handlers above keep no per-connection state, so
+    # every connection can share the same instances.
+
+_TERM_DISP  = TermDisp_MsgHndlr()
+_CMD        = Command_MsgHndlr()
+
     #====================================================================
     #   MainConnHandler                                 [public class]
     #
@@ -209,8 +488,9 @@ class MainConnHandler(communicator.BaseConnectionHandler):
 
         (sender_ip, sender_port) = conn.req_hndlr.client_address
         clientaddr = "%s:%d"%(sender_ip, sender_port)
+        conn.clientaddr = clientaddr    # Keep it, so nobody needs to re-derive it from req_hndlr.
 
-        logger.debug("MainConnHandler.handle(): Handling a new main server connection from %s..." % clientaddr)
+        logger.debug("MainConnHandler.handle(): Handling a new main server connection from %s...", clientaddr)
 
             # At this point, the connection doesn't yet know what node it's serving.
             # (Although if we were smart, in some cases we might be able to guess it
@@ -219,23 +499,39 @@ class MainConnHandler(communicator.BaseConnectionHandler):
 
         conn.node = None    # Means, not yet determined.
 
-            # Pop up a new TikiTerm window for displaying this connection's I/O.
+            # What Command_MsgHndlr last set the window title's node number
+            # and the logging component to, so it can skip redundant updates.
+
+        conn._last_title_nodenum = None
+        conn._component_str = None
+
+            # Arrange for a new TikiTerm window for displaying this connection's I/O.
+            # (It doesn't actually pop up until there's something to display.)
 
         title = "Main Server Connection #%d from %s" % (conn.cid, clientaddr)
             # -Later we will want to change the title to include the node # (once we know it).
             
-        logger.debug("MainConnHandler.handle(): Popping up a new terminal window named [%s]..."%title)
-        conn.term = tikiterm.TikiTerm(title=title, in_hook=conn.sendOut)
+        conn.term = _LazyTerm(title, in_hook=_LineBatcher(conn))
             # -The in_hook assignment causes input lines typed by the user to be
-            #  sent out to the remote client over the connection's return path.
+            #  sent out to the remote client over the connection's return path
+            #  (batched together, if they come faster than they can be sent).
+
+            # Start the thread that feeds queued lines to the terminal.
+
+        conn._termq = queue.Queue(maxsize=_TERMQ_SIZE)
+        drainer = logmaster.ThreadActor(role = conn.comm.role + ".con%d.term" % conn.cid,
+                                        component = "conn #%d" % conn.cid,
+                                        target = _drain_termq, args = (conn,))
+        drainer.daemon = True
+        drainer.start()
 
             # Register our message handlers.
 
         logger.debug("MainConnHandler.handle(): Registering main-server message handlers...")
         #conn.addMsgHandler(Acknowledge_MsgHndlr())     # Replies to lines with ACK commands
         #   ^- This is commented out to avoid excessive return traffic 
-        conn.addMsgHandler(TermDisp_MsgHndlr())         # Displays lines on terminal
-        conn.addMsgHandler(Command_MsgHndlr())          # Processes lines as command
+        conn.addMsgHandler(_TERM_DISP)                  # Displays lines on terminal
+        conn.addMsgHandler(_CMD)                        # Processes lines as command
         
 #^^^^^^^^^^^^^^^^^^^^^^^^^^^^
 # End class MainConnHandler.
@@ -248,15 +544,21 @@ class MainSrvReqHandler(communicator.LineCommReqHandler):
         # What to do on the way out of the request-handling loop
         # (e.g. after the socket stops working).
     def finish(inst):
+        if inst.conn._termq.empty() and not inst.conn.term.close_if_unused():
+            logger.debug("MainSrvReqHandler.finish(): Connection closed before showing anything; no terminal window to close.")
+            _put_termq(inst.conn._termq, None)      # Tells the drainer thread to exit.
+            return
         logger.debug("MainSrvReqHandler.finish(): Getting ready to close the connection's terminal window...")
-        style = tikiterm.TikiTermTextStyle(tikiterm.Yellow, tikiterm.Red)
-        inst.conn.term.put("\nCONNECTION STOPPED FUNCTIONING; CLOSING THIS TERMINAL WINDOW IN 10 SECS...\n", style)
-        time.sleep(10)
-            # Destroy the lil' terminal window for this connection that we created earlier.
-        logger.debug("MainSrvReqHandler.finish(): Now I'm going to actually close the terminal window...")
-        inst.conn.term.closewin()    
+        _put_termq(inst.conn._termq, ("\nCONNECTION STOPPED FUNCTIONING; CLOSING THIS TERMINAL WINDOW IN 10 SECS...\n", _CLOSING_STYLE))
+        _put_termq(inst.conn._termq, None)      # Tells the drainer thread to exit.
+            # Destroy the lil' terminal window for this connection that we created earlier,
+            # 10 seconds from now.  We schedule this on the shared closer thread rather
+            # than just sleeping, so that this request-handling thread can go ahead and
+            # exit right away.
+        logger.debug("MainSrvReqHandler.finish(): Scheduling the terminal window to be closed in 10 secs...")
+        _closer.schedule(10.0, inst.conn.term.closewin)
                 # Above, we are assuming that MainConnHandler.handle() has already run
-                # and has created the connection's TikiTerm window.
+                # and has set up the connection's (lazily created) TikiTerm window.
                 
 # End class MainSrvReqHandler.       
 
@@ -294,6 +596,13 @@ class MainServer(communicator.LineCommunicator):
 
     defaultAddr = (sitedefs.MY_IP, ports.COSMO_PORT)
 
+            # Listen backlog.  socketserver's default of 5 is too small
+            # when a whole sensor net powers up at once and all of its
+            # nodes try to connect in the same instant; the overflow
+            # would be refused or left to TCP's slow SYN retries.
+
+    request_queue_size = 64
+
         # The only reason we need to extend LineCommunicator's
         # __init__() here is to provide it with the server's
         # address.  Would it be cleaner to have LineCommunicator
@@ -301,8 +610,8 @@ class MainServer(communicator.LineCommunicator):
         # defined?  Not clear.  But this way takes less code.
 
     def __init__(self, cis=None, myaddr=defaultAddr, role:str=defaultRole):
-        logger.debug("MainServer.__init__(): Initializing for role [%s]."
-                     % role)
+        logger.debug("MainServer.__init__(): Initializing for role [%s].",
+                     role)
         self.cis = cis
         self.role = role
                 #-> This server attribute will get used as a base role
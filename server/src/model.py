@@ -78,7 +78,12 @@
 
         # System includes.
 
-import  threading        # SensorNet.__init__() uses RLock().
+import  sys              # SensorHost._parseMsg() uses intern().
+import  threading        # SensorNet & SensorNode use Lock().
+import  enum             # NodeStatus is an IntEnum.
+import  logging.handlers # _NodeLogBuffer is a MemoryHandler; also QueueHandler/QueueListener.
+import  queue            # _nodeLogQueue is a Queue.
+import  atexit           # Used to make sure the node-log listener gets stopped.
 
         # User includes.
 
@@ -95,13 +100,24 @@ import  wifi                        # Wi-Fi module - Contained in all nodes.
     #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
 __all__ = [         # Class definitions.  (Most of these are not actually defined yet.)
+    'NodeStatus',           # Possible values of SensorNode.status.
     'SensorNet',            # The entire local sensor network, as a whole.
     'SensorNode',           # A generic remote node in the sensor network. (Note that this server itself is not considered to be a sensor node.)
     'SensorHost',           # A component of a wireless SensorNode - the FPGA-based Nios host behind the Wi-Fi board.
+    'stopNodeLogging',      # Function: Finish writing out the nodes' log files.
     ]   # end __all__
     
 logger = logmaster.getLogger(logmaster.sysName + '.model')   # 'COSMICi.model' = object model of COSMICi system
 
+        # Where the nodes' own log messages go.  Normally each node gets its own
+        # log file (COSMICi.node0.log, etc.).  Set SHARED_NODE_LOG to True to have
+        # all nodes log to one size-rotated file instead (COSMICi.nodes.log); the
+        # logger name in each line (COSMICi.node0, ...) tells the nodes apart.
+
+SHARED_NODE_LOG         = False
+SHARED_NODE_LOG_MAXSIZE = 16*1024*1024      # Bytes per file before rotating.
+SHARED_NODE_LOG_BACKUPS = 4                 # Number of rotated-out files kept.
+
     #|=================================================================================
     #|  Class definitions.                                          [code section]
     #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
@@ -115,6 +131,184 @@ class SensorNode:           pass        # Implemented below.
 class SensorHost:           pass        # Not yet implemented.
 
 
+        #|=====================================================================
+        #|
+        #|      NodeStatus                                      [public class]
+        #|
+        #|          Enumeration of the possible values of SensorNode.status
+        #|          (see the description of that attribute, below).  These
+        #|          are small ints so that the status checks made on every
+        #|          incoming message are cheap integer compares; use .name
+        #|          to get the status as a displayable string.
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class NodeStatus(enum.IntEnum):
+    UNSEEN          = 0
+    ON              = 1
+    RUNNING         = 2
+    ON_AWOL         = 3
+    RUNNING_AWOL    = 4
+# End class NodeStatus
+
+
+        #|=====================================================================
+        #|
+        #|      _BufferedFileHandler                           [private class]
+        #|
+        #|          A FileHandler that writes through a large (64 KB)
+        #|          buffer, and doesn't flush after every record the way
+        #|          the standard one does.  The file only gets written
+        #|          when the buffer fills, or when someone calls .flush()
+        #|          -- normally our _NodeLogBuffer, once per batch.
+        #|
+        #|          The file is opened in binary append mode, and we do
+        #|          the UTF-8 encoding of each record ourselves, so there's
+        #|          no text-mode layer (locale codec, newline translation)
+        #|          in between.  Lines therefore end in "\n" on all
+        #|          platforms.
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class _BufferedFileHandler(logging.FileHandler):
+
+    def __init__(inst, filename:str, bufsize:int = 65536):
+        inst.bufsize = bufsize          # Needed by ._open(), called from FileHandler.__init__().
+        logging.FileHandler.__init__(inst, filename)
+
+    def _open(inst):
+        return open(inst.baseFilename, 'ab', buffering=inst.bufsize)    # (O_APPEND, like mode 'a'.)
+
+    def emit(inst, record:logging.LogRecord):     # Like StreamHandler.emit(), minus the flush.
+        if inst.stream is None:
+            inst.stream = inst._open()
+        try:
+            inst.stream.write((inst.format(record) + "\n").encode('utf-8'))
+        except Exception:
+            inst.handleError(record)
+# End class _BufferedFileHandler
+
+
+        #|=====================================================================
+        #|
+        #|      _NodeLogBuffer                                 [private class]
+        #|
+        #|          A MemoryHandler that, after passing its buffered records
+        #|          on to its target handler, also flushes the target, so
+        #|          that each batch of records reaches the file with a
+        #|          single write.
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class _NodeLogBuffer(logging.handlers.MemoryHandler):
+
+    def flush(inst):
+        inst.acquire()
+        try:
+            logging.handlers.MemoryHandler.flush(inst)
+            if inst.target:
+                inst.target.flush()
+        finally:
+            inst.release()
+# End class _NodeLogBuffer
+
+
+        #|=====================================================================
+        #|
+        #|      _NodeLogRouter                                 [private class]
+        #|
+        #|          Handler used by the node-log listener thread (see
+        #|          below).  It passes each record on to the handler for
+        #|          the log file of whichever node's logger it came from.
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class _NodeLogRouter(logging.Handler):
+
+    def __init__(inst):
+        logging.Handler.__init__(inst)
+        inst.routes = dict()        # Maps logger name -> that node's handler.  Copy-on-write.
+
+    def addRoute(inst, loggername:str, handler:logging.Handler):
+        routes = dict(inst.routes)
+        routes[loggername] = handler
+        inst.routes = routes
+
+    def handle(inst, record:logging.LogRecord):
+        handler = inst.routes.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+# End class _NodeLogRouter
+
+
+    #|====================================================================================
+    #|  Node log listener.                                          [code section]
+    #|
+    #|      The nodes' own log files are written by a single background
+    #|      thread, so that threads logging on a node's behalf (while they
+    #|      may be holding that node's lock) only have to queue up a record
+    #|      rather than wait for it to be written.  Each node's logger gets
+    #|      a QueueHandler feeding _nodeLogQueue; the listener takes records
+    #|      off the queue and hands them to the _NodeLogRouter, which sends
+    #|      them to the right node's _NodeLogBuffer.  The listener is started
+    #|      when the first node's logger is created.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+_nodeLogQueue       = queue.Queue()         # Unbounded, so that logging never blocks.
+_nodeLogRouter      = _NodeLogRouter()
+_nodeLogListener    = None                  # Created by _routeNodeLog() when first needed.
+_nodeLogLock        = threading.Lock()      # Guards creating/stopping the listener.
+
+    # Arrange for records logged to the logger named <loggername> to go
+    # to <handler> on the listener thread.  Returns the QueueHandler that
+    # should be attached to the logger.
+
+def _routeNodeLog(loggername:str, handler:logging.Handler):
+    global _nodeLogListener
+    _nodeLogRouter.addRoute(loggername, handler)
+    with _nodeLogLock:
+        if _nodeLogListener is None:
+            _nodeLogListener = logging.handlers.QueueListener(_nodeLogQueue, _nodeLogRouter)
+            _nodeLogListener.start()
+            atexit.register(stopNodeLogging)    # Runs before logging's own exit-time shutdown.
+    return logging.handlers.QueueHandler(_nodeLogQueue)
+
+    # Write out any node log records still queued up, and stop the
+    # listener thread.  Should be called before logging.shutdown(),
+    # so that those records are written before the files are closed.
+    # Harmless to call more than once.
+
+def stopNodeLogging():
+    global _nodeLogListener
+    with _nodeLogLock:
+        if _nodeLogListener is not None:
+            _nodeLogListener.stop()     # Processes remaining records, then joins the thread.
+            _nodeLogListener = None
+
+    # Return the (buffered) handler for the shared node log file, creating
+    # it if this is the first time.  Only used if SHARED_NODE_LOG is set.
+
+_sharedNodeLog = None
+
+def _getSharedNodeLog():
+    global _sharedNodeLog
+    with _nodeLogLock:
+        if _sharedNodeLog is None:
+            rfh = logging.handlers.RotatingFileHandler(logmaster.sysName + ".nodes.log",
+                                                       maxBytes=SHARED_NODE_LOG_MAXSIZE,
+                                                       backupCount=SHARED_NODE_LOG_BACKUPS)
+            rfh.setFormatter(logmaster.logFormatter)
+            _sharedNodeLog = _NodeLogBuffer(capacity=256, flushLevel=logging.ERROR, target=rfh)
+        return _sharedNodeLog
+
+    # Return the canonical form of a MAC address string (lower-case hex
+    # digits with no separators), for use as a key in SensorNet._mac_index.
+
+def _macKey(mac:str):
+    return mac.replace(':', '').replace('-', '').lower()
+
+
         #|=====================================================================
         #|
         #|   SensorNet                                       [public class]
@@ -142,6 +336,7 @@ class SensorHost:           pass        # Not yet implemented.
         #|  Public methods:
         #|
         #|      .nodeWithIP()   - Look up node by IP addr.
+        #|      .nodeWithMac()  - Look up node by its Wi-Fi module's MAC addr.
         #|      .nodeAt()       - Report sighting of node at an IP addr.
         #|      .verifyNode()   - Check node's IP address for consistency.
         #|      .logNode()      - Log node-specific program activity.
@@ -149,7 +344,7 @@ class SensorHost:           pass        # Not yet implemented.
         #|
         #|  Public data members:
         #|
-        #|      .writeLock  - Reentrant mutex lock for adding/removing nodes.
+        #|      .writeLock  - Mutex lock (non-reentrant) for adding/removing nodes.
         #|      .nodes - Dictionary of sensor nodes, indexed by ID.
         #|      .cis - Pointer to the main CosmicIServer application managing
         #|          this sensor network.
@@ -169,7 +364,17 @@ class SensorNet:
     #       .nodes - Dictionary of nodes seen since we last reinitialized
     #           the list.  In the future, the list of nodes will be saved
     #           persistently, so it does not have to be totally recreated
-    #           from scratch each time the server starts up.
+    #           from scratch each time the server starts up.  This dict
+    #           is never modified in place:  Writers (holding .writeLock)
+    #           build an updated copy and then rebind .nodes to it, so
+    #           readers can just grab .nodes once and use that snapshot
+    #           without taking any lock.
+    #
+    #       ._ip_index - Dictionary mapping each node's IP address to its
+    #           ID, kept in step with .nodes (and updated the same way).
+    #
+    #       ._mac_index - Likewise, mapping each node's Wi-Fi module's MAC
+    #           address (in the canonical form given by _macKey()) to its ID.
     #
     #       .cis - Pointer to the main CosmicIServer object managing this
     #           sensor network; it encapsulates the server-side functions,
@@ -204,10 +409,12 @@ class SensorNet:
 
     def __init__(self : SensorNet, cosmiciserver = None):
         # Don't need to acquire write lock b/c other threads can't see object yet.
-        self.writeLock = threading.RLock()       # Create our write lock.
+        self.writeLock = threading.Lock()        # Create our write lock.  (Never re-acquired while held, so need not be an RLock.)
         with self.writeLock:
             self.cis = cosmiciserver
             self.nodes = dict()                     # Set the node 'list' to the empty dictionary initially.
+            self._ip_index = dict()                 # Maps IP address -> node ID; see .nodeWithIP().
+            self._mac_index = dict()                # Maps MAC address -> node ID; see .nodeWithMac().
             
 #        logger.debug("Node list: [%s]" % self)
 
@@ -224,12 +431,11 @@ class SensorNet:
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
     def __str__(self:SensorNet):
-        str = ""
-        for (id,node) in self.nodes.items():    
-            str += "#%d(%s/%s): %s; " % (id, node.ipaddr, node.macaddr, node.status);
-                # Is there a possible concurrency risk while iterating above?
-                # Probably not, since all is done in CommandHandler thread.
-        return str
+        nodes = self.nodes                      # Snapshot; see .nodes above.
+        if not nodes:                           # No nodes seen yet?
+            return ""                               # Nothing to show.
+        return "".join(["#%d(%s/%s): %s; " % (id, node.ipaddr, node.macaddr, node.status.name)
+                        for (id,node) in nodes.items()])
 
 
         #|------------------------------------------------------------------
@@ -244,10 +450,26 @@ class SensorNet:
         #|      
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
-    def nodeWithIP(self:SensorNet, ip:str):                   # Possible concurrency risk while iterating?  Probably not, since all is done in CommandHandler thread.
-        for (id,node) in self.nodes.items():
-            if node.ipaddr == ip: return id
-        return None
+    def nodeWithIP(self:SensorNet, ip:str):
+        return self._ip_index.get(ip)           # Snapshot; see .nodes above.
+
+
+        #|------------------------------------------------------------------
+        #|
+        #|  .nodeWithMac()                      [public instance method]
+        #|
+        #|       If there is a node whose Wi-Fi module has MAC address
+        #|       <mac> in our node list, return its ID, else None.  The
+        #|       address may be written in any of the usual ways (upper
+        #|       or lower case, with or without ':' or '-' separators).
+        #|
+        #|  Called by:
+        #|      .nodeOn()
+        #|      
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+    def nodeWithMac(self:SensorNet, mac:str):
+        return self._mac_index.get(_macKey(mac))    # Snapshot; see .nodes above.
 
 
         #|--------------------------------------------------------------------
@@ -266,11 +488,12 @@ class SensorNet:
         
             # If there is already an entry for this node in the list, just modify it.
             
-        if id in self.nodes:
+        node = self.nodes.get(id)
+        if node is not None:
 
                 # Check to see if IP address matches. If not, update it.
 
-            if ip == self.nodes[id].ipaddr:
+            if ip == node.ipaddr:
                 logger.normal("Existing node %d at %s was powered on again." % (id, ip))
             else:
                 logger.warning("Existing node %d has powered on from a new IP address %s." % (id, ip))
@@ -278,17 +501,32 @@ class SensorNet:
                 other = self.nodeWithIP(ip)
                 if other != None:
                     logger.warning("Another node %d in our list is already using IP %s!" % (other,ip))
-                self.nodes[id].reloc(ip)
+                with self.writeLock:
+                    index = dict(self._ip_index)
+                    if index.get(node.ipaddr) == id:
+                        del index[node.ipaddr]
+                    index[ip] = id
+                    self._ip_index = index
+                    node.reloc(ip)
         else:
                 # This is a node not previously seen... Create initial data structure.
-                # We lock the list to avoid concurrency problems while adding members.
+                # We lock out other writers while adding members, and publish the
+                # updated dictionary with a single rebinding so readers never see
+                # it half-modified.
                 
-            logger.normal("New node %d seen at IP address %s." % (id, ip))
             with self.writeLock:
+                if id in self.nodes:    # Some other thread added it while we waited for the lock?
+                    return                  # Then there's nothing left for us to do.
+                logger.normal("New node %d seen at IP address %s." % (id, ip))
                 other = self.nodeWithIP(ip)
                 if other != None:
                     logger.warning("Another node %d in our list is already using IP %s!  Replacing it..." % (other,ip))
-                self.nodes[id] = SensorNode(id, ip, self)
+                nodes = dict(self.nodes)
+                nodes[id] = SensorNode(id, ip, self)
+                index = dict(self._ip_index)
+                index[ip] = id
+                self.nodes = nodes
+                self._ip_index = index
                 
     #<- End method SensorNet.nodeAt().
 
@@ -302,45 +540,51 @@ class SensorNet:
         #|  Called by:
         #|      commands.CommandHandler.handleLogMsg()
         #|      commands.CommandHandler.handleHeartbeat()
+        #|      commands.CommandHandler.handleBridgeMode()
         #|
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
         
-    def verifyNode(self:SensorNet, id:int, ip:str, when):
-        
-            # Make sure time is in displayable CoarseTimeStamp format.
-            
-        if not isinstance(when, timestamp.CoarseTimeStamp):
-            when = timestamp.CoarseTimeStamp(when)
+    def verifyNode(self:SensorNet, id:int, ip:str, when:timestamp.CoarseTimeStamp):
+
+            # This runs for every heartbeat and log message, so bind the
+            # methods we use below to locals up front.  Multi-line warnings
+            # go out as a single record, so they can't get interleaved.  (No need to convert
+            # <when>; our callers pass a Message's .time, which is already
+            # a CoarseTimeStamp.)
+
+        warn = logger.warning
 
             # Make sure the node is in our dictionary.
             
-        if not (id in self.nodes):
-            logger.warning("Received a request from %s claiming to be from node %d," % (ip, id))
-            logger.warning("\tbut there is no node with that number in our list!")
-            logger.warning("\tGoing ahead and adding it...")
+        node = self.nodes.get(id)
+        if node is None:
+            warn("Received a request from %s claiming to be from node %d,\n"
+                 "\tbut there is no node with that number in our list!\n"
+                 "\tGoing ahead and adding it...", ip, id)
             self.nodeAt(id, ip)     # Make a note that we saw the node at this IP address.
             
-            # At this point, id must be in the dictionary.  Assert this.
-            
-        assert id in self.nodes, "Node %d is not in the dictionary even though we just ensured it would be!" % id
+                # At this point, id must be in the dictionary.  Assert this.
+
+            node = self.nodes.get(id)
+            assert node is not None, "Node %d is not in the dictionary even though we just ensured it would be!" % id
 
             # Check that the IP address is as expected, and that we saw this node previously.
         
-        if self.nodes[id].ipaddr != ip:
-            logger.warning("Received a request from %s claiming to be from node %d," % (ip,id))
-            logger.warning("\tbut the IP address we have on file for that node is %s!" % self.nodes[id].ipaddr)
-        elif self.nodes[id].status == 'UNSEEN':
-            logger.warning("Received a request from %s claiming to be from node %d," % (ip,id))
-            logger.warning("\tbut we haven't even seen that node's power-on message yet!")
+        if node.ipaddr != ip:
+            warn("Received a request from %s claiming to be from node %d,\n"
+                 "\tbut the IP address we have on file for that node is %s!", ip, id, node.ipaddr)
+        elif node.status == NodeStatus.UNSEEN:
+            warn("Received a request from %s claiming to be from node %d,\n"
+                 "\tbut we haven't even seen that node's power-on message yet!", ip, id)
                 # We know it's on now, but we don't know when it was turned on.
-            self.nodes[id].isOn()
+            node.isOn()
 #- The following is commented out b/c it is the expected behavior, not worth logging all the time.
 #        else:
 #            logger.debug("Looks like node %d is still sending from IP %s." % (id, ip))
 
             # Record that we saw a message from this node at this time.
             
-        self.nodes[id].sawAt(when)
+        node.sawAt(when)
 
     #<- End method SensorNet.verifyNode().
 
@@ -352,27 +596,37 @@ class SensorNet:
         #|       Cause subsequent log messages to be labeled, in their
         #|       'component' field, with the name of the given node.
         #|       This allows for easier searching of node-related items
-        #|       in the log.
-        #|
-        #|  Called by:
-        #|      .nodeOn()
+        #|       in the log.  (To label just a block of code, use
+        #|       "with logmaster.component(...)" instead, as .nodeOn()
+        #|       does, so the old component gets put back afterwards.)
         #|
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
         
     def logNode(self:SensorNet, num:int):
 
-            # Compose component name string.
-            
-        compName = "node #%d" % num
-
             # Assuming that the current thread is a logging.ThreadActor,
             # (or at least a "hired" worker) set the component name
-            # in the thread's logging context to the name.
+            # in the thread's logging context to the node's name.
             
-        logmaster.setComponent(compName)
+        logmaster.setComponent(self._componentName(num))
         
     # end def logNode
 
+        # Component name for node <num> in the logging context.
+        # Used by .logNode() and .nodeOn().
+
+    def _componentName(self:SensorNet, num:int):
+
+            # Get the component name string.  Known nodes keep theirs
+            # pre-formatted; we only have to compose one for a node we
+            # haven't created yet (e.g. at the start of .nodeOn()).
+            
+        node = self.nodes.get(num)
+        if node is not None:
+            return node._logComponent
+        else:
+            return "node #%d" % num
+
 
         #|---------------------------------------------------------------------
         #|
@@ -388,39 +642,55 @@ class SensorNet:
         
     def nodeOn(self:SensorNet, num:int, ip:str, mac:str, when):
 
-            # Temporarily set the component name in the current thread's logging
-            # context to the node name.  We need to set it back to server later.
-            # (This is redundant with parseNodeNum, but we leave it here since the
-            # model could be called by someone other than the command handler.)
-
-        self.logNode(num)
+            # Set the component name in the current thread's logging context
+            # to the node name while we work on it; it's restored afterwards.
+            # (The command handler sets it in parseNodeNum too, but the model
+            # could be called by someone other than the command handler.)
 
+        with logmaster.component(self._componentName(num)):
+            logger.debug("SensorNet.nodeOn(): Noting that node %d powered on at IP address %s and MAC address %s at %s.",
+                         num, ip, mac, when)
         
-        logger.debug("SensorNet.nodeOn(): Noting that node %d powered on at IP address %s and MAC address %s at %s." %
-                     (num, ip, mac, when))
-        
-            # First note the fact that node <num> is transmitting from addr <ip>.
-            # This adds its model to the data structure if it was not there already.
+                # First note the fact that node <num> is transmitting from addr <ip>.
+                # This adds its model to the data structure if it was not there already.
             
-        self.nodeAt(num, ip)
+            self.nodeAt(num, ip)
         
-            # Also, note the node's MAC address.
+                # Also, note the node's MAC address, and index the node by it.
+                # (If some other node had that MAC address before, its Wi-Fi
+                # module must have been moved to this node.)
+
+            key = _macKey(mac)
+            other = self._mac_index.get(key)
+            if other is not None and other != num:
+                logger.warning("Node %d's Wi-Fi module has MAC address %s, which node %d had before!"
+                               % (num, mac, other))
+            if other != num:
+                with self.writeLock:
+                    index = dict(self._mac_index)
+                    oldmac = self.nodes[num].macaddr
+                    if oldmac is not None and index.get(_macKey(oldmac)) == num:
+                        del index[_macKey(oldmac)]
+                    index[key] = num
+                    self._mac_index = index
             
-        self.nodes[num].setMac(mac)
+            self.nodes[num].setMac(mac)
         
-            # At this point we know that the node's data structure exists,
-            # and that its recorded IP address & MAC address are current.
-            # All that remains is to record the actual turn-on event.
+                # At this point we know that the node's data structure exists,
+                # and that its recorded IP address & MAC address are current.
+                # All that remains is to record the actual turn-on event.
             
-            # Since the node has just turned on, it will be shortly trying
-            # to create its AUXIO and UART bridge connections; the servers
-            # to handle these are also created by this method.
+                # Since the node has just turned on, it will be shortly trying
+                # to create its AUXIO and UART bridge connections; the servers
+                # to handle these are also created by this method.
             
-        self.nodes[num].turnOn(when)
+            self.nodes[num].turnOn(when)
         
-            # For debugging purposes, print the new node-list data structure.
+                # For debugging purposes, print the new node-list data structure.
+                # (Only if someone's listening, since this walks all the nodes.)
             
-        logger.debug("New node list: [%s]" % self)
+            if logger.isEnabledFor(logmaster.logging.DEBUG):
+                logger.debug("New node list: [%s]", self)
 
     # End method SensorNet.nodeOn().
 # End class SensorNet
@@ -487,10 +757,23 @@ class SensorNode(MutableClass):
     #|
     #|   INSTANCE DATA MEMBERS:
     #|   
-    #|       writelock:threading.RLock    [Add similar to WiFiBoard & FPGABoard.]
+    #|       _status_lock:threading.Lock    [Add similar to WiFiBoard & FPGABoard.]
+    #|
+    #|           Threads should acquire this lock before modifying the
+    #|           node's status, onAt or lastSeen attributes.
     #|
-    #|           Threads should acquire this lock before modifying any
-    #|           of the node's attributes.  NOTE: It's a re-entrant lock.
+    #|       _id_lock:threading.Lock
+    #|
+    #|           Threads should acquire this lock before modifying the
+    #|           node's ipaddr attribute.  (.setMac() doesn't need it for
+    #|           macaddr, since that's a single assignment.)  Having this separate
+    #|           from _status_lock keeps the frequent status updates (one
+    #|           per message received) from contending with these.
+    #|
+    #|           Readers don't need either lock.  NOTE: Neither is a
+    #|           re-entrant lock, so methods holding one must not call
+    #|           other methods that acquire it.  If both are needed, take
+    #|           _id_lock first.
     #|
     #|       net:SensorNet
     #|
@@ -527,9 +810,9 @@ class SensorNode(MutableClass):
     #|
     #|           [ ] TO DO: Move this to member class WiFi_Module.
     #|
-    #|       status:str
+    #|       status:NodeStatus
     #|
-    #|           The node's status, as far as we know, one of these strings:
+    #|           The node's status, as far as we know, one of these values:
     #|
     #|               UNSEEN - We haven't heard from this node at all
     #|                           yet in the current server session.
@@ -605,6 +888,26 @@ class SensorNode(MutableClass):
     #|
     #|----------------------------------------------------------------------------------------------------
 
+        # What status an AWOL node goes back to when we hear from it again.
+        # Used by .sawAt().
+
+    _AWOL_RECOVERY = {
+        NodeStatus.ON_AWOL:         NodeStatus.ON,
+        NodeStatus.RUNNING_AWOL:    NodeStatus.RUNNING,
+        }
+
+            # Give the data members above fixed slots, so that the per-message
+            # accesses to them (.ipaddr, .status, .lastSeen ...) skip the instance
+            # dict.  We still inherit a __dict__ from MutableClass, which we need:
+            # ctu.CTU_Host makes the node .become() a CTU_Node and then hangs extra
+            # members (.gps_module, .gps_manager) on it, and a subclass can only
+            # take over an object whose layout matches, so subclasses shouldn't
+            # declare __slots__ of their own.
+
+    __slots__ = ('_status_lock', '_id_lock', 'nodenum', 'ipaddr', 'macaddr',
+                 'net', 'status', 'onAt', 'lastSeen', 'wifi_module',
+                 'sensor_host', 'logger', '_logComponent', '_logPrefix')
+
         #|-----------------------------------------------------------------------------
         #|
         #|   SensorNode.__init__()                  [special instance method]
@@ -629,43 +932,47 @@ class SensorNode(MutableClass):
 
             # Initialize instance variables.
         
-        self.writelock = threading.RLock()    # Create our write lock.       
-                #-Don't need to acquire write lock right away b/c other threads can't see object yet.
-
-            # But, do it anyway, out of paranoia.  (Maybe they got it between __new__ & __init__.)
-
-        with self.writelock:
-
-                # Here, we need to create the new .wifi_module component, and
-                # delegate this work to it.  However, that needs to be tested,
-                # since moving these attributes could break something elsewhere
-                # in the program.  I should have defined them as private fields
-                # originally, and then just defined properties to access them.
-                # Oh well.  Refactoring code is always a pain.
-            
-            self.nodenum        = num       # Node number: Normally, 0-4 (maybe larger).
-            self.ipaddr         = ip        # IP address of node on local WiFi net
-            self.net            = net       # The SensorNet structure that this node is part of.
-            self.status         = 'UNSEEN'  # Mark it as UNSEEN until we hear from it.
+        self._id_lock = threading.Lock()        # Create our write locks.
+        self._status_lock = threading.Lock()
+
+            # No need to hold them while we initialize ourselves, though:  No
+            # other thread can see this object until our caller (SensorNet.nodeAt())
+            # publishes it in the node dictionary, after we return.  (The sub-objects
+            # created below keep a pointer to us, but don't hand it out to anyone.)
+
+            # Here, we need to create the new .wifi_module component, and
+            # delegate this work to it.  However, that needs to be tested,
+            # since moving these attributes could break something elsewhere
+            # in the program.  I should have defined them as private fields
+            # originally, and then just defined properties to access them.
+            # Oh well.  Refactoring code is always a pain.
+        
+        self.nodenum        = num       # Node number: Normally, 0-4 (maybe larger).
+        self.ipaddr         = ip        # IP address of node on local WiFi net
+        self.macaddr        = None      # MAC address of its Wi-Fi module; not known until .setMac().
+        self.net            = net       # The SensorNet structure that this node is part of.
+        self.status         = NodeStatus.UNSEEN  # Mark it as UNSEEN until we hear from it.
+        self.onAt           = None      # When it last turned on; not known until .turnOn().
+        self.lastSeen       = None      # When we last heard from it; likewise.
+        self._logComponent  = "node #%d" % num     # Logging-context component name; see SensorNet.logNode().
+        self._logPrefix     = "Node %d" % num      # How our own log messages refer to this node.
+        
+            # NOTE: Some of the above code may eventually be removed because
+            # it will now be the responsibility of the new WiFi module below.
             
-                # NOTE: Some of the above code may eventually be removed because
-                # it will now be the responsibility of the new WiFi module below.
-                
-                # Create the node-specific logger (i.e., logging channel).
+            # Create the node-specific logger (i.e., logging channel).
 
-            self._create_logger()
+        self._create_logger()
+        
+            # Create a sub-object representing the Wi-Fi module component
+            # of this node, initialized appropriately.
             
-                # Create a sub-object representing the Wi-Fi module component
-                # of this node, initialized appropriately.
-                
-            self.wifi_module    = wifi.WiFi_Module(self, num, ip)
-
-                # Create a sub-object representing the host (main computer)
-                # at this sensor node; initialize this object appropriately.
+        self.wifi_module    = wifi.WiFi_Module(self, num, ip)
 
-            self.sensor_host    = SensorHost(self)
+            # Create a sub-object representing the host (main computer)
+            # at this sensor node; initialize this object appropriately.
 
-        #<- End 'with self.writelock'.
+        self.sensor_host    = SensorHost(self)
 
             # Insert a little header into the node's log file to delimit the start of the log.
         
@@ -685,14 +992,29 @@ class SensorNode(MutableClass):
         #|
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
     
-    def _create_logger(self):
-        with self.writelock:
-            loggername = logmaster.sysName + ('.node%d' % self.nodenum)     # This will look like 'COSMICi.node0'
-            self.logger = logmaster.getLogger(loggername)                   # Create logger just for this node's log messages.            
-            lfh = logmaster.logging.FileHandler(loggername + ".log")        # A filehandler to log this node's log messages to its own log file ('COSMICi.node0.log').
-            lfh.setFormatter(logmaster.logFormatter)                        # Tell this filehandler to use logmaster's default log formatter.
-            self.logger.logger.addHandler(lfh)                              # Tell our logger to use that new filehandler.
-            self.logger.logger.setLevel(logmaster.logging.DEBUG)            # Have it log ALL log messages sent by this node (including debug).            
+    def _create_logger(self):       # Only called from __init__(), before anyone else can see us.
+        loggername = logmaster.sysName + ('.node%d' % self.nodenum)     # This will look like 'COSMICi.node0'
+        self.logger = logmaster.getLogger(loggername)                   # Create logger just for this node's log messages.            
+
+        if SHARED_NODE_LOG:     # All nodes share one log file?  Then just use that.
+            mh = _getSharedNodeLog()
+        else:
+            lfh = _BufferedFileHandler(loggername + ".log")             # A filehandler to log this node's log messages to its own log file ('COSMICi.node0.log').
+            lfh.setFormatter(logmaster.logFormatter)                    # Tell this filehandler to use logmaster's default log formatter.
+
+                # Rather than writing each record to the file as it comes in, collect
+                # them in a MemoryHandler and pass them on to the filehandler in bulk.
+                # The buffer gets flushed when it fills, when an ERROR or worse comes
+                # in, and at logging.shutdown() (which also runs at exit).
+            
+            mh = _NodeLogBuffer(capacity=256, flushLevel=logging.ERROR, target=lfh)
+
+            # And rather than have the logging thread do even that, just queue
+            # the record up for the node-log listener thread to deal with.
+            
+        qh = _routeNodeLog(loggername, mh)
+        self.logger.logger.addHandler(qh)                               # Tell our logger to use that new (queued, buffered) filehandler.
+        self.logger.logger.setLevel(logmaster.logging.DEBUG)            # Have it log ALL log messages sent by this node (including debug).            
         
 
         #|---------------------------------------------------------------------------------
@@ -710,7 +1032,7 @@ class SensorNode(MutableClass):
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
         
     def reloc(self, ip):
-        with self.writelock:
+        with self._id_lock:
             
                 # The following line will eventually be removed because WiFi_Module will track IP instead.
                 
@@ -730,8 +1052,8 @@ class SensorNode(MutableClass):
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
     def isOn(self):
-        with self.writelock:
-            self.status = 'ON'
+        with self._status_lock:
+            self.status = NodeStatus.ON
     
 
         #|--------------------------------------------------------------------------------
@@ -750,17 +1072,16 @@ class SensorNode(MutableClass):
     def turnOn(self, when):
         
             # Make sure time is in displayable CoarseTimeStamp format.
-        if  not isinstance(when, timestamp.CoarseTimeStamp):
-            when = timestamp.CoarseTimeStamp(when)
+        when = timestamp.CoarseTimeStamp.coerce(when)
 
             # Log this event at NORMAL level (also displays on console).    
-        logger.normal("Node %d turned on at %s." % (self.nodenum, when))
+        logger.normal("%s turned on at %s." % (self._logPrefix, when))
 
             # Thread-safely initialize various fields.
             
-        with  self.writelock:       # Acquire our write lock.
+        with  self._status_lock:    # Acquire our status lock.
             
-            self.isOn()                 # Mark node status as ON.
+            self.status     = NodeStatus.ON  # Mark node status as ON.  (Not via .isOn(); we hold the status lock.)
             self.onAt       = when      # Record node's turn-on time.
             self.lastSeen   = when      # Which is also its last-seen time.
 
@@ -768,7 +1089,7 @@ class SensorNode(MutableClass):
                 #- Tell the model Wi-Fi module that this node has turned on.
                 #   This then creates the listeners for the expected new connections.
             
-        #<-- End with node lock.
+        #<-- End with status lock.
             
     #<-- End method SensorNode.turnOn().
 
@@ -785,16 +1106,18 @@ class SensorNode(MutableClass):
         
     def sawAt(self, when):
         # Make sure time is in displayable CoarseTimeStamp format.
-        if not isinstance(when, timestamp.CoarseTimeStamp):
-            when = timestamp.CoarseTimeStamp(when)
+        when = timestamp.CoarseTimeStamp.coerce(when)
 #        logger.debug("Remembering that we saw node %d at time %s." % (self.nodenum, str(when)))
-        with self.writelock:
-            self.lastSeen = when
-            # Also mark the node as no longer being AWOL, if it is so marked.
-            if self.status == 'ON_AWOL':
-                self.status = 'ON'
-            elif self.status == 'RUNNING_AWOL':
-                self.status = 'RUNNING'
+        # This happens for every message from the node, so avoid the lock in
+        # the usual case.  A single attribute assignment is atomic anyway.
+        self.lastSeen = when
+        # Also mark the node as no longer being AWOL, if it is so marked.
+        # Only then do we need the lock (and have to re-check under it).
+        if self.status in self._AWOL_RECOVERY:
+            with self._status_lock:
+                newStatus = self._AWOL_RECOVERY.get(self.status)
+                if newStatus is not None:
+                    self.status = newStatus
 #        logger.debug("Node %d's status is currently: %s" % (self.nodenum, self.status))
 
 
@@ -808,18 +1131,19 @@ class SensorNode(MutableClass):
 
     def setMac(self, mac):
         
-        logger.normal("Node %d reports its MAC address is %s." % (self.nodenum, mac))
+        logger.normal("%s reports its MAC address is %s." % (self._logPrefix, mac))
         
-        with self.writelock:       # Not necessary since assignment is atomic.
+            # No need for our ID lock here:  The MAC address is the only thing we
+            # change, and a single attribute assignment is atomic.  (The Wi-Fi
+            # module model takes its own lock in .hasMac().)  Only the command
+            # handler thread calls this, so the two copies can't get out of step.
             
-            self.macaddr = mac          # Set mac address to given value.
+        self.macaddr = mac          # Set mac address to given value.
 
-                # In future, the above line may be removed since the model of the Wi-Fi module
-                # will henceforth be responsible for remembering the MAC address information.
+            # In future, the above line may be removed since the model of the Wi-Fi module
+            # will henceforth be responsible for remembering the MAC address information.
 
-            self.wifi_module.hasMac(mac)    # Tell the model of the Wi-Fi module what its MAC addr is.
-
-        #<-- End with node lock.
+        self.wifi_module.hasMac(mac)    # Tell the model of the Wi-Fi module what its MAC addr is.
             
     #<-- End method SensorNode.setMac().
             
@@ -927,12 +1251,22 @@ class SensorHost(MutableClass):
         # are of unknown type initially.  They should become instances
         # of a derived class once we learn their type.
 
+        # Fixed slots for the data members set up in __init__(), as for
+        # SensorNode.  Again we keep MutableClass's __dict__, since we
+        # .become() subclasses (CTU_Host, ShowerDetectorHost) that add
+        # members of their own in ._convertFrom(); those subclasses
+        # shouldn't declare __slots__, so their layout stays compatible.
+
+    __slots__ = ('_lock', 'node', 'nodenum', '_hostPrefix', 'hostType',
+                 'starting', 'ready', '_dispatch')
+
     def __init__(this, node:SensorNode):
         this._lock = threading.RLock()
         with this._lock:
             
             this.node = node                        # Remember the node object we're a part of.
             this.nodenum = node.nodenum             # Remember the node number.
+            this._hostPrefix = "Node #%d's host" % node.nodenum     # How our log messages refer to this host.
             
             this.hostType = None                    # Host type is initially unknown.
 #            this.sensorHostType = 'UNKNOWN'         # Same info in another form.
@@ -940,6 +1274,8 @@ class SensorHost(MutableClass):
             this.starting = flag.Flag(this._lock)   # Create "starting" flag (initially false).
             this.ready = flag.Flag(this._lock)      # Create "ready" flag (initially false).
 
+            this._dispatch = this._DISPATCH         # Our class's message dispatch table; see .become().
+
             MutableClass.__init__(this)     # Superclass initializer.
 
 # Following is no longer needed now that SensorHost is a subclass of class MutableClass.
@@ -953,6 +1289,14 @@ class SensorHost(MutableClass):
 
     #<- End def __init__().
 
+        # Extend MutableClass.become() to also pick up the new class's message
+        # dispatch table, so ._handleHostMsg() can find it directly on the
+        # instance.
+
+    def become(this, newClass:type, *args, **kwargs):
+        MutableClass.become(this, newClass, *args, **kwargs)
+        this._dispatch = newClass._DISPATCH
+
         #|--------------------------------------------------------------------
         #|
         #|      sentMessage()                   [public instance method]
@@ -1038,8 +1382,8 @@ class SensorHost(MutableClass):
                           "I will be unable to do anything with data from this host.") % hostType)
             return
 
-        logger.normal("Node #%d's host (type %s, firmware version %s) is starting up..." %
-                      (this.nodenum, hostType, verID))
+        logger.normal("%s (type %s, firmware version %s) is starting up..." %
+                      (this._hostPrefix, hostType, verID))
 
         this.isType(sensorHostType)     # Actually change the sensorHostType of this instance.
         this.starting.rise()            # Raise the "starting" flag for this host.
@@ -1051,7 +1395,7 @@ class SensorHost(MutableClass):
 
     def _handleHostReady(this):
 
-        logger.normal("Node #%d's host is ready to accept commands." % this.nodenum)
+        logger.normal("%s is ready to accept commands." % this._hostPrefix)
 
         with this._lock:
             this.starting.fall()    # Lower the 'starting' flag for this host model.
@@ -1070,7 +1414,9 @@ class SensorHost(MutableClass):
         #|                  present) already verified and stripped.
         #|
         #|              2. The message has already been broken into
-        #|                  words on comma (",") delimiters.
+        #|                  words on comma (",") delimiters, and the
+        #|                  first word (the message type) is also
+        #|                  passed separately, as <msgType>.
         #|
         #|              3. We have already verified that this is not
         #|                  a message of a type that the host is just
@@ -1113,42 +1459,52 @@ class SensorHost(MutableClass):
         #|
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
-    def _handleHostMsg(this, msgWords):     
+    def _handleHostMsg(this, msgType, msgWords):     
 
-        logger.debug("SensorHost._handleHostMsg(): Handling host message [%s]..." % str(msgWords))
+        logger.debug("SensorHost._handleHostMsg(): Handling host message [%s]...", msgWords)
     
-            # We'll interpret the first field as the message type designator.
+            # The caller has already taken the first field as the message type
+            # designator.  Look up its handler in our class's dispatch table (see
+            # _DISPATCH at the end of the class definition).  Subclasses that
+            # understand additional message types extend the table.
 
-        msgType = msgWords[0]
+        handler = this._dispatch.get(msgType)
 
-            # Dispatch based on message type.
+        if handler is None:
+            logger.warn("SensorHost._handleHostMsg(): Unknown host message type [%s]. Ignoring..." % msgType)
+            return
 
-        if msgType == 'HOST_STARTING':
-            this._handleHostStarting(msgWords)
+        handler(this, msgWords)
 
-        elif msgType == 'HOST_READY':
-            this._handleHostReady()              # No arguments.
+    #<- _handleHostMsg()
 
-        elif msgType == 'ACK':      # Host acknowledging a message from the Wi-Fi (or from us).
-            logger.info("SensorHost._handleHostMsg(): Host acknowledges receiving message %s." % str(msgWords[1:]))
+        # HOST_READY takes no arguments; subclasses override ._handleHostReady()
+        # itself, so the dispatch table goes through here to pick that up.
 
-        elif msgType == 'ERR':      # Host is reporting its own error condition that we can log.
-            logger.error("SensorHost._handleHostMsg(): Sensor host reports a %s error with data [%s]." % (msgWords[1], msgWords[2]))
-                #   |
-                #  Really, what would make even more sense here would be to have created a logging channel just for
-                #  host errors, with an associated log file.  The logging channel name would be something like
-                #  COSMICi.node0.host.  The ERR messages could be extended to include logging-level information so
-                #  we could handle them similarly to the LOGMSG messages received from the Wi-Fi script on the
-                #  mainserver connection.  Likewise, there could be a logging channel COSMICi.node0.GPS to record
-                #  GPS-related conditions.
+    def _handleHostReadyMsg(this, msgWords):
+        this._handleHostReady()
 
-        else:
-            logger.warn("SensorHost._handleHostMsg(): Unknown host message type [%s]. Ignoring..." % msgType)
+        # Handles the ACK message:  Host acknowledging a message from the Wi-Fi (or from us).
 
-    #<- _handleHostMsg()
+    def _handleAck(this, msgWords):
+        logger.info("SensorHost._handleHostMsg(): Host acknowledges receiving message %s.", msgWords[1:])
+
+        # Handles the ERR message:  Host is reporting its own error condition that we can log.
+
+    def _handleErr(this, msgWords):
+        logger.error("SensorHost._handleHostMsg(): Sensor host reports a %s error with data [%s].", msgWords[1], msgWords[2])
+            #   |
+            #  Really, what would make even more sense here would be to have created a logging channel just for
+            #  host errors, with an associated log file.  The logging channel name would be something like
+            #  COSMICi.node0.host.  The ERR messages could be extended to include logging-level information so
+            #  we could handle them similarly to the LOGMSG messages received from the Wi-Fi script on the
+            #  mainserver connection.  Likewise, there could be a logging channel COSMICi.node0.GPS to record
+            #  GPS-related conditions.
 
         # Parse an incoming message.  Processes NMEA decorations, checksum,
-        # and fields.  Returns the sequence of message words.
+        # and fields.  Returns a pair (msgType, msgWords) of the message type
+        # (the first word) and the sequence of message words, or (None, None)
+        # if there was nothing usable in the message.
 
     def _parseMsg(this, msg:communicator.Message):
         
@@ -1171,9 +1527,9 @@ class SensorHost(MutableClass):
 
             # First, make sure it's not an empty string.  (If so, emit a warning & return.)
 
-        if msgStr == None or msgStr == "":
+        if not msgStr:
             logger.info("SensorHost._parseMsg(): Given empty message; ignoring...")
-            return None
+            return (None, None)
 
             # Next, if it's an NMEA-formatted sentence, strip the $* stuff off of it
             # and verify any checksum in the process.
@@ -1182,18 +1538,19 @@ class SensorHost(MutableClass):
             msgStr = nmea.stripNMEA(msgStr)     # Warning: This may throw an nmea.BadChecksum exception.
         except nmea.BadChecksum:
             logger.error("SensorHost._parseMsg(): Checksum failed on line [%s]; ignoring line..." % msgStr)
-            return None     # Indicates no good data.            
+            return (None, None)     # Indicates no good data.            
                          
             # Really we ought to catch this here with a try/except and do something sensible with it.
 
-        logger.debug("SensorHost._parseMsg(): After stripping any NMEA framing I got the message [%s]." % msgStr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SensorHost._parseMsg(): After stripping any NMEA framing I got the message [%s].", msgStr)
 
             # If nothing is left after stripping the NMEA decorations,
             # then return early.
 
-        if msgStr == "":
+        if not msgStr:
             logger.warn("SensorHost._parseMsg(): Message empty after stripping away NMEA framing; ignoring...")
-            return
+            return (None, None)
 
             # Special case:  If the message begins with "PDMEHEADER",
             # then replace ": " with "," so that the following split()
@@ -1203,18 +1560,29 @@ class SensorHost(MutableClass):
             msgStr = msgStr.replace(": ", ",")
 
             # At this point, we have a presumably comma-separated host message.
-            # Split it at the commas.
+            # Peel off the first field (the message type) first, and intern it.
+            # There are only a handful of message types, and the dispatch-table
+            # keys they get looked up against are interned (as literals), so the
+            # lookups can then match on identity alone.
+
+        (msgType, sep, args) = msgStr.partition(',')
+        msgType = sys.intern(msgType)
 
-        msgWords = msgStr.split(',')        # Create array of fields that were separated by commas.
+            # Then split the rest at the commas, if there is any rest.
 
-            # Special case:  If the message begins with "CON_PULSE",
-            # then unsplit everything after argument 6, since it is
-            # a nested list of the form "(0,(1,(2,9),5),8)".
+        if not sep:                         # No arguments (e.g. HOST_READY)?
+            msgWords = [msgType]                # Then there's nothing to split.
+            
+            # Special case:  If the message type is "CON_PULSE", then don't
+            # split anything after argument 6, since it is a nested list of
+            # the form "(0,(1,(2,9),5),8)" and needs to be kept in one piece.
 
-        if msgStr.startswith("CON_PULSE"):
-            msgWords[7:] = [unsplit(msgWords[7:], ",")]
+        elif msgType == "CON_PULSE":
+            msgWords = [msgType] + args.split(',', 6)   # At most 7 arguments; the last one is the rest of the line.
+        else:
+            msgWords = [msgType] + args.split(',')      # Create array of fields that were separated by commas.
 
-        return msgWords     # Return that sequence of words.
+        return (msgType, msgWords)      # Return the message type & the sequence of words.
 
         #|--------------------------------------------------------------------
         #|
@@ -1235,27 +1603,35 @@ class SensorHost(MutableClass):
 
     def _handleMsg(this, msg:communicator.Message):
 
-        msgWords = this._parseMsg(msg)  # Parse the message into fields.
+        (msgType, msgWords) = this._parseMsg(msg)  # Parse the message into fields.
 
             # If message was empty, don't bother doing anything else.
 
-        if msgWords == None:
+        if msgWords is None:
             logger.info("SensorHost._handleMsg(): Empty message; ignoring...")
             return
 
-            # We'll interpret the first field as the message type designator.
-
-        msgType = msgWords[0]
-
             # Assume it's a message originated by the host, rather than
             # some other component, because since we don't know what type
             # of host this is yet, we don't know what other types of components
             # it might contain and thus what other message types to look for.
 
-        this._handleHostMsg(msgWords)
+        this._handleHostMsg(msgType, msgWords)
             
     #<- End def SensorHost._handleMsg().
 
+        # Dispatch table mapping each host message type we know how to handle
+        # to its (unbound) handler method.  Used by ._handleHostMsg().  Subclasses
+        # that handle more message types should define their own _DISPATCH,
+        # starting from a copy of this one.
+
+    _DISPATCH = {
+        'HOST_STARTING':    _handleHostStarting,
+        'HOST_READY':       _handleHostReadyMsg,
+        'ACK':              _handleAck,
+        'ERR':              _handleErr,
+        }
+
 #<- End class SensorHost
 
     # Object-model modules for specific types of sub-components of the system.
@@ -8,16 +8,31 @@
 #|
 #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
+import functools        # calcCRC() uses reduce().
+import operator         # calcCRC() uses xor().
+
 __all__ = ['BadChecksum',   # Exceptions
            'isNMEA',        # Functions.
            'getCRC',
            'calcCRC',
            'stripNMEA',
+           'verifyBatch',
            'makeNMEA',
            ]
 
 class BadChecksum(Exception): pass      # NMEA checksum doesn't match.
 
+    # Table mapping each two-hex-digit string ('00'-'ff', in any mix
+    # of upper and lower case) to its value, so that checksums can be
+    # decoded with a dictionary lookup instead of a call to int().
+    # Only malformed checksums miss the table.
+
+_HEXBYTE = {}
+for _hi in '0123456789abcdefABCDEF':
+    for _lo in '0123456789abcdefABCDEF':
+        _HEXBYTE[_hi + _lo] = int(_hi + _lo, 16)
+del _hi, _lo
+
     # Given a string, is it potentially an NMEA-formatted sentence?
 
 def isNMEA(line:str):
@@ -25,31 +40,62 @@ def isNMEA(line:str):
 
     # Given an NMEA-formatted sentence, return the two-nibble hex
     # checksum at the end of it, if present.  The value is returned
-    # as an integer in the range 0-255.
+    # as an integer in the range 0-255.  Like calcCRC(), this also
+    # accepts the sentence as bytes (or a bytearray/memoryview), so
+    # that a raw buffer can be checked without first decoding it.
 
-def getCRC(sent:str):
+def getCRC(sent):
 
     length = len(sent)  # Get the length of the string.
     
     if length < 3:      # Less than 3 characters?  Can't have a checksum.
         return None
 
-    if sent[-3] != '*': # If 3rd character from end of string isn't an asterisk,
-        return None     # then there's no checksum and we're done.
+    if isinstance(sent, str):
+        if sent[-3] != '*': # If 3rd character from end of string isn't an asterisk,
+            return None     # then there's no checksum and we're done.
+        last2 = sent[-2:]   # Get the last two characters of the string.
+    else:
+        if sent[-3] != 0x2A:    # Same, for bytes; 0x2A is ord('*').
+            return None
+        last2 = str(sent[-2:], 'ascii')     # Only these two bytes need decoding.
 
-    last2 = sent[-2:]     # Get the last two characters of the string.
-
-    return int(last2, 16)   # Convert to integer as base-16.
+    crc = _HEXBYTE.get(last2)   # Look up its value as a base-16 integer.
+    if crc is None:             # Not hex?  Let int() have a go at it (it
+        crc = int(last2, 16)    #   raises ValueError if it's really not hex).
+    return crc
 
     # Calculate and return the NMEA CRC/checksum (xor of byte values)
-    # of the given string (not already decorated with $*).
+    # of the given string (not already decorated with $*).  The
+    # data may also be given as bytes (or a bytearray/memoryview),
+    # in which case we use it as-is instead of encoding a copy.
+    #   For long strings, instead of XORing one byte at a time, we
+    # treat the whole byte array as one big integer and repeatedly
+    # XOR its top half into its bottom half until a single byte is
+    # left; this takes only log2(n) (C-level) big-integer operations.
+    # For strings of ordinary sentence length the plain reduce() is
+    # just as fast, so we only switch over above _WIDE_CRC_MINLEN.
+
+_WIDE_CRC_MINLEN = 128      # Crossover length (in bytes), measured roughly.
+
+_reduce = functools.reduce  # Bind these once, so calcCRC() doesn't have to
+_xor    = operator.xor      #   look them up in their modules on every call.
+
+def calcCRC(data):
+    if isinstance(data, str):
+        codes = data.encode()   # Convert string to byte array.
+    else:
+        codes = data            # Already bytes-like; no copy needed.
+    
+    if len(codes) < _WIDE_CRC_MINLEN:
+        return _reduce(_xor, codes, 0)     # XOR all the bytes together (starting from 0), in C.
 
-def calcCRC(bareStr:str):
-    codes = bareStr.encode()    # Convert string to byte array.
-    crc = 0                     # Initialize checksum to 0.
-    for byte in codes:          # Go through array,
-        crc ^= byte             # XOR'ing each byte into checksum.
-    return crc                  # Return result.
+    nbits = 8 << (len(codes) - 1).bit_length()      # Width rounded up to a power-of-2 number of bytes.
+    word = int.from_bytes(codes, 'little')          # The whole array as one (zero-padded) integer.
+    while nbits > 8:
+        nbits >>= 1
+        word = (word >> nbits) ^ (word & ((1 << nbits) - 1))   # Fold top half into bottom half.
+    return word
 
     # Given a possible NMEA sentence, with or without a checksum
     # present, if the checksum is present then verify it (and
@@ -62,41 +108,49 @@ def calcCRC(bareStr:str):
 
 def stripNMEA(line:str):
 
+        # This is on the path of every message received from the nodes,
+        # so the tests done by isNMEA() and getCRC() are written out
+        # inline here, to save two Python function calls per line.
+
         # First, if the line doesn't begin with a dollar sign '$'
         # then it's not an NMEA sentence at all; just return it.
 
-    if not isNMEA(line):
+    if line[:1] != '$':     # (Works for the empty string too.)
         return line
 
         # At this point we know that there's a dollar sign at the
-        # start.  Let's go ahead and strip it off (we don't need
-        # it any more.
+        # start.  Let's see if it also has a CRC code ("*XX") at the
+        # end.  If not, then all we have to do is return the line
+        # with the '$' stripped off.  (The '$' can't be mistaken for
+        # the '*', since a 3-character line has it at position -3.)
 
-    line = line[1:]   # All chars from 2nd to last.
+    if len(line) < 3 or line[-3] != '*':
+        return line[1:]     # All chars from 2nd to last.
 
-        # OK, so at this point we know we have an NMEA-type
-        # sentence, but with the '$' already stripped off.
-        # Let's see if it has a CRC code ("*XX") at the end.
+    last2 = line[-2:]
+    crc = _HEXBYTE.get(last2)   # Convert the two hex digits to an integer,
+    if crc is None:             #   the same way getCRC() does.
+        crc = int(last2, 16)
 
-    crc = getCRC(line)
+        # OK, so at this point we have a CRC code.  We know the
+        # last 3 characters are "*XX", so strip those off along
+        # with the '$', in a single slice.
 
-        # If it has no CRC code, then all we have to do is
-        # return the line, which already has the '$' stripped.
-
-    if crc == None:
-        return line
-
-        # OK, so at this point we have a CRC code, and a line
-        # with the '$' stripped off the front.  We know the
-        # last 3 characters are "*XX", so strip those off too.
-
-    line = line[:-3]   # All but last 3 characters of string.
+    line = line[1:-3]   # All but the first and last 3 characters.
 
         # Now we have a "bare" line (with $* stuff stripped away).
         # Calculate its CRC value and compare it to the one given.
-        # If they don't match, raise an exception.
+        # If they don't match, raise an exception.  (For ordinary-
+        # length lines we do calcCRC()'s reduce() right here, which
+        # saves a call and calcCRC()'s type & length tests.)
+
+    codes = line.encode()
+    if len(codes) < _WIDE_CRC_MINLEN:
+        mycrc = _reduce(_xor, codes, 0)
+    else:
+        mycrc = calcCRC(codes)
 
-    if calcCRC(line) != crc:
+    if mycrc != crc:
         raise BadChecksum       # Raise a "bad checksum" exception.
 
         # At this point the line is bare and we've verified that
@@ -104,15 +158,40 @@ def stripNMEA(line:str):
 
     return line
 
+    # Given an iterable of lines (as for stripNMEA()), return a list
+    # of booleans telling which ones passed the checksum test.  Lines
+    # that aren't NMEA sentences, or have no checksum, count as passing.
+    # This does the same checks as stripNMEA(), but in a single loop,
+    # without building the stripped lines or raising any exceptions,
+    # for use when checking large numbers of lines at once (e.g., when
+    # going back over a saved log).  The live path still uses stripNMEA().
+
+def verifyBatch(lines):
+    results = []
+    append = results.append     # Bind these locally, since we're looping.
+    hexbyte = _HEXBYTE.get
+    for line in lines:
+        if line[:1] != '$' or len(line) < 3 or line[-3] != '*':
+            append(True)            # No checksum to check.
+            continue
+        last2 = line[-2:]
+        crc = hexbyte(last2)
+        if crc is None:
+            try:
+                crc = int(last2, 16)
+            except ValueError:      # Not a hex checksum at all.
+                append(False)
+                continue
+        append(calcCRC(line[1:-3]) == crc)
+    return results
+
     # Given a string, return the NMEA sentence equivalent.
     # Include a checksum if and only if makeChecksum is true (default False).
     # Does not add any line-end character(s).
 
 def makeNMEA(line:str, makeChecksum:bool=False):
 
-    if makeChecksum:
-        crcNum = calcCRC(line)
-        crcStr = "*%02x" % crcNum
-        line = line + crcStr
+    if makeChecksum:    # Build the whole sentence in one formatting operation.
+        return ("$%s*%02x" % (line, calcCRC(line)))
 
     return ("$%s" % line)
@@ -1,33 +1,107 @@
 # pinger.py
 
+import time
+import heapq            # _PingScheduler keeps its pending pings in a heap.
+import threading
+import logmaster
+
+logger = logmaster.getLogger(logmaster.sysName + '.pinger')
+
 #------------------------------------------------------------------------
-# class NodePinger - A NodePinger is an object that uses a new thread to
-#   take on the task of asynchronously "pinging" a given node (via Wi-Fi
-#   to its bridged STDIN port) to make sure that it is still alive.  This
-#   will (ideally) trigger the node to send a PONG message back to us.
+# class NodePinger - A NodePinger is an object that takes on the task of
+#   asynchronously "pinging" a given node (via Wi-Fi to its bridged STDIN
+#   port) to make sure that it is still alive.  This will (ideally)
+#   trigger the node to send a PONG message back to us.
+#       The pings for all nodes are sent by a single shared scheduler
+#   thread (below), rather than by one sleeping thread per node.
 
 MINUTES_PER_PING = 1    # 1 minute between successive pings sent to each node.
+SETUP_SECS = 10         # Wait this long before the first ping, so the node can set up its bridges.
 
 class NodePinger:
     # .node - The node that we're responsible for pinging.
-    # .thread - The thread that we're using to ping it.
     def __init__(self, node):
         self.node = node        # Remember what node we're responsible for pinging.
-        # Create our thread to run our pingloop.
-        self.thread = threading.Thread(target=self.pingloop)
-        # Go ahead and start the thread.
-        self.thread.start()
+        logger.debug("Pinger for node %d is waiting %d seconds to give node a chance to set up its bridges...",
+                     self.node.nodenum, SETUP_SECS)
+        _scheduler().schedule(self, time.monotonic() + SETUP_SECS)    # Register for our first ping.
 
     def sendping(self):     # Send a ping to the node's STDIN.
         self.node.auxioServer.send("ping\n")     # Send the node a "ping" command line.
 
-    def pingloop(self):
-        logger.debug("Pinger for node %d is waiting 10 seconds to give node a chance to set up its bridges..." % self.node.nodenum)
-        time.sleep(10)               # Wait 10 seconds for node to create its bridges.
-        logger.debug("Pinger for node %d entering its main ping loop..." % self.node.nodenum)
-        while True:
-            logger.info("Pinger for node %d about to send ping at %s (+ <1 sec)" % (self.node.nodenum, time.ctime()))
-            self.sendping()
-            logger.debug("Pinger for node %d is going to sleep for %d minutes..." % (self.node.nodenum, MINUTES_PER_PING))
-            time.sleep(60*MINUTES_PER_PING)
-        
+    def ping(self):         # Called from the scheduler thread when our ping is due.
+        logger.info("Pinger for node %d about to send ping at %s (+ <1 sec)", self.node.nodenum, time.ctime())
+        self.sendping()
+        logger.debug("Pinger for node %d is going to sleep for %d minutes...", self.node.nodenum, MINUTES_PER_PING)
+
+#------------------------------------------------------------------------
+# class _PingScheduler - The single thread that sends the pings for all
+#   the NodePingers.  It keeps a heap of (due time, seq. no., pinger)
+#   entries, sleeps until the earliest one is due, pings that node, and
+#   puts it back on the heap for its next ping MINUTES_PER_PING later.
+#       Due times are on the time.monotonic() clock, so they aren't thrown
+#   off if the system clock gets stepped (e.g., when it's set from GPS),
+#   and each one is computed from the previous due time rather than from
+#   when the ping actually went out, so the schedule doesn't drift.
+#   Use stopPinging() to shut the scheduler thread down cleanly.
+
+class _PingScheduler:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []         # Heap of (due time, seq. no., pinger); the seq. no. breaks ties.
+        self._seq = 0
+        self._stopping = False
+        self.thread = logmaster.ThreadActor(role='pinger', target=self._run, daemon=True)
+        self.thread.start()
+
+    def schedule(self, pinger, due):
+        with self._cond:
+            heapq.heappush(self._heap, (due, self._seq, pinger))
+            self._seq += 1
+            self._cond.notify()     # The new entry may be due sooner than what we're waiting for.
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self.thread.join()
+
+    def _run(self):
+        with self._cond:
+            while not self._stopping:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due, seq, pinger = self._heap[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue        # Re-examine the heap; something new may have been added.
+                heapq.heappop(self._heap)
+                self._cond.release()            # Don't hold the lock while we're sending.
+                try:
+                    pinger.ping()
+                except Exception:
+                    logger.exception("Pinger for node %d failed to send ping.", pinger.node.nodenum)
+                finally:
+                    self._cond.acquire()
+                if self._stopping:
+                    break
+                heapq.heappush(self._heap, (due + 60*MINUTES_PER_PING, seq, pinger))
+
+_theScheduler = None
+_schedulerLock = threading.Lock()
+
+def _scheduler():               # Return the shared scheduler, creating it on first use.
+    global _theScheduler
+    with _schedulerLock:
+        if _theScheduler is None:
+            _theScheduler = _PingScheduler()
+        return _theScheduler
+
+def stopPinging():              # Stop the shared scheduler (if any), and wait for its thread to exit.
+    global _theScheduler
+    with _schedulerLock:
+        sched, _theScheduler = _theScheduler, None
+    if sched is not None:
+        sched.stop()
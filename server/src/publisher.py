@@ -23,7 +23,13 @@
 #|
 #|          Multithreaded operation is not required, but it can be
 #|          implemented if desired by making the callback be a method
-#|          to pass the issue to a worker thread's .do() method.
+#|          to pass the issue to a worker thread's .do() method.  Or,
+#|          create the publisher with Publisher(threaded=True), and it
+#|          will do this for you:  each subscriber then gets its own
+#|          worker thread (a "carrier"), which delivers that subscriber's
+#|          issues to it in order, so a slow subscriber holds up neither
+#|          the publishing thread nor the other subscribers.  Call the
+#|          publisher's .close() method to dismiss the carriers.
 #|
 #|      INTENDED USE:
 #|
@@ -64,6 +70,10 @@
 #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
 import threading
+import itertools        # Publisher.publish() uses chain().
+import functools        # Publisher.deliver() uses partial().
+
+import worklist         # Publisher's carriers are worklist.Worker threads.
 
 __all__ = ['Issue', 'Publisher']
 
@@ -74,32 +84,64 @@ class   Issue:
 
 class   Publisher:
 
-    def __init__(this):
+    def __init__(this, threaded:bool=False):
         this._lock = threading.RLock()
         with this._lock:
-            this._subscriptions = dict()    # key=title, value=list of subscribers
+            this._subscriptions = dict()    # key=title, value=tuple of subscribers; copied on write (see below)
+            this.threaded = threaded        # Deliver through per-subscriber carrier threads?
+            this._carriers = dict()         # key=subscriber address, value=its carrier Worker
+
+        # The subscriptions dict is never modified once it's installed.  Instead,
+        # writers (holding the lock) build a modified copy and then rebind
+        # ._subscriptions to it, which is atomic.  So publish() can just read
+        # ._subscriptions without taking the lock at all.  (Subscriptions are
+        # rare, and issues are frequent.)  At worst, a new subscriber misses
+        # an issue that was being published at the same moment it subscribed.
 
     def hasTitle(this, title):
         with this._lock:
             if title not in this._subscriptions:
-                this._subscriptions[title] = []     # initialize to empty list of subscribers
+                subs = dict(this._subscriptions)
+                subs[title] = ()                    # initialize to empty tuple of subscribers
+                this._subscriptions = subs
 
     def subscribe(this, address, title):
         with this._lock:
-            this.hasTitle(title)
-            this._subscriptions[title] = this._subscriptions[title] + [address]
+            subs = dict(this._subscriptions)
+            subs[title] = subs.get(title, ()) + (address,)
+            this._subscriptions = subs
 
     def subscribeAll(this, address):
         this.subscribe(address, '__ALL__')
 
     def deliver(this, issue, addr):
-        addr(issue)                     # assume addr's a callable and call it
+        if this.threaded:
+            this._carrier(addr).do(functools.partial(addr, issue))  # hand it to addr's carrier
+        else:
+            addr(issue)                     # assume addr's a callable and call it
+
+    def _carrier(this, addr):           # Get the carrier for addr, hiring one if needed.
+        with this._lock:
+            carrier = this._carriers.get(addr)
+            if carrier is None:
+                carrier = this._carriers[addr] = worklist.Worker(role='carrier')
+            return carrier
+
+    def close(this):                    # Dismiss all carriers once they finish their deliveries.
+        with this._lock:
+            carriers = list(this._carriers.values())
+            this._carriers.clear()
+        for carrier in carriers:
+            carrier.close()
+
+        # No lock needed here, since the subscriptions dict (and the tuples
+        # in it) that we fetch is never modified; see above.  Looking up a
+        # title doesn't create it.
     
     def publish(this, issue):
         title = issue.title
-        this.hasTitle(title)
-        this.hasTitle('__ALL__')
-        for addr in this._subscriptions[title] + this._subscriptions['__ALL__']:
+        subs = this._subscriptions      # Take the current (immutable) snapshot.
+        for addr in itertools.chain(subs.get(title, ()), subs.get('__ALL__', ())):
             this.deliver(issue, addr)
 
 def _module_unit_test():
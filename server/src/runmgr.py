@@ -63,6 +63,7 @@ import  threading                   # RLock()
 import  logmaster                   # getLogger(), etc.
 import  worklist                    # Worker class.
 import  flag                        # Flag class.
+import  timekeeper                  # Timekeeper class.
 
 
 __all__ = ['RunManager'     # A worker thread to setup/monitor data-collection run.
@@ -102,6 +103,12 @@ class   RunManager(worklist.Worker):
             inst.fedm_ready = flag.Flag(lock = inst._lock, initiallyUp = False)
             inst.good_time  = flag.Flag(lock = inst._lock, initiallyUp = False)
 
+                # This condition (on the same lock) is notified whenever any of
+                # the above flags is set by one of the yo_...() methods below, so
+                # that the worker thread can wait for all of them at once.
+
+            inst._ready_changed = threading.Condition(inst._lock)
+
                 # Create our initial task:  Start a run going as soon as we can.
 
             inst.initialTask = worklist.WorkItem(inst._queueStartupSequence)
@@ -119,21 +126,27 @@ class   RunManager(worklist.Worker):
 
             inst.ctu_node = ctu_node
             inst.ctu_ready.rise()   # Raise our flag indicating that the CTU is ready.
-                # This wakes up any waiters (such as RunManager thread in ._wait_good_time().)
+            inst._ready_changed.notify_all()
+                # This wakes up any waiters (such as RunManager thread in ._wait_ready().)
 
     def yo_FEDM_is_ready(inst, fedm_node):
         with inst._lock:
             inst.fedm_node = fedm_node
             inst.fedm_ready.rise()  # Raise our flag indicating that the FEDM is ready.
-                # This wakes up any waiters (such as RunManager thread in ._wait_good_time().)
+            inst._ready_changed.notify_all()
+                # This wakes up any waiters (such as RunManager thread in ._wait_ready().)
 
     def yo_GPS_time_is_good(inst):
-        inst.good_time.rise()   # Raise our flag indicating GPS time is good.
-            # This wakes up any waiters (such as RunManager thread in ._wait_good_time().)
+        with inst._lock:
+            inst.good_time.rise()   # Raise our flag indicating GPS time is good.
+            inst._ready_changed.notify_all()
+                # This wakes up any waiters (such as RunManager thread in ._wait_ready().)
 
     def yo_GPS_time_is_nogood(inst):
-        inst.good_time.fall()   # Lower our flag indicating GPS time is good.
-            # This wakes up any waiters (such as RunManager thread in ._wait_good_time().)
+        with inst._lock:
+            inst.good_time.fall()   # Lower our flag indicating GPS time is good.
+            inst._ready_changed.notify_all()
+                # This wakes up any waiters (such as RunManager thread in ._wait_ready().)
 
         # This task method (intended to be run only by the RunManager worker thread itself)
         # queues up the individual steps of the startup sequence on our worklist.  The point
@@ -147,9 +160,8 @@ class   RunManager(worklist.Worker):
                 # satisfied.  Other threads should take care of raising these flags for us
                 # once they have determined that these conditions are satisfied.
 
-        self(self._wait_CTU_ready)          # Wait for the CTU to be ready to accept commands.
-        self(self._wait_FEDM_ready)         # Wait for the FEDM to be ready to accept commands.
-        self(self._wait_good_time)          # Wait for the GPS to be producing valid time data.
+        self(self._wait_ready)              # Wait for the CTU & FEDM to be ready to accept
+                                            # commands, & the GPS to be producing valid time data.
 
                 # After that, do the actual steps needed to actually start the run.
         
@@ -157,27 +169,23 @@ class   RunManager(worklist.Worker):
         self(self._startDataCollector)      # Start up the DataCollector worker thread.
         self(self._start_CTU)               # Tell the Central Timing Unit to start marking time.
 
-    def     _wait_CTU_ready(self):
+        # Wait (in a single wait, which is woken up whenever any of our input flags
+        # is set) until all of the preconditions for starting the run are satisfied.
 
-        logger.info("RunManager._wait_CTU_ready():  Waiting for the CTU to be ready to accept commands.")
-        self.ctu_ready.waitUp()     # Wait for the CTU to be ready to accept commands.
-        logger.info("RunManager._wait_CTU_ready():  OK, the CTU is ready to accept commands now.")
+    def     _wait_ready(self):
 
-    def     _wait_FEDM_ready(self):
+        with self._lock:
+            logger.info("RunManager._wait_ready():  Waiting for the CTU & FEDM to be ready to accept commands "
+                        "(now %s & %s), and for the GPS to achieve a good time fix (now %s)...",
+                        bool(self.ctu_ready), bool(self.fedm_ready), bool(self.good_time))
+            self._ready_changed.wait_for(lambda: self.ctu_ready() and self.fedm_ready() and self.good_time())
+            logger.info("RunManager._wait_ready():  OK, the CTU & FEDM are ready to accept commands now, "
+                        "and the GPS has achieved at least one good time fix.")
 
-        logger.info("RunManager._wait_FEDM_ready():  Waiting for the FEDM to be ready to accept commands.")
-        self.fedm_ready.waitUp()     # Wait for the FEDM to be ready to accept commands.
-        logger.info("RunManager._wait_FEDM_ready():  OK, the FEDM is ready to accept commands now.")
-        
-    def     _wait_good_time(self):
-
-        logger.info("RunManager._wait_good_time():  Waiting for the GPS to achieve a good time fix.")
-        self.good_time.waitUp()     # Wait for the GPS to be producing valid time data.
-        logger.info("RunManager._wait_good_time():  OK, the GPS has achieved at least one good time fix.")
-
-    def     _startTimekeeper(self):     # Not yet implemented.
-        logger.warn("RunManager._startTimekeeper():  At this point, I would be starting " +
-                      "the Timekeeper worker thread, but it hasn't been implemented yet.")
+    def     _startTimekeeper(self):
+        logger.info("RunManager._startTimekeeper():  Starting the Timekeeper worker thread.")
+        self.timekeeper = timekeeper.Timekeeper()   # Creates & starts this worker thread.
+        self.timekeeper.watch(self.ctu_node)        # Have it record the CTU's PPS edges.
 
     def     _startDataCollector(self):  # Not yet implemented.
         logger.warn("RunManager._startTimekeeper():  At this point, I would be starting " +
@@ -61,18 +61,22 @@ global  MY_IP, GPS_ANT_LOC
             #|
             #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
+    # Look up our hostname just once, for all the tests below.
+
+_HOST = utils.get_hostname()
+
     # utils.get_my_ip() would work fine in this case (the machine has only 1 NIC)
     # but this assignment is still here as a piece of legacy code
     
-if  utils.get_hostname() == 'COSMICi':     # Dell Precision T3400 on Mike's desk in APCR-DRDL lab.
+if  _HOST == 'COSMICi':     # Dell Precision T3400 on Mike's desk in APCR-DRDL lab.
     MY_IP = "192.168.0.2"       # The static private IP address that is assigned to the central
                                 # server node in our wireless router's DHCP config.
                                 
-#elif  utils.get_hostname() == 'Linux-PC':   # This was the Acer, but it's now no longer 
+#elif  _HOST == 'Linux-PC':   # This was the Acer, but it's now no longer 
 #    MY_IP = "192.168.0.4"                   # in use as a server.
 
     # The below is commented out because get_my_ip() works fine on this machine instead.
-#elif  utils.get_hostname() == 'Theo':    # Mike's home office desktop.
+#elif  _HOST == 'Theo':    # Mike's home office desktop.
     #MY_IP = '192.168.0.102'   # This is Theo's IP address when using my router at home.
 
 else:
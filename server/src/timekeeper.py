@@ -37,3 +37,771 @@
 #|          v0.0, 3/12/12 (MPF) - Wrote file header including description.
 #|
 #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+        # Imports of standard python modules.
+
+import  threading                   # RLock()
+import  time                        # time() - Wall-clock time of PPS reports.
+import  sqlite3                     # Back end for the time-data database.
+import  bisect                      # bisect_right() - Finding the PPS interval of a counter value.
+import  queue                       # Queue - Handing snapshots over to a plotter.
+import  array                       # array - Compact columns of the in-memory timelines.
+
+        # Imports of custom user modules.
+
+import  logmaster                   # getLogger(), etc.
+import  worklist                    # Worker class.
+
+
+__all__ = ['Timekeeper',    # Worker thread that archives & processes time-reference data.
+           'DB_FILENAME',   # Default name of the time-data database file.
+           ]
+
+
+logger = logmaster.getLogger(logmaster.sysName + '.timekeeper')
+
+
+    #|==========================================================================
+    #|
+    #|      DB_FILENAME                                     [global constant]
+    #|
+    #|          Default name of the file holding the time-data database.
+    #|          For now we use SQLite, since it's in the standard library and
+    #|          needs no separate server process; the schema below is simple
+    #|          enough to move over to MySQL (or whatever) later if need be.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+DB_FILENAME = logmaster.sysName + '.timedata.db'
+
+    #|==========================================================================
+    #|
+    #|      KEEP_RAW_SECS, ARCHIVE_EVERY                    [global constants]
+    #|
+    #|          PPS edges more than KEEP_RAW_SECS old are moved out of the
+    #|          pps_edges table into compressed blocks (see pps_blocks,
+    #|          below).  We check for such edges once every ARCHIVE_EVERY
+    #|          edges recorded.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+KEEP_RAW_SECS = 60*60        # Keep the last hour's edges as plain rows.
+ARCHIVE_EVERY = 10*60        # With 1 PPS edge per second, check every 10 minutes.
+
+    #|==========================================================================
+    #|
+    #|      FLUSH_EVERY, FLUSH_SECS                         [global constants]
+    #|
+    #|          Newly recorded PPS edges are buffered in memory and written
+    #|          to the database in batches, one transaction per batch, when
+    #|          FLUSH_EVERY edges have accumulated or FLUSH_SECS seconds have
+    #|          passed since the last batch, whichever comes first.  (They are
+    #|          also written out before any query, and when the Timekeeper
+    #|          exits.)
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+FLUSH_EVERY = 100
+FLUSH_SECS  = 10.0
+
+    #|==========================================================================
+    #|
+    #|      _MAX_WALK                               [private global constant]
+    #|
+    #|          When mapping counter values to times, if a counter value is
+    #|          past the PPS interval used last time, we step forwards from
+    #|          that interval at most this many times before giving up and
+    #|          doing a binary search instead.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+_MAX_WALK = 4
+
+_INF     = float('inf')         # Bounds of the cached counter range of the
+_NEG_INF = float('-inf')        #   first & last PPS intervals (see below).
+
+    #|==========================================================================
+    #|
+    #|      TIMELINE_EDGES                                  [global constant]
+    #|
+    #|          The most PPS edges from each node that are kept in memory
+    #|          (see _NodeTimeState, below).  Older ones are still in the
+    #|          database, of course.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+TIMELINE_EDGES = 4096       # A little over an hour's worth.
+
+    #|==========================================================================
+    #|
+    #|      PLOT_WINDOW, PLOT_QUEUE_SIZE                    [global constants]
+    #|
+    #|          Each snapshot handed to a real-time plotter (see plotFeed(),
+    #|          below) holds the last PLOT_WINDOW edges from one node.  At
+    #|          most PLOT_QUEUE_SIZE snapshots wait in the queue; if the
+    #|          plotter falls behind, the oldest ones are dropped.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+PLOT_WINDOW     = 5*60      # The last 5 minutes' worth of edges.
+PLOT_QUEUE_SIZE = 2
+
+    #|==========================================================================
+    #|
+    #|      _SCHEMA                                 [private global constant]
+    #|
+    #|          SQL statements that create the database tables, if they don't
+    #|          already exist.
+    #|
+    #|          pps_edges - One row for each PPS rising edge reported by the
+    #|              CTU (in a PPSCNTR message).  ts is the server's wall-clock
+    #|              time (in seconds since the epoch) when the edge was
+    #|              reported, node is the node number of the reporting node,
+    #|              pps_num is the edge's sequence number, and counter is the
+    #|              value of the node's 750 Mcps time counter at the edge.
+    #|
+    #|              The data arrives in time order and is almost always queried
+    #|              by time range ("all PPS edges between t0 and t1"), so the
+    #|              table is a WITHOUT ROWID table whose primary key starts
+    #|              with ts.  That way the rows themselves are stored in time
+    #|              order in the primary-key B-tree, new rows are always
+    #|              appended at its right-hand edge, and a time-range query
+    #|              reads a contiguous run of pages, instead of looking up
+    #|              each row through a separate index.
+    #|
+    #|          pps_blocks - Older PPS edges, packed into one row per block
+    #|              of consecutive edges from a given node.  Each column of
+    #|              the block (times in microseconds, sequence numbers, and
+    #|              counter values) is stored as a blob of delta-of-delta
+    #|              codes (see _packDoD(), below).  Since the edges come at
+    #|              (almost exactly) 1-second intervals, nearly all of the
+    #|              codes are tiny, and a block takes a few bytes per edge
+    #|              instead of the ~30 bytes per row of pps_edges.
+    #|
+    #|          pps_minutes - A summary of the PPS edges from each node in
+    #|              each minute (minute is the time of the start of the
+    #|              minute, in seconds since the epoch): the number of edges,
+    #|              and the average, least & greatest counter value.  These
+    #|              rows are made when the edges are packed into pps_blocks,
+    #|              so that questions about the whole of a long run can be
+    #|              answered without unpacking all of its blocks; see
+    #|              minutesBetween(), below.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pps_edges (
+        ts          REAL    NOT NULL,
+        node        INTEGER NOT NULL,
+        pps_num     INTEGER NOT NULL,
+        counter     INTEGER NOT NULL,
+        PRIMARY KEY (ts, node)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS pps_blocks (
+        ts_first    REAL    NOT NULL,
+        node        INTEGER NOT NULL,
+        ts_last     REAL    NOT NULL,
+        n           INTEGER NOT NULL,
+        ts_codes    BLOB    NOT NULL,
+        pps_codes   BLOB    NOT NULL,
+        cnt_codes   BLOB    NOT NULL,
+        PRIMARY KEY (ts_first, node)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS pps_minutes (
+        minute      INTEGER NOT NULL,
+        node        INTEGER NOT NULL,
+        n           INTEGER NOT NULL,
+        cnt_avg     REAL    NOT NULL,
+        cnt_min     INTEGER NOT NULL,
+        cnt_max     INTEGER NOT NULL,
+        PRIMARY KEY (minute, node)
+    ) WITHOUT ROWID;
+"""
+
+    #|==========================================================================
+    #|
+    #|      _packDoD(), _unpackDoD()                [private module functions]
+    #|
+    #|          Encode a sequence of integers as a byte string of delta-
+    #|          of-delta codes, and decode it again.  Each value is coded
+    #|          as the change in its difference from the previous value
+    #|          (so a sequence with constant steps codes as all zeros after
+    #|          the first two values), zigzag-mapped to a non-negative
+    #|          integer and written as a little-endian base-128 varint.
+    #|          This is the same idea as the timestamp coding in Facebook's
+    #|          Gorilla time-series store, but byte-aligned rather than
+    #|          bit-packed, which is much simpler (and faster) to do in
+    #|          Python; a zero code takes one byte rather than one bit.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+def _packDoD(values):
+    out = bytearray()
+    prev = prevDelta = 0
+    for v in values:
+        delta = v - prev
+        dod = delta - prevDelta
+        prev, prevDelta = v, delta
+        z = dod << 1 if dod >= 0 else ((-dod) << 1) - 1     # Zigzag: 0,-1,1,-2,... -> 0,1,2,3,...
+        while z >= 0x80:
+            out.append((z & 0x7F) | 0x80)
+            z >>= 7
+        out.append(z)
+    return bytes(out)
+
+def _unpackDoD(codes):
+    values = []
+    prev = prevDelta = 0
+    z = shift = 0
+    for b in codes:
+        z |= (b & 0x7F) << shift
+        if b & 0x80:            # More bytes of this varint to come.
+            shift += 7
+            continue
+        dod = (z >> 1) if not (z & 1) else -((z + 1) >> 1)
+        prevDelta += dod
+        prev += prevDelta
+        values.append(prev)
+        z = shift = 0
+    return values
+
+
+    #|==========================================================================
+    #|
+    #|      _NodeTimeState                              [private class]
+    #|
+    #|          The Timekeeper's in-memory timeline of the PPS edges seen
+    #|          from one node, and the methods that use it to map that
+    #|          node's counter values to times.
+    #|
+    #|          The edges are kept column-wise, as parallel arrays of counter
+    #|          values (64-bit integers) and times (doubles), together with
+    #|          the slope (seconds per count) of the straight line between
+    #|          each edge and the next.  Using typed arrays rather than lists
+    #|          takes 8 bytes per value instead of an 8-byte pointer plus a
+    #|          separate 24- or 32-byte int or float object, and keeps each
+    #|          column together in memory.
+    #|
+    #|          The counter values are always handled as exact integers.
+    #|          After 2^53 counts (about 139 days at 750 Mcps) a double can
+    #|          no longer hold them exactly, and long before that, a double
+    #|          would round off the low bits of a difference between two of
+    #|          them.  So they are only ever converted to floating point
+    #|          after subtracting another counter value from them, leaving a
+    #|          number small enough to convert without losing anything.  A counter
+    #|          value is mapped to a time by linear interpolation within
+    #|          the PPS interval containing it (or extrapolation past the
+    #|          ends).  For now, the time of each edge is just the time it
+    #|          was reported.
+    #|
+    #|          Only the last TIMELINE_EDGES edges are kept, so that memory
+    #|          use doesn't keep growing over a long run.  Rather than a
+    #|          circular buffer (which would make the binary search awkward,
+    #|          since the values would no longer be in order in memory),
+    #|          the arrays are allowed to grow to twice that size, and then
+    #|          the older half is deleted all at once, so the cost of moving
+    #|          the remaining items down is spread over TIMELINE_EDGES new
+    #|          edges.  Counter values from before the start of what's kept
+    #|          get extrapolated from the first interval.
+    #|
+    #|          Counter values to be mapped normally arrive in (nearly)
+    #|          increasing order, so we remember which interval the last one
+    #|          fell in, and start from there, only falling back on a binary
+    #|          search if the value is further away.  Since there are lots
+    #|          of events in each second, most of the time the value is in
+    #|          the very same interval as last time; we also remember the
+    #|          range of counter values [cacheLo, cacheHi) that interval
+    #|          covers, along with its starting counter value & time and its
+    #|          slope, so in that case a single comparison finds it and one
+    #|          subtraction, multiplication & addition give the time, with
+    #|          no indexing into the arrays at all.  (The
+    #|          first and last intervals extend to -/+ infinity, since we
+    #|          extrapolate them.)  Adding an edge empties the range, since
+    #|          the interval that was last no longer extends to infinity.
+    #|
+    #|          We also keep a least-squares straight-line fit through all
+    #|          the edges that are kept, updated as each edge comes in (and
+    #|          redone from scratch whenever the older half is dropped), so
+    #|          that the clock rate is always at hand without refitting.
+    #|          Rather than the raw sums of x, y, x^2 and xy, which would
+    #|          lose nearly all their precision to cancellation with counter
+    #|          values this big, we use Welford's method, keeping the means
+    #|          and the sums of the products of the deviations from them.
+    #|          The counter values and times are taken relative to those of
+    #|          the first edge kept (fitC0, fitT0).
+    #|
+    #|          There's no locking in here; the Timekeeper holds its lock
+    #|          while calling these methods.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class   _NodeTimeState:
+
+    __slots__ = ('nodenum', 'counters', 'times', 'slopes', 'lastIdx', 'cacheLo', 'cacheHi',
+                 'cacheC0', 'cacheT0', 'cacheSlope',
+                 'fitC0', 'fitT0', 'fitN', 'fitMx', 'fitMy', 'fitCxx', 'fitCxy')
+
+    def     __init__(this, nodenum:int):
+        this.nodenum     = nodenum      # Number of the node whose edges these are.
+        this.counters    = array.array('q')     # Counter value at each edge.
+        this.times       = array.array('d')     # Time of each edge.
+        this.slopes      = array.array('d')     # Seconds per count from each edge to the next.
+        this.lastIdx     = 0            # Index of the PPS interval last used by counterToTime(),
+        this.cacheLo     = 0            #   & the range of counter values it covers
+        this.cacheHi     = 0            #   (initially empty),
+        this.cacheC0     = 0            #   & its starting counter value,
+        this.cacheT0     = 0.0          #   time,
+        this.cacheSlope  = 0.0          #   & slope.
+        this._clearFit()
+
+        # Start the running line fit over again, with no edges in it.
+
+    def     _clearFit(this):
+        this.fitC0 = this.fitT0 = 0     # Origin of the fit's coordinates.
+        this.fitN = 0                   # Number of edges in the fit.
+        this.fitMx = this.fitMy = 0.0   # Mean (relative) counter value & time.
+        this.fitCxx = this.fitCxy = 0.0 # Sums of products of their deviations.
+
+        # Add an edge to the running line fit.
+
+    def     _addToFit(this, counter:int, ts:float):
+        if this.fitN == 0:
+            this.fitC0 = counter
+            this.fitT0 = ts
+        x = counter - this.fitC0        # Exact, as integers.
+        y = ts - this.fitT0
+        this.fitN += 1
+        dx = x - this.fitMx
+        this.fitMx += dx/this.fitN
+        this.fitMy += (y - this.fitMy)/this.fitN
+        this.fitCxx += dx*(x - this.fitMx)
+        this.fitCxy += dx*(y - this.fitMy)
+
+        # Return the running line fit as a tuple (secsPerCount, counter,
+        # time), where the line passes through the point (counter, time),
+        # or None if there are fewer than two edges in it.  The counter
+        # value is that of the first edge in the fit, an exact integer, so
+        # the caller can subtract it from other counter values exactly.
+
+    def     line(this):
+        if this.fitN < 2:
+            return None
+        slope = this.fitCxy/this.fitCxx
+        return (slope, this.fitC0, this.fitT0 + (this.fitMy - slope*this.fitMx))
+
+        # Add a new PPS edge to the end of the timeline.
+
+    def     extend(this, counter:int, ts:float):
+        counters = this.counters
+        if counters and counter <= counters[-1]:    # Counter was reset?
+            logger.warn("_NodeTimeState.extend(): Node #%d's PPS counter value %d isn't after "
+                        "the previous one (%d); starting a new timeline.",
+                        this.nodenum, counter, counters[-1])
+            del counters[:], this.times[:], this.slopes[:]
+            this.lastIdx = 0
+            this.cacheLo = 0
+            this._clearFit()
+        if counters:
+            this.slopes.append((ts - this.times[-1])/(counter - counters[-1]))
+        counters.append(counter)
+        this.times.append(ts)
+        this.cacheHi = this.cacheLo         # Forget the cached interval's range.
+        if len(counters) >= 2*TIMELINE_EDGES:      # Time to drop the older half?
+            drop = len(counters) - TIMELINE_EDGES
+            del counters[:drop], this.times[:drop], this.slopes[:drop]
+            this.lastIdx = max(this.lastIdx - drop, 0)
+            this._clearFit()                        # Redo the fit without them.
+            for (c, t) in zip(counters, this.times):
+                this._addToFit(c, t)
+        else:
+            this._addToFit(counter, ts)
+
+        # Return (counters, times) arrays of the last n edges (or all of them).
+
+    def     recent(this, n:int=None):
+        if n == None or n >= len(this.counters):
+            return (this.counters[:], this.times[:])
+        return (this.counters[-n:], this.times[-n:])
+
+    def     counterToTime(this, counter:int):
+        counters = this.counters
+        if this.cacheLo <= counter < this.cacheHi:     # Same interval as last time?
+            return this.cacheT0 + (counter - this.cacheC0)*this.cacheSlope
+        last = len(counters) - 2        # Index of the last complete PPS interval.
+        if last < 0:
+            return None
+        i = this.lastIdx
+        if counter >= this.cacheLo:         # Moving forwards, as usual?
+            steps = 0
+            while i < last and counters[i+1] <= counter and steps < _MAX_WALK:
+                i += 1
+                steps += 1
+            if i < last and counters[i+1] <= counter:   # Still not there?  Search.
+                i = min(bisect.bisect_right(counters, counter, i) - 1, last)
+        else:
+            i = min(max(bisect.bisect_right(counters, counter) - 1, 0), last)
+        this.lastIdx = i
+        this.cacheLo = counters[i] if i > 0 else _NEG_INF
+        this.cacheHi = counters[i+1] if i < last else _INF
+        c0 = this.cacheC0 = counters[i]
+        t0 = this.cacheT0 = this.times[i]
+        slope = this.cacheSlope = this.slopes[i]
+        return t0 + (counter - c0)*slope
+
+    def     countersToTimes(this, counters):
+        ppsCounters, ppsTimes, slopes = this.counters, this.times, this.slopes
+        last = len(ppsCounters) - 2
+        if last < 0:
+            return None
+        times = []
+        append = times.append
+        i = 0
+        prev = None
+        for c in counters:
+            if prev is not None and c >= prev:      # Still in order; walk forwards.
+                while i < last and ppsCounters[i+1] <= c:
+                    i += 1
+            else:                                   # First value, or out of order; search.
+                i = min(max(bisect.bisect_right(ppsCounters, c) - 1, 0), last)
+            prev = c
+            append(ppsTimes[i] + (c - ppsCounters[i])*slopes[i])
+        return times
+
+
+    #|==========================================================================
+    #|
+    #|      Timekeeper                                  [public class]
+    #|
+    #|          A worker thread that receives the PPS edge reports from
+    #|          the CTU (via its publisher) and records them in the
+    #|          time-data database.
+    #|
+    #|          The database connection is opened and used only by the
+    #|          Timekeeper thread itself (SQLite connections may not be
+    #|          shared between threads), so the public methods below just
+    #|          hand their work over to the worker thread.
+    #|
+    #|      USAGE:
+    #|
+    #|          tk = Timekeeper()       # Creates & starts the worker thread.
+    #|          tk.watch(ctu_node)      # Start recording its PPSCNTR messages.
+    #|          ...
+    #|          edges = tk.edgesBetween(t0, t1)     # Query the database.
+    #|          mins = tk.minutesBetween(t0, t1)    # Per-minute summaries.
+    #|          t = tk.counterToTime(nodenum, counter)      # Map a node's counter value to a time.
+    #|          ts = tk.countersToTimes(nodenum, counters)  # Map a batch of them.
+    #|          (rate, c, t) = tk.clockLine(nodenum)        # Line fitted to its timeline.
+    #|          (rate, resids) = tk.fitClockRate(nodenum)   # Ditto, with the residuals.
+    #|          q = tk.plotFeed()       # Get snapshots to plot (see below).
+    #|
+    #|      COUNTER-TO-TIME MAPPING:
+    #|
+    #|          Besides archiving them, we also keep the PPS edges seen so
+    #|          far from each node in memory, in a _NodeTimeState object
+    #|          (see above).  These are kept in a dictionary keyed by node
+    #|          number.  Since the messages from a given node tend to come
+    #|          in bursts, we also remember the last node we looked up, and
+    #|          its state, to skip the dictionary lookup when it's the same.
+    #|
+    #|      REAL-TIME PLOTTING:
+    #|
+    #|          Drawing graphs is far too slow to do in the Timekeeper
+    #|          thread, which has to keep up with the incoming edges.  So
+    #|          instead, once plotFeed() has been called, after each edge
+    #|          is recorded we put a snapshot (nodenum, counters, times) of
+    #|          that node's most recent edges on a small bounded queue,
+    #|          without waiting; if the queue is full, the oldest snapshot
+    #|          on it is dropped to make room.  The plotter (e.g., the GUI
+    #|          thread, polling every so often) runs in its own thread and
+    #|          calls latestPlotFrame() to get the newest snapshot, so it
+    #|          never touches the database or holds up the Timekeeper,
+    #|          however slow it is.
+    #|
+    #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class   Timekeeper(worklist.Worker):
+
+        # Class variables:
+
+    defaultRole = 'timekpr'     # Override value from parent class.
+
+    def     __init__(inst, *args, dbFilename:str=None, **kargs):
+
+        inst._lock = threading.RLock()      # Reentrant mutex lock for thread-safe access to object data.
+
+        with    inst._lock:
+
+            inst.defaultComponent = 'server'
+
+            if dbFilename == None:  dbFilename = DB_FILENAME
+
+            inst.dbFilename = dbFilename    # Name of our database file.
+            inst._db = None                 # Connection to it; opened by our thread.
+            inst._nRecorded = 0             # Number of edges recorded so far.
+            inst._pending = []              # Edges not yet written to the database.
+            inst._lastFlush = time.monotonic()  # When we last wrote them.
+
+                # In-memory timelines of PPS edges, by node (see above).
+
+            inst._nodes = {}                # key=node number, value=_NodeTimeState
+            inst._lastNodenum = None        # Node number last looked up,
+            inst._lastNodeState = None      #   & its _NodeTimeState.
+
+                # Snapshots for a real-time plotter (see above).
+
+            inst._plotQ = queue.Queue(maxsize=PLOT_QUEUE_SIZE)
+            inst._plotting = False          # Set by plotFeed().
+
+                # Our first task is to open the database.
+
+            inst.initialTask = worklist.WorkItem(inst._openDatabase)
+
+                # Hand off control to the initializer for our parent class.
+                # Our last task (on exiting) is to close the database.
+
+            kargs.setdefault('onexit', inst._closeDatabase)
+            worklist.Worker.__init__(inst, *args, **kargs)      # This starts the Worker thread running.
+
+        # Subscribe to the PPSCNTR messages published by the given node's
+        # host (normally, the CTU), and record all of them from now on.
+
+    def     watch(inst, node):
+        nodenum = node.nodenum
+        def gotPPSCNTR(issue):
+            rec = issue.content
+            inst.ppsEdge(nodenum, int(rec.pps_num), int(rec.fast_cnt))
+        node.sensor_host.publisher.subscribe(gotPPSCNTR, 'PPSCNTR')
+
+        # Record a PPS edge with the given sequence number and counter value,
+        # reported by node #nodenum at time ts (by default, now).  This
+        # returns right away; the work is done in the Timekeeper thread.
+
+    def     ppsEdge(inst, nodenum:int, pps_num:int, counter:int, ts:float=None):
+        if ts == None:  ts = time.time()
+        inst(lambda: inst._recordEdge(ts, nodenum, pps_num, counter))
+
+        # Return a list of (ts, node, pps_num, counter) tuples for all
+        # the PPS edges reported at times t0 <= ts < t1, in time order.
+
+    def     edgesBetween(inst, t0:float, t1:float):
+        return inst.getResult(lambda: inst._queryEdges(t0, t1))
+
+        # Return a list of (minute, node, n, cnt_avg, cnt_min, cnt_max)
+        # tuples summarizing the PPS edges from each node in each minute
+        # from t0 up to t1 (see pps_minutes, above), in time order.  This
+        # covers both the archived edges and those still in plain rows.
+
+    def     minutesBetween(inst, t0:float, t1:float):
+        return inst.getResult(lambda: inst._queryMinutes(t0, t1))
+
+        # Map the given counter value from node #nodenum to a time, using
+        # the PPS edges seen from that node so far.  Returns None if we
+        # haven't seen at least two edges from it yet.
+
+    def     counterToTime(inst, nodenum:int, counter:int):
+        with inst._lock:
+            state = inst._nodeState(nodenum)
+            return None if state == None else state.counterToTime(counter)
+
+        # Map a whole batch of counter values from node #nodenum to times
+        # at once, returning a list of the times (or None, as above).  This
+        # takes the lock just once, and if the values are in increasing
+        # order (as they normally are), it finds all of their intervals in
+        # a single pass along the timeline, instead of searching for each.
+
+    def     countersToTimes(inst, nodenum:int, counters):
+        with inst._lock:
+            state = inst._nodeState(nodenum)
+            return None if state == None else state.countersToTimes(counters)
+
+        # Return the least-squares straight line through the PPS edges in
+        # node #nodenum's (recent) timeline, as a tuple (secsPerCount,
+        # counter, time): the slope of the line (so 1/secsPerCount is the
+        # measured counter frequency), and a point that it passes through.
+        # This fit is kept up to date as the edges come in, so this is
+        # cheap.  Returns None if we haven't seen at least two edges yet.
+
+    def     clockLine(inst, nodenum:int):
+        with inst._lock:
+            state = inst._nodeState(nodenum)
+            return None if state == None else state.line()
+
+        # Like clockLine(), but return a pair (secsPerCount, residuals),
+        # where residuals is a list of the time of each edge minus the
+        # time given by the line.  This is useful for seeing how steady
+        # the counter's clock is.  The counter values are made relative
+        # to the first one (exactly, as integers) before any floating-
+        # point arithmetic is done, so that no precision is lost.
+
+    def     fitClockRate(inst, nodenum:int):
+        with inst._lock:            # Take a snapshot, then work on it unlocked.
+            state = inst._nodeState(nodenum)
+            if state == None or state.fitN < 2:
+                return None
+            (counters, times) = state.recent()
+            (c0, t0) = (state.fitC0, state.fitT0)
+            (mx, my) = (state.fitMx, state.fitMy)
+            slope = state.fitCxy/state.fitCxx
+        return (slope, [(t - t0) - my - slope*((c - c0) - mx) for (c, t) in zip(counters, times)])
+
+        # Start putting snapshots of the timelines on our plot queue, and
+        # return the queue.
+
+    def     plotFeed(inst):
+        inst._plotting = True
+        return inst._plotQ
+
+        # Return the newest snapshot waiting on the plot queue (discarding
+        # any older ones), or None if there aren't any.  Never blocks.
+
+    def     latestPlotFrame(inst):
+        frame = None
+        try:
+            while True:
+                frame = inst._plotQ.get_nowait()
+        except queue.Empty:
+            return frame
+
+        # Return the _NodeTimeState for node #nodenum (creating it if create
+        # is true and it doesn't exist yet; otherwise returning None).
+        # Caller must hold our lock.
+
+    def     _nodeState(this, nodenum:int, create:bool=False):
+        if nodenum == this._lastNodenum:        # Same node as last time?
+            return this._lastNodeState
+        state = this._nodes.get(nodenum)
+        if state == None:
+            if not create:
+                return None
+            state = this._nodes[nodenum] = _NodeTimeState(nodenum)
+        this._lastNodenum = nodenum
+        this._lastNodeState = state
+        return state
+
+        # The following methods are run only by the Timekeeper thread itself.
+
+    def     _openDatabase(self):
+        logger.info("Timekeeper._openDatabase(): Opening time-data database [%s]...", self.dbFilename)
+        self._db = sqlite3.connect(self.dbFilename)
+            # With write-ahead logging and synchronous=NORMAL, a commit
+            # doesn't wait for the disk; a power failure could lose the
+            # last few batches, but never corrupts the database.
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def     _closeDatabase(self):
+        if self._db != None:
+            self._flush()
+            self._db.close()
+            self._db = None
+
+    def     _recordEdge(self, ts:float, nodenum:int, pps_num:int, counter:int):
+        self._pending.append((ts, nodenum, pps_num, counter))
+        if (len(self._pending) >= FLUSH_EVERY or
+            time.monotonic() - self._lastFlush >= FLUSH_SECS):
+            self._flush()
+        self._nRecorded += 1
+        if self._nRecorded % ARCHIVE_EVERY == 0:
+            self._archiveBefore(ts - KEEP_RAW_SECS)
+        with self._lock:
+            state = self._nodeState(nodenum, create=True)
+            state.extend(counter, ts)
+            if self._plotting:
+                frame = (nodenum,) + state.recent(PLOT_WINDOW)
+        if self._plotting:
+            try:
+                self._plotQ.put_nowait(frame)
+            except queue.Full:      # Plotter's behind; drop the oldest snapshot instead.
+                try:
+                    self._plotQ.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._plotQ.put_nowait(frame)
+                except queue.Full:
+                    pass
+
+        # Write out all the pending edges, in a single transaction.
+
+    def     _flush(self):
+        if self._pending:
+            with self._db:      # Commits the inserts (or rolls them back on error).
+                self._db.executemany("INSERT OR REPLACE INTO pps_edges VALUES (?, ?, ?, ?)",
+                                     self._pending)
+            self._pending = []
+        self._lastFlush = time.monotonic()
+
+        # Move all the edges reported before time t from pps_edges into
+        # new compressed blocks in pps_blocks (one block per node), after
+        # summarizing them in pps_minutes.  t is rounded down to the start
+        # of a minute first, so no minute gets split between two batches.
+
+    def     _archiveBefore(self, t:float):
+        t = (t//60)*60
+        self._flush()
+        with self._db:      # Do it all as a single transaction.
+            self._db.execute("INSERT OR REPLACE INTO pps_minutes "
+                             "SELECT CAST(ts/60 AS INTEGER)*60, node, count(*), "
+                             "avg(counter), min(counter), max(counter) FROM pps_edges "
+                             "WHERE ts < ? GROUP BY 1, 2", (t,))
+            rows = self._db.execute("SELECT ts, node, pps_num, counter FROM pps_edges "
+                                    "WHERE ts < ? ORDER BY node, ts", (t,)).fetchall()
+            if not rows:
+                return
+            byNode = {}
+            for row in rows:
+                byNode.setdefault(row[1], []).append(row)
+            for nodenum, edges in byNode.items():
+                self._db.execute("INSERT OR REPLACE INTO pps_blocks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                 (edges[0][0], nodenum, edges[-1][0], len(edges),
+                                  _packDoD([round(e[0]*1e6) for e in edges]),
+                                  _packDoD([e[2] for e in edges]),
+                                  _packDoD([e[3] for e in edges])))
+            self._db.execute("DELETE FROM pps_edges WHERE ts < ?", (t,))
+        logger.info("Timekeeper._archiveBefore(): Packed %d old PPS edges into %d blocks.",
+                    len(rows), len(byNode))
+
+    def     _queryEdges(self, t0, t1):
+
+        self._flush()       # Make sure the database is up to date.
+
+            # Unpack the edges in any blocks that overlap the time range.
+
+        edges = []
+        for (nodenum, ts_codes, pps_codes, cnt_codes) in self._db.execute(
+                "SELECT node, ts_codes, pps_codes, cnt_codes FROM pps_blocks "
+                "WHERE ts_first < ? AND ts_last >= ?", (t1, t0)):
+            for (us, pps_num, counter) in zip(_unpackDoD(ts_codes), _unpackDoD(pps_codes),
+                                              _unpackDoD(cnt_codes)):
+                ts = us/1e6
+                if t0 <= ts < t1:
+                    edges.append((ts, nodenum, pps_num, counter))
+
+            # Then add the ones that are still in plain rows.
+
+        edges.extend(self._db.execute("SELECT ts, node, pps_num, counter FROM pps_edges "
+                                      "WHERE ts >= ? AND ts < ? ORDER BY ts", (t0, t1)))
+        edges.sort()
+        return edges
+
+        # The archived minutes are already summarized; the recent ones are
+        # summarized on the fly from the plain rows, in the same query.
+
+    def     _queryMinutes(self, t0, t1):
+        self._flush()
+        return self._db.execute(
+            "SELECT minute, node, n, cnt_avg, cnt_min, cnt_max FROM pps_minutes "
+            "WHERE minute >= ? AND minute < ? "
+            "UNION ALL "
+            "SELECT CAST(ts/60 AS INTEGER)*60, node, count(*), "
+            "avg(counter), min(counter), max(counter) FROM pps_edges "
+            "WHERE ts >= ? AND ts < ? GROUP BY 1, 2 "
+            "ORDER BY 1, 2", ((t0//60)*60, t1, t0, t1)).fetchall()
+
+#|^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+#|      END FILE:   timekeeper.py
+#|*******************************************************************************
@@ -62,6 +62,11 @@ __all__ = ['CoarseTimeStamp']   # Export this name to modules that do 'from time
 
 class CoarseTimeStamp():
 
+        # One of these gets made for every message sent or received, so
+        # keep them small:  Just the three data members, in fixed slots.
+
+    __slots__ = ('fsecs', 'secs', 'msecs')
+
         #|------------------------------------------------------------------
         #|
         #|      METHOD:     __init__()          [special instance method]
@@ -92,6 +97,21 @@ class CoarseTimeStamp():
         return time.ctime(self.secs) + (" + %3d ms" % self.msecs)
     #<-- End method __str__().
 
+        #|-------------------------------------------------------------------
+        #|
+        #|      METHOD:     coerce()            [public class method]
+        #|
+        #|          Given either a CoarseTimeStamp or a floating-point
+        #|          time in seconds since the epoch, return it as a
+        #|          CoarseTimeStamp.  Time stamps are returned as-is,
+        #|          without making a new object.
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+    @classmethod
+    def coerce(cls, when):
+        return when if type(when) is cls else cls(when)
+    #<-- End method coerce().
+
 #<-- End class CoarseTimeStamp().
 
 #|^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
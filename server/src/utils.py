@@ -35,6 +35,7 @@
     # Imports from standard python modules.
 
 import threading    # RLock
+import functools    # get_my_ip() is memoized with lru_cache().
 from socket import gethostname, gethostbyname
     # these are used in get_hostname(), get_my_ip()
 
@@ -71,8 +72,14 @@ def get_hostname():
     #|       Gets the IP address of the default interface of the
     #|       host (computer) this server application is running on.
     #|
+    #|       The address is looked up only once (the lookup may go out
+    #|       to DNS) and remembered thereafter.  If the host's address
+    #|       may have changed, call get_my_ip.cache_clear() to force
+    #|       the next call to look it up again.
+    #|
     #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
+@functools.lru_cache(maxsize=1)
 def get_my_ip():
     full_hostname = gethostname()
     my_ip = gethostbyname(full_hostname)
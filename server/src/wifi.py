@@ -1,6 +1,8 @@
 # wifi.py
 
 import  threading
+import  enum                        # BridgeMode is an IntEnum.
+import  ipaddress                   # WiFi_Module keeps its IP address as an int; see _ipToInt().
 
     # User includes.
 
@@ -8,7 +10,7 @@ import  logmaster
 import  timestamp                   # The CoarseTimeStamp class is used in multiple places below.
 import  communicator                # For communicating between proxy & real WiFi_Module 
 from    communicator    import *    # Define "Connection"
-import  ports                       # SensorNode._setupBridgeServers() uses LASER_PORT, MESON_PORT.
+import  ports                       # WiFi_Module's base bridge ports are LASER_PORT, MESON_PORT.
 import  bridge                      # SensorNode._setupBridgeServers() uses bridge.BridgeServer().
 
 import  model
@@ -16,6 +18,7 @@ import  model
 
 __all__ = [
     'WiFi_Module',          # A component of a wireless SensorNode - EZURiO Wi-Fi evaluation board.
+    'BridgeMode',           # The bridging modes a Wi-Fi module may be in.
     ]
 
     # Create logging channel for this module.
@@ -30,6 +33,53 @@ class BadBridgeMode(Exception): pass
     # The current Wi-Fi bridging mode does not support 
 
 
+        #|=====================================================================
+        #|
+        #|      BridgeMode                              [public module class]
+        #|
+        #|          The bridging modes that a Wi-Fi module may be in (see
+        #|          WiFi_Module.bridgeMode_is(), below).  These are small
+        #|          ints, so that .bridgeMode_is() can pick the class that
+        #|          knows how to send lines in that mode by indexing a table,
+        #|          instead of comparing strings; use .name to get the mode as
+        #|          a displayable string.
+        #|
+        #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+
+class BridgeMode(enum.IntEnum):
+    UNKNOWN         = 0
+    DEFAULT         = 1
+    NONE            = 2
+    UNSUPPORTED     = 3
+    UART            = 4
+    TREFOIL         = 5
+    FLYOVER         = 6
+# End class BridgeMode
+
+    # Convert an IPv4 address (a string like "192.168.0.2", or an int) to
+    # an int, and back.  Raises ValueError if it isn't a valid address.
+
+def _ipToInt(ip):
+    return int(ipaddress.IPv4Address(ip))
+
+def _intToIp(n:int):
+    return str(ipaddress.IPv4Address(n))
+
+    # Convert a MAC address string (hex octets separated by ':' or '-') to
+    # an int, and back.  Raises ValueError if it isn't a 48-bit hex number.  The
+    # string form we give back is always six lower-case octets with colons.
+
+def _macToInt(mac):
+    if isinstance(mac, int):
+        return mac
+    n = int(mac.replace(':', '').replace('-', ''), 16)
+    if n >> 48:
+        raise ValueError("MAC address %s is longer than 48 bits" % mac)
+    return n
+
+def _intToMac(n:int):
+    return ':'.join(["%02x" % b for b in n.to_bytes(6, 'big')])
+
         #|===========================================================================
         #|
         #|      WiFi_Module                                 [public module class]
@@ -155,32 +205,36 @@ class BadBridgeMode(Exception): pass
         #|          .ipaddr : str
         #|
         #|              The module's IP address on the LAN, as a string, like
-        #|              "192.168.0.2".  The point of tracking this is so that
-        #|              (at least in principle) nodes don't have to identify
-        #|              themselves by their ID numbers every time - instead,
-        #|              we can just see which IP address a given message is
-        #|              coming from.  (However, at the moment we still expect
-        #|              nodes to provide their IDs anyway.)  This information
-        #|              is also useful for monitoring which nodes are online
-        #|              using the Wi-Fi router/access point's web interface.
+        #|              "192.168.0.2".  (Read-only; it's stored as an int in
+        #|              ._ip, and the string is made when you ask for it.)
+        #|              The point of tracking this is so that (at least in
+        #|              principle) nodes don't have to identify themselves by
+        #|              their ID numbers every time - instead, we can just
+        #|              see which IP address a given message is coming from.
+        #|              (However, at the moment we still expect nodes to
+        #|              provide their IDs anyway.)  This information is also
+        #|              useful for monitoring which nodes are online using
+        #|              the Wi-Fi router/access point's web interface.
         #|
         #|          .macaddr : str
         #|
-        #|              The module's MAC address, as a string, like "3e:af:
-        #|              2c:1d:08".  This can be considered a unique identity
-        #|              for a given Wi-Fi board.  If we remember this, it can
-        #|              be used to inform a node of its node ID even if the
-        #|              node itself has forgotten this information somehow.
+        #|              The module's MAC address, as a string, like
+        #|              "3e:af:2c:1d:08:7b".  (Read-only; stored as an int in
+        #|              ._mac.)  This can be considered a unique identity for
+        #|              a given Wi-Fi board.  If we remember this, it can be
+        #|              used to inform a node of its node ID even if the node
+        #|              itself has forgotten this information somehow.
         #|              (However, a protocol for doing this has not yet been
-        #|              defined.)  In this meantime, this is just an inter-
-        #|              esting piece of FYI information that can be compared
-        #|              with the Wi-Fi access point's reports of connected
-        #|              clients.
+        #|              defined.)  In this meantime, this is just an
+        #|              interesting piece of FYI information that can be
+        #|              compared with the Wi-Fi access point's reports of
+        #|              connected clients.
         #|
-        #|          .status:str
+        #|          .status : model.NodeStatus
         #|
         #|              The Wi-Fi module's primary status (as far as we know),
-        #|              one of these strings:
+        #|              one of these (the same enum SensorNode uses, so tests
+        #|              of it are just int/identity compares):
         #|
         #|                  UNSEEN     - We haven't heard from this node at all
         #|                              yet in the current server session.
@@ -256,10 +310,10 @@ class BadBridgeMode(Exception): pass
         #|              need to be in a common format so that we can parse
         #|              them without first knowing what kind of host it is.
         #|
-        #|          .bridge_mode : str
+        #|          .bridge_mode : BridgeMode
         #|
-        #|              This string may have any of several values denoting
-        #|              what bridging mode the Wi-Fi board is currently in.
+        #|              This may have any of several values denoting what
+        #|              bridging mode the Wi-Fi board is currently in.
         #|              The complete set of bridge modes (BM_*) are defined
         #|              near the top of $(COSMICI_DEVEL_ROOT)/Wi-Fi Script/
         #|              modules/network/bridges.uwi.  For our present
@@ -331,16 +385,57 @@ class BadBridgeMode(Exception): pass
         #|
         #|      PRIVATE DATA MEMBERS:
         #|
-        #|          ._wlock : threading.RLock
-        #|
-        #|              A reentrant mutex lock to serialize modifications
-        #|              to this structure.  Accessed internally by methods
-        #|              that make changes to the structure.
+        #|          ._ip : int, ._mac : int
+        #|
+        #|              The module's IP and MAC addresses as plain ints (or
+        #|              None until we know them), so that comparing or hashing
+        #|              them is just an int operation.  See .ipaddr & .macaddr.
+        #|
+        #|          ._scriptSend : callable
+        #|
+        #|              What .sendScript() sends lines with:  the .send() of
+        #|              whichever server (or the .sendOut() of the connection)
+        #|              is the best way to reach the Wi-Fi script right now.
+        #|              Kept up to date by ._routeScript().
+        #|
+        #|          ._wlock : threading.Lock
+        #|
+        #|              A mutex lock to serialize modifications to this
+        #|              structure.  Accessed internally by methods that
+        #|              make changes to the structure.  The methods that
+        #|              just set one attribute (.isAt(), .isOn(), .hasMac())
+        #|              don't take it, since a single attribute assignment
+        #|              is atomic anyway; that way they never have to wait
+        #|              while .turnedOnAt() is holding it to set up the
+        #|              bridge servers.  (.bridgeMode_is() does take it,
+        #|              since it changes .bridge_mode, the object's class,
+        #|              and ._scriptSend together.)  So it's only ever taken
+        #|              when the node turns on or changes its bridge mode,
+        #|              never for each message, and a plain threading lock
+        #|              is plenty fast for that.
+        #|                  It is NOT re-entrant:  nothing that's called
+        #|              while holding it (._setup*Server(), ._routeScript(),
+        #|              .isOn(), .isAt()) may take it again.
         #|
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
 class WiFi_Module:
 
+        # Give the data members above fixed slots, like SensorNode does, so
+        # the accesses to them on every send (.bridge_mode, .uartServer ...)
+        # skip the instance dict.  There's one of these per node, and nothing
+        # else hangs extra attributes on it.
+
+    __slots__ = ('node', 'nodenum', '_ip', '_mac', 'status', 'onAt', 'lastSeen',
+                 'mainConn', 'auxioServer', 'uartServer', 'bridge_mode', '_scriptSend',
+                 '_wlock')
+
+        # Base port numbers for our bridge servers; each node listens at these
+        # plus its node number.  (See ._setupAuxioServer(), ._setupUartServer().)
+
+    _AUXIO_BASE_PORT    = ports.LASER_PORT      # 52,737
+    _UART_BASE_PORT     = ports.MESON_PORT      # 63,766
+
         #|--------------------------------------------------------------------------------
         #|
         #|      WiFi_Module._UART_MsgHandler                    [private nested class]
@@ -359,23 +454,35 @@ class WiFi_Module:
 
     class _UART_MsgHandler(communicator.BaseMessageHandler):
 
+        __slots__ = ('wifi_module', '_host')
+
             #|-----------------------------------------------------------------------------------
             #|
             #|      WiFi_Module._UART_MsgHandler.__init__()         [special instance method]
             #|
             #|          Initializer for new instances of the UART message handler class.
             #|          Causes the new message handler to remember which Wi-Fi module
-            #|          it is serving, and what connection it is receiving messages on.
+            #|          it is serving.  The handler doesn't keep any per-connection
+            #|          state, so the UART connection handler (below) creates just one
+            #|          of these for its Wi-Fi module, and uses it for every connection;
+            #|          conn is normally None.
             #|
             #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
         def __init__(this, conn:Connection = None, wifi_module : WiFi_Module = None):
 
-            logger.info("Creating message handler for incoming UART bridge connection for node #%d..."
-                        % wifi_module.nodenum)
+            logger.info("Creating message handler for incoming UART bridge connections for node #%d...",
+                        wifi_module.nodenum)
 
             this.wifi_module = wifi_module
 
+                # Remember the model of the node's sensor host, so handle() doesn't have
+                # to look it up again for every line.  The node creates this object when
+                # it is created itself, and never replaces it; when we find out what kind
+                # of host it is, it just .become()s an instance of the right subclass.
+
+            this._host = wifi_module.node.sensor_host
+
             communicator.BaseMessageHandler.__init__(this, conn, name="Wi-Fi.UART")    # superclass initializer
             
         #<- End def WiFi_Module._UART_MsgHandler.__init__().
@@ -392,13 +499,27 @@ class WiFi_Module:
             #|          connection from a Wi-Fi board in a sensor node.  Namely, we
             #|          need to interpret them as messages relayed from the sensor host
             #|          (which they are) and respond to them accordingly.
+            #|              This is on the path of every line from every sensor
+            #|          host, so it's kept down to one direction test and one
+            #|          call.  The actual parsing (in SensorHost._parseMsg())
+            #|          is done with str's built-in strip(), partition() and
+            #|          split(), which already run in C; compiling this part
+            #|          as an extension module wouldn't buy enough to be worth
+            #|          adding a build step to the server.
             #|
             #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
             
-        def handle(this, msg : Message):
+        def handle(this, msg : Message, _DIR_IN=communicator.DIR_IN):
+
+                # This is called for every line relayed from the sensor host, so
+                # don't strip the line for the log unless someone's listening.
+                # (The lines themselves already arrive in bursts; the bridge's
+                # LineCommReqHandler takes in everything waiting on the socket
+                # with one recv() and splits it into lines in its own buffer.)
 
-            logger.debug("WiFi_Module._UART_MsgHandler.handle(): The Wi-Fi module relayed " +
-                         "the message [%s] from the sensor host to the server.", msg.data.strip())
+            if logger.isEnabledFor(logmaster.logging.DEBUG):
+                logger.debug("WiFi_Module._UART_MsgHandler.handle(): The Wi-Fi module relayed "
+                             "the message [%s] from the sensor host to the server.", msg.data.strip())
 
             # NOTE: We should probably add some code here to update the last-seen time
             # of this node.  (Or did we already do that in BridgeServer?)
@@ -414,8 +535,8 @@ class WiFi_Module:
                 # message, then dispatch it to the server's command handler together with
                 # appropriate identifying information (i.e., which node did it come from).
                 
-            if msg.dir == communicator.DIR_IN:      # Incoming message from node?
-                this.wifi_module.node.sensor_host.sentMessage(msg)
+            if msg.dir is _DIR_IN:                  # Incoming message from node?
+                this._host.sentMessage(msg)
                     # \
                     #  \_ Translation: The embedded host operating the sensor node
                     #       that the Wi-Fi module that this message handler is
@@ -465,15 +586,20 @@ class WiFi_Module:
             #|          to associate with the new message handler that we will create
             #|          to handle incoming messages sent over that connection.  Make
             #|          sense?
+            #|              Since the message handler doesn't depend on the connection,
+            #|          we create it right here, once, and then just attach it to each
+            #|          new connection.  (If the Wi-Fi link is flaky, the board may
+            #|          reconnect often.)
             #|
             #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
         
         def __init__(this, wifi_module : WiFi_Module = None):
             
-            logger.info("Creating connection handler for new UART bridge connections for node #%d..."
-                        % wifi_module.nodenum)
+            logger.info("Creating connection handler for new UART bridge connections for node #%d...",
+                        wifi_module.nodenum)
 
             this.wifi_module = wifi_module      # Remember what WiFi module this connection handler is serving
+            this.msgHandler = wifi_module._UART_MsgHandler(None, wifi_module)  # & the message handler we'll use for it.
 
         #<- End def WiFi_Module._UART_ConnHandler.__init__()
 
@@ -493,7 +619,7 @@ class WiFi_Module:
                 # message handler to it.  One that knows how to handle messages coming
                 # over the UART-bridge (that is, messages from the sensor host).
 
-            conn.addMsgHandler(this.wifi_module._UART_MsgHandler(conn, this.wifi_module))
+            conn.addMsgHandler(this.msgHandler)
             
         #<- End def WiFi_Module._UART_ConnHandler.handle().
             
@@ -525,7 +651,7 @@ class WiFi_Module:
     def __init__(this:WiFi_Module, node = None,
                  num:int = None, ip:str = None):
 
-        this._wlock = threading.RLock()     # Create our write lock.  Use a re-entrant lock, in case we need it.     
+        this._wlock = threading.Lock()      # Create our write lock.  (Nothing takes it while already holding it.)     
 
         with this._wlock:                   # Acquire the write lock.
 
@@ -533,88 +659,96 @@ class WiFi_Module:
             
             this.node           = node      # Remember our parent object (node).
             this.nodenum        = num       # Remember our node's ID #.
-            this.ipaddr         = ip        # Remember our IP address.
-            this.macaddr        = None      # We won't know the module's MAC address until the POWERED_UP message is seen.
-            this.status         = 'UNSEEN'  # Mark node as 'unseen' until we definitely hear from it.
+            this._ip            = None      # We'll remember our IP address (below).
+            this._mac           = None      # We won't know the module's MAC address until the POWERED_UP message is seen.
+            this.status         = model.NodeStatus.UNSEEN   # Mark node as 'unseen' until we definitely hear from it.
+            this.onAt           = None      # We don't know when it turned on until .turnedOnAt() is called.
+            this.lastSeen       = None      # Likewise for when we last saw it.
             this.mainConn       = None      # Will be reassigned shortly if node is connected...
             this.auxioServer    = None      # This won't be created until we get the POWERED_UP message.
             this.uartServer     = None      # Likewise for this guy.
-            this.bridge_mode    = 'UNKNOWN' # We have no idea yet what the module's bridging mode is.
+            this.bridge_mode    = BridgeMode.UNKNOWN    # We have no idea yet what the module's bridging mode is.
+            this._routeScript()             # (No way to reach the script yet.)
+
+            if ip is not None:
+                this.isAt(ip)               # Remember our IP address.
             
         #<- End with this._wlock
             
     #<- End def __init__()
 
-        # Methods to query whether various communication streams to the node's
-        # Wi-Fi module are currently connected.  Currently, we just assume that
-        # if the corresponding attribute is non-null, then that connection is
-        # still up and running.  This may be a bad assumption if a connection
-        # gets interrupted somehow, so this probably should be made more soph-
-        # isticated in the future.  (For example, certain exceptions when trying
-        # to send data to a connection can trigger the model to mark that con-
-        # nection as no longer available.)
-
-    def _uartSrvConnected(this):    # Return True iff the .uartServer connection from this node's Wi-Fi module is active.
-        
-        return  this.uartServer != None         # If initialized, assume connection's still good.
-
-    def _auxioSrvConnected(this):   # Return True iff the .auxioServer connection from this node's Wi-Fi module is active.
-        
-        return  this.auxioServer != None        # If initialized, assume connection's still good.
-
-    def _mainSrvConnected(this):    # Return True iff the .mainConn connection from this node's Wi-Fi module is connected.
-        
-        return  this.mainConn != None           # If initialized, assume connection's still good.
-
-        # Methods to send lines along various communication streams to the node's Wi-Fi module.
+        # Methods to send lines along various communication streams to the node's
+        # Wi-Fi module.  Each reads the connection attribute just once, and then
+        # uses what it read.  Currently, we just assume that if the attribute is
+        # non-null, then that connection is still up and running.  This may be a
+        # bad assumption if a connection gets interrupted somehow, so this prob-
+        # ably should be made more sophisticated in the future.  (For example,
+        # certain exceptions when trying to send data to a connection can trigger
+        # the model to mark that connection as no longer available.)
 
     def sendTo_uartSrv(this, line:str):
 
-        if not this._uartSrvConnected():
-            logger.error(("WiFi_Module.sendTo_uartSrv(): Can't send the line [%s] via the " +
-                          "UART server because no connection from that node is open.") % line)
+        server = this.uartServer
+        if server is None:
+            logger.error("WiFi_Module.sendTo_uartSrv(): Can't send the line [%s] via the "
+                         "UART server because no connection from that node is open.", line)
             return
 
-        this.uartServer.send(line)
+        server.send(line)
 
     def sendTo_auxioSrv(this, line:str):
 
-        if not this._auxioSrvConnected():
-            logger.error(("WiFi_Module.sendTo_auxioSrv(): Can't send the line [%s] via the " +
-                          "AUXIO server because no connection from that node is open.") % line)
+        server = this.auxioServer
+        if server is None:
+            logger.error("WiFi_Module.sendTo_auxioSrv(): Can't send the line [%s] via the "
+                         "AUXIO server because no connection from that node is open.", line)
             return
         
-        this.auxioServer.send(line)    
+        server.send(line)    
 
     def sendTo_mainSrv(this, line:str):
 
-        if not this._mainSrvConnected():
-            logger.error(("WiFi_Module.sendTo_mainSrv(): Can't send the line [%s] via the " +
-                          "MAIN server because no connection from that node is open.") % line)
+        conn = this.mainConn
+        if conn is None:
+            logger.error("WiFi_Module.sendTo_mainSrv(): Can't send the line [%s] via the "
+                         "MAIN server because no connection from that node is open.", line)
             return
 
-        this.mainConn.sendOut(line)
+        conn.sendOut(line)
 
         # Send a given command line to the Wi-Fi module's controlling script.
+        # This is on the path of every line sent to a host in the DEFAULT and
+        # TREFOIL modes.  The best way to reach the script only changes when
+        # a bridge server gets set up or the bridge mode changes, so we pick
+        # it then (in ._routeScript(), below), and just remember the method
+        # to send with in ._scriptSend.
             
     def sendScript(this, line:str):
+        this._scriptSend(line)
 
-        if this.bridge_mode == 'TREFOIL' and this._uartSrvConnected():
-
-            this.sendTo_uartSrv(line)
-
-        elif this._auxioSrvConnected():
+        # Work out how .sendScript() should send lines from now on:  via
+        # the AUXIO bridge if we have it, else via the MAIN connection.  (The
+        # UART bridge reaches the script only in TREFOIL mode; the
+        # _WiFi_Trefoil subclass, below the class, overrides this to try it
+        # first.)  Must be called, holding ._wlock, whenever .auxioServer,
+        # .uartServer, .mainConn or the bridge mode changes.
 
-            this.sendTo_auxioSrv(line)
+    def _routeScript(this):
 
-        elif this._mainSrvConnected():
-
-            this.sendTo_mainSrv(line)
+        server = this.auxioServer
+        if server is not None:
+            this._scriptSend = server.send
+            return
 
+        conn = this.mainConn
+        if conn is not None:
+            this._scriptSend = conn.sendOut
         else:
-            logger.error(("WiFi_Module.sendScript(): Can't send the line [%s] to the " +
-                          "Wi-Fi script because there are no open connections to it.") %
-                         line)
+            this._scriptSend = this._sendScriptNoWay
+
+    def _sendScriptNoWay(this, line:str):
+        logger.error("WiFi_Module.sendScript(): Can't send the line [%s] to the "
+                     "Wi-Fi script because there are no open connections to it.", line)
 
         # Send a given command line to the Wi-Fi module's local sensor host.
         # We assume the line is already terminated with a newline character.
@@ -639,29 +773,46 @@ class WiFi_Module:
             #|
             #|       2c. Otherwise, send the line via the MAIN server connection
             #|             (.mainConn).
+            #|
+            #|  The choice between 1 and 2 isn't made here, but when the bridge
+            #|  mode changes:  .bridgeMode_is() switches this object to the
+            #|  subclass whose .sendHost() is the right one for the new mode (see
+            #|  _BM_CLASS, after the class).  In this base class, which is what
+            #|  we are in the UNKNOWN and UNSUPPORTED modes, there's no way to
+            #|  reach the host at all.
 
-        if this.bridge_mode in ['UART', 'FLYOVER'] and this._uartSrvConnected():
-
-                # send line directly via .uartServer (to implement)
-            this.sendTo_uartSrv(line)
+        this._sendHostNoWay(line)
 
-        elif this.bridge_mode in ['DEFAULT', 'TREFOIL', 'NONE']:
-                # - The Wi-Fi board could be in mode NONE if it is in the
-                #   middle of switching from DEFAULT mode to TREFOIL mode.
-        
-            line = "HOST " + line       # Package line into "HOST ..." command.
+        # Send the line directly via .uartServer (case 1 above).
 
-            this.sendScript(line)   # Send the packaged line to the Wi-Fi script.
-                # - This uses the best connection available to send the line.
+    def _sendHostDirect(this, line:str):
 
+        server = this.uartServer
+        if server is not None:
+            server.send(line)
         else:
-                # Somehow we got into a bridging mode like 'UNKNOWN',
-                # or 'UNSUPPORTED'.  Give up in despair.  Smarter here would be
-                # to instead send the Wi-Fi module a command to try to get it into
-                # a more appropriate bridging mode, and then try again.
-            
-            logger.error("WiFi_Module.sendHost():  I don't know any way to communicate " +
-                         "with the sensor host in the present briding mode.  Giving up.")
+            this._sendHostNoWay(line)
+
+        # Send the line via the Wi-Fi script (case 2 above).
+        # - The Wi-Fi board could be in mode NONE if it is in the
+        #   middle of switching from DEFAULT mode to TREFOIL mode.
+
+    def _sendHostViaScript(this, line:str):
+
+        line = "HOST " + line       # Package line into "HOST ..." command.
+
+        this.sendScript(line)   # Send the packaged line to the Wi-Fi script.
+            # - This uses the best connection available to send the line.
+
+        # Somehow we got into a bridging mode like 'UNKNOWN',
+        # or 'UNSUPPORTED'.  Give up in despair.  Smarter here would be
+        # to instead send the Wi-Fi module a command to try to get it into
+        # a more appropriate bridging mode, and then try again.
+
+    def _sendHostNoWay(this, line:str):
+
+        logger.error("WiFi_Module.sendHost():  I don't know any way to communicate "
+                     "with the sensor host in the present briding mode.  Giving up.")
 
     #<- End def WiFi_Module.sendHost().
         
@@ -687,11 +838,19 @@ class WiFi_Module:
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
         
     def isAt(this, ip):
-        with this._wlock:           # Temporarily obtain exclusive write access to the model.
-            this.ipaddr = ip            # Remember the new IP address for future reference.
-        #<- End with this._wlock
+        try:
+            this._ip = _ipToInt(ip)     # Remember the new IP address for future reference.  (Atomic; no lock needed.)
+        except ValueError:
+            logger.error("WiFi_Module.isAt(): [%s] is not a valid IP address; ignoring it.", ip)
     #<- End def isAt()
 
+        # The IP address as a displayable string (or None if we don't know it).
+
+    @property
+    def ipaddr(this):
+        ip = this._ip
+        return None if ip is None else _intToIp(ip)
+
 
         #|--------------------------------------------------------------------------------
         #|
@@ -709,8 +868,7 @@ class WiFi_Module:
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
     def isOn(this):
-        with this._wlock:
-            this.status = 'ON'
+        this.status = model.NodeStatus.ON   # Atomic; no lock needed.
 
         #|---------------------------------------------------------------------------------
         #|
@@ -729,11 +887,19 @@ class WiFi_Module:
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
 
     def hasMac(this, mac):        
-        with this._wlock:           # Temporarily obtain exclusive write access to the model.
-            this.macaddr = mac          # Remember the module's MAC address for future reference.
-        #<- End with this._wlock
+        try:
+            this._mac = _macToInt(mac)  # Remember the module's MAC address for future reference.  (Atomic; no lock needed.)
+        except ValueError:
+            logger.error("WiFi_Module.hasMac(): [%s] is not a valid MAC address; ignoring it.", mac)
     #<- End def hasMac()
 
+        # The MAC address as a displayable string (or None if we don't know it).
+
+    @property
+    def macaddr(this):
+        mac = this._mac
+        return None if mac is None else _intToMac(mac)
+
         #|--------------------------------------------------------------------------------
         #|
         #|      WiFi_Module.turnedOnAt()                        [public instance method]
@@ -746,20 +912,26 @@ class WiFi_Module:
 
     def turnedOnAt(this, when):
             # Make sure time is in displayable CoarseTimeStamp format.
-        if  not isinstance(when, timestamp.CoarseTimeStamp):
-            when = timestamp.CoarseTimeStamp(when)
+        when = timestamp.CoarseTimeStamp.coerce(when)
 
             # Thread-safely initialize various fields.
             
         with  this._wlock:       # Acquire our write lock.
             
-            this.isOn()                 # Mark node status as ON.
+            this.status     = model.NodeStatus.ON   # Mark node status as ON.  (Same as .isOn(), minus the call.)
             this.onAt       = when      # Record node's turn-on time.
             this.lastSeen   = when      # Which is also its last-seen time.
 
             logger.debug("Setting up our servers to listen to bridges from node %d..." % this.nodenum)
             
-            this._setupBridgeServers()   # Try setting up our bridge servers.
+            started = this._setupBridgeServers()    # Try setting up our bridge servers.
+
+            # Starting a server spins up its listener thread (and its terminal
+            # window), which takes a while; don't make anyone wait on our lock
+            # for that.  The servers are already in place, fully set up.
+
+        for server in started:
+            server.start()
                         
 
         #|----------------------------------------------------------------------------------
@@ -769,8 +941,8 @@ class WiFi_Module:
         #|          Calling this method informs our model of the Wi-Fi module
         #|          what bridging mode the module is currently in.  This info
         #|          is sent to us by the node is a BRIDGE_MODE message.  All
-        #|          that this method does is store the new mode string, which
-        #|          is required to be one of the following:
+        #|          that this method does is store the new mode, which may be
+        #|          given either as a BridgeMode or as its name, one of:
         #|
         #|                  'UNKNOWN'   -   The model doesn't yet know the bridge mode.
         #|
@@ -790,7 +962,7 @@ class WiFi_Module:
         #|                  'FLYOVER'   -   Corresponds to BM_FLYOVER.  Functionally identical
         #|                                      to UART mode, but faster.
         #|
-        #|          However, presently we do no error checking to enforce this.
+        #|          Any other name is logged as an error and stored as UNSUPPORTED.
         #|
         #|              The purpose of tracking the bridge mode is that is allows the
         #|          server to most intelligently send messages to the Wi-Fi script.
@@ -802,10 +974,21 @@ class WiFi_Module:
         #|
         #|vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
     
-    def bridgeMode_is(this, bmstr):
-        with this._wlock:
-            this.bridge_mode = bmstr
-            logger.normal("Node %d's bridge mode is now %s." % (this.nodenum, bmstr))
+    def bridgeMode_is(this, bm):
+        if isinstance(bm, str):
+            try:
+                bm = BridgeMode[bm]
+            except KeyError:
+                logger.error("WiFi_Module.bridgeMode_is(): Unknown bridge mode [%s]; "
+                             "treating it as UNSUPPORTED.", bm)
+                bm = BridgeMode.UNSUPPORTED
+        else:
+            bm = BridgeMode(bm)
+        with this._wlock:           # Keep the mode & the class that goes with it in step.
+            this.bridge_mode = bm
+            this.__class__ = _BM_CLASS[bm]
+            this._routeScript()     # The new mode may reach the script differently.
+        logger.normal("Node %d's bridge mode is now %s." % (this.nodenum, bm.name))
 
         #|---------------------------------------------------------------------------------------------
         #|
@@ -819,6 +1002,18 @@ class WiFi_Module:
         #|          raw text or data to arrive from node's AUXIO and UART
         #|          interfaces.
         #|
+        #|          Both servers have to be listening as soon as the node
+        #|          turns on, even if we never send anything down them:  it
+        #|          is the Wi-Fi script that opens these connections, right
+        #|          after it sends POWERED_ON, and the UART bridge is how
+        #|          everything from the sensor host reaches us.  So we can't
+        #|          put off creating them until we first have something to
+        #|          send.
+        #|
+        #|          Returns a list of the servers that were newly created,
+        #|          for the caller to .start() once it has let go of the
+        #|          write lock.
+        #|
         #|      CALLED BY:
         #|          WiFi_Module.turnedOnAt()
         #|
@@ -836,8 +1031,10 @@ class WiFi_Module:
 
         logger.debug("Setting up bridge servers for node %d..." % self.nodenum)
 
-        self._setupAuxioServer()    # Auxilliary I/O from Wi-Fi script, at port LASER+ (52,737+).
-        self._setupUartServer()     # Bridged connection from host's UART, port MESON+ (63,766+).
+        created = [self._setupAuxioServer(),    # Auxilliary I/O from Wi-Fi script, at port LASER+ (52,737+).
+                   self._setupUartServer()]     # Bridged connection from host's UART, port MESON+ (63,766+).
+
+        return [server for server in created if server is not None]
             
     #<-- End method SensorNode._setupBridgeServers().
 
@@ -845,8 +1042,10 @@ class WiFi_Module:
         #|
         #|      WiFi_Module._setupAuxioServer()             [private instance method]
         #|
-        #|          Creates & starts up the 'AUXIO' bridge server object that
+        #|          Creates & sets up the 'AUXIO' bridge server object that
         #|          will handle auxilliary I/O connections from this Wi-Fi board.
+        #|          The caller must already hold ._wlock.  Returns the new server
+        #|          (or None if we already had one); the caller must .start() it.
         #|
         #|      CALLED BY:
         #|          WiFi_Module._setupBridgeServers()
@@ -858,22 +1057,22 @@ class WiFi_Module:
             #|------------------------------------------------------------------------------
             #|  Setup the AUXIO server on the "LASER" (52,737) port number (plus node ID).
             
-        if (this.auxioServer == None):      # No auxio server yet?
+        if this.auxioServer is None:        # No auxio server yet?
 
-                # Calculate the port number that the new AUXIO server should listen at.
-            
-            base_auxio_port = ports.LASER_PORT
-            auxio_port = base_auxio_port + this.nodenum
-            
-            logger.normal("Starting AUXIO server for node %d on port %d..."
-                          % (this.nodenum, auxio_port))
+                # The server works out its own port number from the base port and
+                # our node number; we just report the one it came up with.
 
-            with this._wlock:            
-                this.auxioServer = bridge.BridgeServer(base_auxio_port, this.nodenum, "auxio")
+            server = bridge.BridgeServer(this._AUXIO_BASE_PORT, this.nodenum, "auxio")
+
+            logger.normal("Starting AUXIO server for node %d on port %d..."
+                          % (this.nodenum, server.port))
             
-            this.auxioServer.node = this.node    # Point the lil' guy back at mommy
-           
-            this.auxioServer.start()        # Go ahead and start up the newly created server.
+            server.node = this.node     # Point the lil' guy back at mommy
+
+            this.auxioServer = server   # Only now that it's all set up, let senders see it.
+            this._routeScript()
+
+            return server               # Caller will start it up.
             
         #<- End of case where there is no auxio server yet.
     #<- End def _setupAuxioServer 
@@ -882,8 +1081,10 @@ class WiFi_Module:
         #|
         #|      WiFi_Module._setupUartServer()             [private instance method]
         #|
-        #|          Creates & starts up the 'UART' bridge server object that
+        #|          Creates & sets up the 'UART' bridge server object that
         #|          will handle UART bridge connections from this Wi-Fi board.
+        #|          The caller must already hold ._wlock.  Returns the new server
+        #|          (or None if we already had one); the caller must .start() it.
         #|
         #|      CALLED BY:
         #|          WiFi_Module._setupBridgeServers()
@@ -895,18 +1096,14 @@ class WiFi_Module:
             #|------------------------------------------------------------------------------
             #|  Setup the UART server on the "MESON" (63,766) port number (plus node ID).
             
-        if (this.uartServer == None):       # No uart server yet?
-            
-            base_uart_port = ports.MESON_PORT
-            uart_port = base_uart_port + this.nodenum
+        if this.uartServer is None:         # No uart server yet?
             
+            server = bridge.BridgeServer(this._UART_BASE_PORT, this.nodenum, "uart")
+
             logger.normal("Starting UART server for node %d on port %d..."
-                          % (this.nodenum, uart_port))
+                          % (this.nodenum, server.port))
             
-            with this._wlock:            
-                this.uartServer = bridge.BridgeServer(base_uart_port, this.nodenum, "uart")
-            
-            this.uartServer.node = this.node    # Point the lil' guy back at mommy
+            server.node = this.node     # Point the lil' guy back at mommy
 
                 # At this point, we need to add a message handler that will read lines
                 # from the node looking for a $NODE_TYPE message, and respond accordingly.
@@ -915,12 +1112,50 @@ class WiFi_Module:
                 # to add a connection handler that will add the message handler for us later
                 # (after the connection exists).
                 
-            this.uartServer.addConnHandler(this._UART_ConnHandler(this))
-            
-            this.uartServer.start()     # Go ahead and start up the newly created server.
+            server.addConnHandler(this._UART_ConnHandler(this))
+
+            this.uartServer = server    # Only now that it's all set up, let senders see it.
+            this._routeScript()
+
+            return server               # Caller will start it up.
             
         #<-- End if case where there is no uart server yet.
     #<- End def _setupUartServer
 
 # End class WiFi_Module
 
+        # Subclasses of WiFi_Module that .bridgeMode_is() switches an instance
+        # to, each having the one .sendHost() (& .sendScript()) path for the
+        # modes it's used in.  They add no data members, so they declare no
+        # slots of their own (an object can only change to a class with the
+        # same layout).
+
+class _WiFi_ViaScript(WiFi_Module):     # DEFAULT & NONE modes.
+    __slots__ = ()
+    sendHost = WiFi_Module._sendHostViaScript
+
+class _WiFi_Trefoil(_WiFi_ViaScript):   # TREFOIL mode; the script also listens on the UART bridge.
+    __slots__ = ()
+    def _routeScript(this):
+        server = this.uartServer
+        if server is not None:
+            this._scriptSend = server.send
+        else:
+            WiFi_Module._routeScript(this)
+
+class _WiFi_Direct(WiFi_Module):        # UART & FLYOVER modes.
+    __slots__ = ()
+    sendHost = WiFi_Module._sendHostDirect
+
+        # Which class a WiFi_Module should be in for each bridge mode, indexed by BridgeMode.
+
+_BM_CLASS = (
+    WiFi_Module,        # UNKNOWN
+    _WiFi_ViaScript,    # DEFAULT
+    _WiFi_ViaScript,    # NONE
+    WiFi_Module,        # UNSUPPORTED
+    _WiFi_Direct,       # UART
+    _WiFi_Trefoil,      # TREFOIL
+    _WiFi_Direct,       # FLYOVER
+    )
+
@@ -0,0 +1,70 @@
+# test_sensornet.py - Tests for the SensorNet/SensorNode object model (model.py).
+#
+#   Run from the server directory with:  python -m unittest discover -s tests
+
+import os
+import sys
+import logging
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import model
+import bridge
+
+
+    # Stands in for bridge.BridgeServer, so that turning a node on doesn't
+    # open listening sockets or terminal windows.
+
+class _FakeBridgeServer:
+    def __init__(self, basePort, nodeID, name):
+        self.port = basePort + nodeID
+    def addConnHandler(self, handler):
+        pass
+    def start(self):
+        pass
+    def send(self, line):
+        pass
+
+
+class NodeOnTest(unittest.TestCase):
+
+    def setUp(self):
+        self._realBridgeServer = bridge.BridgeServer
+        bridge.BridgeServer = _FakeBridgeServer
+        logging.disable(logging.CRITICAL)
+        self.net = model.SensorNet()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        bridge.BridgeServer = self._realBridgeServer
+
+    def test_fresh_node(self):
+        self.net.nodeOn(1, '192.168.0.11', '00:11:22:33:44:55', 0)
+        node = self.net.nodes[1]
+        self.assertEqual(node.macaddr, '00:11:22:33:44:55')
+        self.assertEqual(self.net.nodeWithMac('00-11-22-33-44-55'), 1)
+        self.assertIs(node.status, model.NodeStatus.ON)
+
+    def test_unseen_node_has_unset_fields(self):
+        self.net.nodeAt(2, '192.168.0.12')
+        node = self.net.nodes[2]
+        self.assertIsNone(node.macaddr)
+        self.assertIsNone(node.onAt)
+        self.assertIsNone(node.lastSeen)
+        str(self.net)                   # Reads .macaddr of every node.
+
+    def test_mac_moved_to_another_node(self):
+        self.net.nodeOn(1, '192.168.0.11', '00:11:22:33:44:55', 0)
+        self.net.nodeOn(2, '192.168.0.12', '00:11:22:33:44:55', 0)
+        self.assertEqual(self.net.nodeWithMac('00:11:22:33:44:55'), 2)
+        self.assertEqual(self.net.nodes[2].macaddr, '00:11:22:33:44:55')
+
+            # Node 1 gets a new module; its old MAC stays with node 2.
+
+        self.net.nodeOn(1, '192.168.0.11', '66:77:88:99:aa:bb', 0)
+        self.assertEqual(self.net.nodeWithMac('66:77:88:99:aa:bb'), 1)
+        self.assertEqual(self.net.nodeWithMac('00:11:22:33:44:55'), 2)
+
+if __name__ == '__main__':
+    unittest.main()
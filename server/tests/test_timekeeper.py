@@ -0,0 +1,123 @@
+# test_timekeeper.py - Tests for the time-data archive (timekeeper.py).
+#
+#   Run from the server directory with:  python -m unittest discover -s tests
+
+import os
+import sys
+import random
+import logging
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import timekeeper
+
+
+class DoDCodecTest(unittest.TestCase):
+
+    def assertRoundTrips(self, values):
+        self.assertEqual(timekeeper._unpackDoD(timekeeper._packDoD(values)), values)
+
+    def test_edge_cases(self):
+        self.assertRoundTrips([])
+        self.assertRoundTrips([0])
+        self.assertRoundTrips([-1])
+        self.assertRoundTrips([-2**63, 2**63 - 1, -2**63, 0, 2**63 - 1])
+
+    def test_random_int64_sequences(self):
+        rng = random.Random(12345)
+        for _ in range(200):
+            n = rng.randrange(1, 300)
+            self.assertRoundTrips([rng.randrange(-2**63, 2**63) for _ in range(n)])
+
+    def test_steady_steps_pack_small(self):
+        values = [750000000*i + 42 for i in range(1000)]
+        self.assertRoundTrips(values)
+        self.assertLess(len(timekeeper._packDoD(values)), 1100)     # ~1 byte per value.
+
+
+class ArchiveTest(unittest.TestCase):
+
+    N_EDGES = 6000
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.tk = timekeeper.Timekeeper(dbFilename=os.path.join(self.tmpdir.name, 'test.db'))
+
+    def tearDown(self):
+        self.tk.close()
+        self.tk.join(10)
+        self.tmpdir.cleanup()
+        logging.disable(logging.NOTSET)
+
+        # Record N_EDGES edges a second apart (with a little jitter) from
+        # each of two nodes, and return them as (ts, node, pps_num, counter)
+        # tuples in time order.  The times are whole microseconds, since
+        # that's what the blocks keep.
+
+    def recordEdges(self):
+        rng = random.Random(54321)
+        t0 = 1330000000.0
+        edges = []
+        for i in range(self.N_EDGES):
+            for node in (0, 1):
+                us = round((t0 + i)*1e6) + rng.randrange(-500, 500) + node*1000
+                ts = us/1e6
+                counter = 2**40 + 750000000*i + rng.randrange(-20, 20) + node*7
+                edges.append((ts, node, i, counter))
+                self.tk.ppsEdge(node, i, counter, ts)
+        edges.sort()
+        return edges
+
+        # What minutesBetween() should return for the given edges.
+
+    @staticmethod
+    def summarize(edges):
+        byMinute = {}
+        for (ts, node, pps_num, counter) in edges:
+            byMinute.setdefault((int(ts/60)*60, node), []).append(counter)
+        return [(m, node, len(cs), sum(cs)/len(cs), min(cs), max(cs))
+                for ((m, node), cs) in sorted(byMinute.items())]
+
+    def test_edges_survive_archiving(self):
+        edges = self.recordEdges()
+        (t0, t1) = (edges[0][0], edges[-1][0] + 1)
+        expected = self.summarize(edges)
+
+            # Recording that many edges already archived all but the last
+            # hour; now pack the rest too, so everything is in blocks.
+
+        self.tk.getResult(lambda: self.tk._archiveBefore(t1 + 60))
+        nRaw = self.tk.getResult(
+            lambda: self.tk._db.execute("SELECT count(*) FROM pps_edges").fetchone()[0])
+        self.assertEqual(nRaw, 0)
+
+        self.assertEqual(self.tk.edgesBetween(t0, t1), edges)
+
+        mid = edges[len(edges)//2][0]
+        self.assertEqual(self.tk.edgesBetween(mid, t1), [e for e in edges if e[0] >= mid])
+
+        minutes = self.tk.minutesBetween(t0, t1)
+        self.assertEqual([m[:3] + m[4:] for m in minutes], [m[:3] + m[4:] for m in expected])
+        for (got, want) in zip(minutes, expected):
+            self.assertAlmostEqual(got[3], want[3], delta=1e-6*abs(want[3]))
+
+    def test_partly_archived(self):
+        edges = self.recordEdges()
+        (t0, t1) = (edges[0][0], edges[-1][0] + 1)
+
+            # Only the automatic archiving has happened, so the last hour
+            # or so is still in plain rows; queries must cover both.
+
+        nRaw = self.tk.getResult(
+            lambda: self.tk._db.execute("SELECT count(*) FROM pps_edges").fetchone()[0])
+        self.assertGreater(nRaw, 0)
+        self.assertLess(nRaw, len(edges))
+        self.assertEqual(self.tk.edgesBetween(t0, t1), edges)
+        self.assertEqual(len(self.tk.minutesBetween(t0, t1)), len(self.summarize(edges)))
+
+
+if __name__ == '__main__':
+    unittest.main()